@@ -1,13 +1,27 @@
+from Scripts.Modules.Analysis.dice_pool import (
+    face_count_distributions,
+    probability_at_least,
+    success_count_distribution,
+    sum_distribution,
+)
 from Scripts.Modules.Analysis.reporting import (
     DiceAnalysisReport,
+    ReportAccumulator,
     analyze_results,
+    analyze_roll_columns,
     build_summary_lines,
     write_report,
 )
 
 __all__ = [
     'DiceAnalysisReport',
+    'ReportAccumulator',
     'analyze_results',
+    'analyze_roll_columns',
     'build_summary_lines',
+    'face_count_distributions',
+    'probability_at_least',
+    'success_count_distribution',
+    'sum_distribution',
     'write_report',
 ]
\ No newline at end of file
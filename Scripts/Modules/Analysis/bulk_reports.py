@@ -0,0 +1,140 @@
+"""
+Regenerate every die's results.html from its columnar rolls in a process pool.
+
+    python -m Scripts.Modules.Analysis.bulk_reports REPORT_DIR [--workers N] [--force]
+
+Each report directory also gets a results.fingerprint file recording the inputs the
+report was rendered from. Dice whose fingerprint is unchanged are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+import time
+
+from Scripts.Modules.Analysis.reporting import (
+    REPORT_TEMPLATE_VERSION,
+    analyze_roll_columns,
+    write_report,
+    write_text_atomic,
+)
+from Scripts.Modules.Database.database import DBManager, DBPath
+
+FINGERPRINT_FILENAME = 'results.fingerprint'
+DEFAULT_DICE_SIDES = 6
+
+
+@dataclass(frozen=True)
+class BulkReportResult:
+    rendered: tuple[str, ...]
+    skipped: tuple[str, ...]
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def report_fingerprint(roll_count: int, max_roll_id: int, dice_sides: int | None) -> str:
+    return f'rolls={roll_count};max_roll_id={max_roll_id};sides={dice_sides};template={REPORT_TEMPLATE_VERSION}'
+
+
+def _read_fingerprint(report_dir: Path) -> str | None:
+    try:
+        return (report_dir / FINGERPRINT_FILENAME).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+
+
+def _render_die_report(db_path: Path, dice_id: str, dice_sides: int, report_dir: Path, fingerprint: str) -> str:
+    """Pool worker: render one die's report from its roll columns and record its fingerprint."""
+    db = DBManager(db_path=db_path, use_writer_service=False)
+    columns = db.read_columns_for_die(dice_id)
+    if columns is None or not len(columns):
+        raise ValueError(f"No results found for dice ID '{dice_id}'")
+
+    # The drift chart needs the ordered history, which the die_stats aggregates do not keep.
+    report = analyze_roll_columns(dice_id, columns.faces, columns.timestamps_us, dice_sides)
+    report_path = write_report(report, report_dir)
+    # Written last, so an interrupted render is retried on the next run.
+    write_text_atomic(report_dir / FINGERPRINT_FILENAME, fingerprint + '\n')
+    return str(report_path)
+
+
+def regenerate_reports(
+    output_dir: Path,
+    db_path: Path = DBPath,
+    dice_ids: list[str] | None = None,
+    workers: int | None = None,
+    force: bool = False,
+) -> BulkReportResult:
+    """Render results.html for every die (or only dice_ids) whose inputs changed.
+
+    With workers=1 the reports are rendered in this process; otherwise a process pool
+    of that many workers (default: one per CPU) shares the dice.
+    """
+    inputs = DBManager(db_path=db_path).read_report_inputs()
+    if dice_ids is not None:
+        inputs = {dice_id: inputs[dice_id] for dice_id in dice_ids if dice_id in inputs}
+
+    jobs = []
+    skipped = []
+    for dice_id, (roll_count, max_roll_id, dice_sides) in sorted(inputs.items()):
+        report_dir = Path(output_dir) / dice_id
+        fingerprint = report_fingerprint(roll_count, max_roll_id, dice_sides)
+        if not force and _read_fingerprint(report_dir) == fingerprint:
+            skipped.append(dice_id)
+            continue
+        jobs.append((Path(db_path), dice_id, dice_sides or DEFAULT_DICE_SIDES, report_dir, fingerprint))
+
+    rendered = []
+    failed = {}
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                _render_die_report(*job)
+            except Exception as error:
+                failed[job[1]] = str(error)
+            else:
+                rendered.append(job[1])
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_render_die_report, *job): job[1] for job in jobs}
+            for future in as_completed(futures):
+                dice_id = futures[future]
+                try:
+                    future.result()
+                except Exception as error:
+                    failed[dice_id] = str(error)
+                else:
+                    rendered.append(dice_id)
+
+    return BulkReportResult(rendered=tuple(sorted(rendered)), skipped=tuple(skipped), failed=failed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate every die's HTML analysis report.")
+    parser.add_argument('output_dir', type=Path, help='Report root; each die renders into a subfolder named after it.')
+    parser.add_argument('--db-path', type=Path, default=DBPath, help='Database file to read results from.')
+    parser.add_argument('--dice-id', action='append', dest='dice_ids', help='Only render this die; repeatable.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU).')
+    parser.add_argument('--force', action='store_true', help='Render even when the fingerprint is unchanged.')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = regenerate_reports(
+        args.output_dir,
+        db_path=args.db_path,
+        dice_ids=args.dice_ids,
+        workers=args.workers,
+        force=args.force,
+    )
+    print(
+        f'Rendered {len(result.rendered)} report(s), skipped {len(result.skipped)} unchanged '
+        f'in {time.perf_counter() - started:.2f} s'
+    )
+    for dice_id, error in sorted(result.failed.items()):
+        print(f'  Failed {dice_id}: {error}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,21 +2,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from html import escape
-from itertools import combinations
-from math import log2
+from itertools import chain, combinations, islice
+from math import comb, log2
 from pathlib import Path
 import argparse
-import sqlite3
 
-from Scripts.Modules.Analysis.reporting import analyze_results
-from Scripts.Modules.Database.database import DBPath
+import numpy as np
+
+from Scripts.Modules.Analysis.reporting import chi_square_p_values
+from Scripts.Modules.Analysis.subset_search import OBJECTIVE_CHI_SQUARE, search_subsets
+from Scripts.Modules.Database.database import DBManager, DBPath, DieStats, FaceCountMatrix
 
 
 YAHTZEE_PREFIX = 'six_sided_yahtzee_'
+YAHTZEE_GROUP = 'six_sided_yahtzee'
 DEFAULT_MARKDOWN_OUTPUT_PATH = Path('Scripts/Modules/Database/Captures/yahtzee_comparison_report.md')
 DEFAULT_HTML_OUTPUT_PATH = Path('Scripts/Modules/Database/Captures/yahtzee_comparison_dashboard.html')
 EXPECTED_REPEAT_RATE = 1.0 / 6.0
 IDEAL_ENTROPY_BITS = log2(6)
+DICE_SIDES = 6
+DEFAULT_GROUP_SIZE = 5
+# Combinations scored per vectorized batch when ranking groups.
+GROUP_SCORE_CHUNK = 65536
+# Above this many combinations, only the best groups are searched for instead of ranking them all.
+FULL_GROUP_RANKING_LIMIT = 100_000
+# Best groups kept when searching; the reports show at most this many.
+SEARCHED_GROUP_COUNT = 10
+_COUNT_WORDS = ('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight', 'nine', 'ten', 'eleven', 'twelve')
 
 
 @dataclass(frozen=True)
@@ -31,10 +43,11 @@ class DieMetrics:
     entropy_gap_bits: float
     mean_roll: float
     mean_delta: float
-    repeat_rate: float
-    repeat_delta: float
-    longest_streak_value: int
-    longest_streak_length: int
+    # Sequence metrics; None for pooled groups, whose rolls do not form one sequence.
+    repeat_rate: float | None
+    repeat_delta: float | None
+    longest_streak_value: int | None
+    longest_streak_length: int | None
     counts: tuple[int, ...]
     deviations: tuple[float, ...]
     most_overrepresented_face: int
@@ -54,108 +67,202 @@ class GroupMetrics:
 @dataclass(frozen=True)
 class ComparisonSummary:
     ranked_dice: tuple[DieMetrics, ...]
+    # Best groups by pooled chi-square, at most SEARCHED_GROUP_COUNT of them.
     ranked_groups: tuple[GroupMetrics, ...]
     all_dice: DieMetrics
-
-
-def _load_rows(db_path: Path, dice_prefix: str) -> dict[str, list[dict]]:
-    connection = sqlite3.connect(db_path)
-    connection.row_factory = sqlite3.Row
-    try:
-        rows = connection.execute(
-            '''
-            SELECT dice_id, timestamp, dice_sides, dice_result, image
-            FROM test_results
-            WHERE dice_id LIKE ?
-            ORDER BY dice_id, timestamp
-            ''',
-            (f'{dice_prefix}%',),
-        ).fetchall()
-    finally:
-        connection.close()
-
-    by_die: dict[str, list[dict]] = {}
-    for row in rows:
-        by_die.setdefault(str(row['dice_id']), []).append(dict(row))
-    return by_die
-
-
-def _compute_metrics(dice_id: str, rows: list[dict]) -> DieMetrics:
-    report = analyze_results(dice_id=dice_id, rows=rows, dice_sides=6)
-    counts_by_face = {frequency.face: frequency.count for frequency in report.frequencies}
-    probabilities = {face: counts_by_face[face] / report.sample_count for face in range(1, 7)}
-    deviations = {face: probabilities[face] - (1.0 / 6.0) for face in range(1, 7)}
-    repeated_pairs = sum(
-        1 for previous, current in zip(report.ordered_rolls, report.ordered_rolls[1:]) if previous == current
-    )
-    repeat_rate = repeated_pairs / (report.sample_count - 1)
-    entropy_bits = -sum(probability * log2(probability) for probability in probabilities.values() if probability > 0.0)
+    worst_group: GroupMetrics
+    best_individual_group: GroupMetrics
+    group_count: int
+    group_size: int = DEFAULT_GROUP_SIZE
+    # True when the groups were found by branch-and-bound rather than by scoring every combination.
+    groups_searched: bool = False
+
+
+def _load_counts(db_path: Path, dice_group: str) -> tuple[FaceCountMatrix, dict[str, DieStats]]:
+    """Read the group's face-count matrix and per-die aggregates; no rolls are loaded."""
+    db = DBManager(db_path=db_path)
+    return db.read_count_matrix(dice_group=dice_group, faces=DICE_SIDES), db.read_die_stats_for_group(dice_group)
+
+
+def _score_counts(counts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (chi_square, tvd, entropy_gap_bits) for each row of a (..., 6) face-count array."""
+    counts = np.asarray(counts, dtype=np.float64)
+    totals = counts.sum(axis=-1, keepdims=True)
+    expected = totals / DICE_SIDES
+    chi_square = (((counts - expected) ** 2) / expected).sum(axis=-1)
+    probabilities = counts / totals
+    tvd = 0.5 * np.abs(probabilities - 1.0 / DICE_SIDES).sum(axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plogp = np.where(probabilities > 0.0, probabilities * np.log2(probabilities), 0.0)
+    return chi_square, tvd, IDEAL_ENTROPY_BITS + plogp.sum(axis=-1)
+
+
+def _metrics_from_counts(dice_id: str, counts, p_value: float | None = None, stats: DieStats | None = None) -> DieMetrics:
+    """Build DieMetrics from a face-count vector; stats supplies sequence metrics for a single die."""
+    counts = np.asarray(counts, dtype=np.int64)
+    sample_count = int(counts.sum())
+    chi_square, tvd, entropy_gap_bits = (float(value) for value in _score_counts(counts))
+    if p_value is None:
+        p_value = float(chi_square_p_values(chi_square, DICE_SIDES - 1))
+    deviations = {face: counts[face - 1] / sample_count - (1.0 / DICE_SIDES) for face in range(1, DICE_SIDES + 1)}
+    mean_roll = float(np.dot(counts, np.arange(1, DICE_SIDES + 1))) / sample_count
     most_overrepresented_face = max(deviations, key=deviations.get)
     most_underrepresented_face = min(deviations, key=deviations.get)
+    repeat_rate = None if stats is None else stats.repeat_pairs / (stats.roll_count - 1)
 
     return DieMetrics(
         dice_id=dice_id,
-        sample_count=report.sample_count,
-        chi_square=report.chi_square_statistic,
-        p_value=report.p_value,
-        tvd=0.5 * sum(abs(deviation) for deviation in deviations.values()),
+        sample_count=sample_count,
+        chi_square=chi_square,
+        p_value=p_value,
+        tvd=tvd,
         max_abs_deviation=max(abs(deviation) for deviation in deviations.values()),
-        entropy_bits=entropy_bits,
-        entropy_gap_bits=IDEAL_ENTROPY_BITS - entropy_bits,
-        mean_roll=report.mean_roll,
-        mean_delta=report.mean_roll - report.expected_mean_roll,
+        entropy_bits=IDEAL_ENTROPY_BITS - entropy_gap_bits,
+        entropy_gap_bits=entropy_gap_bits,
+        mean_roll=mean_roll,
+        mean_delta=mean_roll - (DICE_SIDES + 1) / 2,
         repeat_rate=repeat_rate,
-        repeat_delta=repeat_rate - EXPECTED_REPEAT_RATE,
-        longest_streak_value=report.longest_streak_value,
-        longest_streak_length=report.longest_streak_length,
-        counts=tuple(counts_by_face[face] for face in range(1, 7)),
-        deviations=tuple(deviations[face] for face in range(1, 7)),
+        repeat_delta=None if repeat_rate is None else repeat_rate - EXPECTED_REPEAT_RATE,
+        longest_streak_value=None if stats is None else stats.longest_streak_value,
+        longest_streak_length=None if stats is None else stats.longest_streak_length,
+        counts=tuple(int(count) for count in counts),
+        deviations=tuple(float(deviations[face]) for face in range(1, DICE_SIDES + 1)),
         most_overrepresented_face=most_overrepresented_face,
-        most_overrepresented_delta=deviations[most_overrepresented_face],
+        most_overrepresented_delta=float(deviations[most_overrepresented_face]),
         most_underrepresented_face=most_underrepresented_face,
-        most_underrepresented_delta=deviations[most_underrepresented_face],
+        most_underrepresented_delta=float(deviations[most_underrepresented_face]),
     )
 
 
-def _rank_dice(rows_by_die: dict[str, list[dict]]) -> list[DieMetrics]:
-    metrics = [_compute_metrics(dice_id, rows) for dice_id, rows in sorted(rows_by_die.items())]
-    return sorted(metrics, key=lambda item: (item.chi_square, item.tvd, item.entropy_gap_bits))
+def _iter_combination_chunks(dice_count: int, group_size: int, chunk_size: int = GROUP_SCORE_CHUNK):
+    """Yield every group_size-combination of range(dice_count), in lexicographic order, as index blocks."""
+    remaining = combinations(range(dice_count), group_size)
+    while True:
+        block = np.fromiter(chain.from_iterable(islice(remaining, chunk_size)), dtype=np.int64)
+        if not block.size:
+            return
+        yield block.reshape(-1, group_size)
 
 
-def _rank_groups(rows_by_die: dict[str, list[dict]], ranked_dice: list[DieMetrics]) -> list[GroupMetrics]:
-    metrics_by_die = {item.dice_id: item for item in ranked_dice}
-    groups: list[GroupMetrics] = []
+def _rank_dice(count_matrix: FaceCountMatrix, stats_by_die: dict[str, DieStats]) -> list[DieMetrics]:
+    metrics = [
+        _metrics_from_counts(dice_id, counts, stats=stats_by_die[dice_id])
+        for dice_id, counts in zip(count_matrix.dice_ids, count_matrix.counts)
+    ]
+    return sorted(metrics, key=lambda item: (item.chi_square, item.tvd, item.entropy_gap_bits))
 
-    for combo in combinations(sorted(rows_by_die), 5):
-        pooled_rows: list[dict] = []
-        for dice_id in combo:
-            pooled_rows.extend(rows_by_die[dice_id])
 
-        pooled_metrics = _compute_metrics('+'.join(combo), pooled_rows)
+def _rank_groups(
+    count_matrix: FaceCountMatrix,
+    ranked_dice: list[DieMetrics],
+    group_size: int = DEFAULT_GROUP_SIZE,
+    top_k: int = SEARCHED_GROUP_COUNT,
+) -> tuple[list[GroupMetrics], GroupMetrics, GroupMetrics]:
+    """Score every group_size-combination and return the top_k groups, the worst group, and the top-individuals group.
+
+    Pooled counts are sums of per-die rows of the count matrix, so each chunk of
+    combinations is scored with a handful of array operations and no rolls are read.
+    GroupMetrics are only built for the groups returned.
+    """
+    dice_ids = list(count_matrix.dice_ids)
+    if not 1 <= group_size <= len(dice_ids):
+        raise ValueError(f'group_size must be between 1 and {len(dice_ids)}, got {group_size}')
+
+    counts = count_matrix.counts
+    combo_blocks = []
+    score_blocks = []
+    for combos in _iter_combination_chunks(len(dice_ids), group_size):
+        combo_blocks.append(combos)
+        score_blocks.append(np.stack(_score_counts(counts[combos].sum(axis=1))))
+    all_combos = np.concatenate(combo_blocks)
+    chi_square, tvd, entropy_gap_bits = np.concatenate(score_blocks, axis=1)
+    # lexsort is stable and sorts by its last key first, matching a (chi_square, tvd, entropy_gap_bits) sort.
+    order = np.lexsort((entropy_gap_bits, tvd, chi_square))
+    top_individuals = sorted(dice_ids.index(item.dice_id) for item in ranked_dice[:group_size])
+    selected = np.concatenate([all_combos[order[:top_k]], all_combos[order[-1:]], np.array([top_individuals], dtype=np.int64)])
+
+    groups = _group_metrics(dice_ids, counts, ranked_dice, selected)
+    return groups[:-2], groups[-2], groups[-1]
+
+
+def _group_metrics(dice_ids: list[str], counts: np.ndarray, ranked_dice: list[DieMetrics], combos: np.ndarray) -> list[GroupMetrics]:
+    """Build GroupMetrics for each row of combos (positions into dice_ids and counts).
+
+    Every metric is computed for the whole block as arrays; the per-group loop only
+    packs the results into dataclasses.
+    """
+    metrics_by_die = {item.dice_id: item for item in ranked_dice}
+    individual_chi_square = np.array([metrics_by_die[dice_id].chi_square for dice_id in dice_ids])
+    individual_tvd = np.array([metrics_by_die[dice_id].tvd for dice_id in dice_ids])
+
+    pooled_counts = counts[combos].sum(axis=1)
+    sample_counts = pooled_counts.sum(axis=1)
+    chi_square, tvd, entropy_gap_bits = _score_counts(pooled_counts)
+    p_values = chi_square_p_values(chi_square, DICE_SIDES - 1)
+    deviations = pooled_counts / sample_counts[:, None] - 1.0 / DICE_SIDES
+    mean_roll = (pooled_counts @ np.arange(1, DICE_SIDES + 1)) / sample_counts
+    most_overrepresented = deviations.argmax(axis=1)
+    most_underrepresented = deviations.argmin(axis=1)
+    max_abs_deviation = np.abs(deviations).max(axis=1)
+    average_chi_square = individual_chi_square[combos].mean(axis=1)
+    average_tvd = individual_tvd[combos].mean(axis=1)
+    groups = []
+    for index, combo in enumerate(combos.tolist()):
+        combo_ids = tuple(dice_ids[position] for position in combo)
+        over = int(most_overrepresented[index])
+        under = int(most_underrepresented[index])
         groups.append(
             GroupMetrics(
-                dice_ids=combo,
-                pooled_metrics=pooled_metrics,
-                average_individual_chi_square=sum(metrics_by_die[dice_id].chi_square for dice_id in combo) / len(combo),
-                average_individual_tvd=sum(metrics_by_die[dice_id].tvd for dice_id in combo) / len(combo),
+                dice_ids=combo_ids,
+                pooled_metrics=DieMetrics(
+                    dice_id='+'.join(combo_ids),
+                    sample_count=int(sample_counts[index]),
+                    chi_square=float(chi_square[index]),
+                    p_value=float(p_values[index]),
+                    tvd=float(tvd[index]),
+                    max_abs_deviation=float(max_abs_deviation[index]),
+                    entropy_bits=float(IDEAL_ENTROPY_BITS - entropy_gap_bits[index]),
+                    entropy_gap_bits=float(entropy_gap_bits[index]),
+                    mean_roll=float(mean_roll[index]),
+                    mean_delta=float(mean_roll[index]) - (DICE_SIDES + 1) / 2,
+                    repeat_rate=None,
+                    repeat_delta=None,
+                    longest_streak_value=None,
+                    longest_streak_length=None,
+                    counts=tuple(pooled_counts[index].tolist()),
+                    deviations=tuple(deviations[index].tolist()),
+                    most_overrepresented_face=over + 1,
+                    most_overrepresented_delta=float(deviations[index, over]),
+                    most_underrepresented_face=under + 1,
+                    most_underrepresented_delta=float(deviations[index, under]),
+                ),
+                average_individual_chi_square=float(average_chi_square[index]),
+                average_individual_tvd=float(average_tvd[index]),
             )
         )
+    return groups
 
-    return sorted(
-        groups,
-        key=lambda item: (
-            item.pooled_metrics.chi_square,
-            item.pooled_metrics.tvd,
-            item.pooled_metrics.entropy_gap_bits,
-        ),
-    )
 
+def _search_groups(
+    count_matrix: FaceCountMatrix,
+    ranked_dice: list[DieMetrics],
+    group_size: int = DEFAULT_GROUP_SIZE,
+    top_k: int = SEARCHED_GROUP_COUNT,
+) -> tuple[list[GroupMetrics], GroupMetrics, GroupMetrics]:
+    """Find the top_k groups by pooled chi-square, the worst group, and the top-individuals group.
+
+    Uses branch-and-bound over the count matrix, so collections far too large to
+    enumerate still get the exact best and worst groups.
+    """
+    dice_ids = list(count_matrix.dice_ids)
+    counts = count_matrix.counts
+    best = search_subsets(counts, group_size, top_k=top_k, objective=OBJECTIVE_CHI_SQUARE)
+    worst = search_subsets(counts, group_size, top_k=1, objective=OBJECTIVE_CHI_SQUARE, largest=True)
+    top_individuals = sorted(dice_ids.index(item.dice_id) for item in ranked_dice[:group_size])
+    combos = np.array([item.indices for item in best] + [worst[0].indices, top_individuals], dtype=np.int64)
 
-def _pool_all_rows(rows_by_die: dict[str, list[dict]]) -> list[dict]:
-    pooled_rows: list[dict] = []
-    for rows in rows_by_die.values():
-        pooled_rows.extend(rows)
-    return pooled_rows
+    groups = _group_metrics(dice_ids, counts, ranked_dice, combos)
+    return groups[:-2], groups[-2], groups[-1]
 
 
 def _format_die_name(dice_id: str) -> str:
@@ -166,32 +273,76 @@ def _format_group(group: GroupMetrics) -> str:
     return ', '.join(_format_die_name(dice_id) for dice_id in group.dice_ids)
 
 
-def _build_summary() -> ComparisonSummary:
-    rows_by_die = _load_rows(DBPath, YAHTZEE_PREFIX)
-    if len(rows_by_die) != 10:
-        raise ValueError(f'Expected 10 Yahtzee dice, found {len(rows_by_die)}')
+def _build_summary(db_path: Path = DBPath, group_size: int = DEFAULT_GROUP_SIZE) -> ComparisonSummary:
+    count_matrix, stats_by_die = _load_counts(db_path, YAHTZEE_GROUP)
+    if len(count_matrix) < max(group_size, 1):
+        raise ValueError(f'Need at least {group_size} Yahtzee dice to rank groups of {group_size}, found {len(count_matrix)}')
 
-    ranked_dice = _rank_dice(rows_by_die)
-    ranked_groups = _rank_groups(rows_by_die, ranked_dice)
-    all_dice = _compute_metrics('all_yahtzee_dice', _pool_all_rows(rows_by_die))
+    # Dice and groups are scored straight from the count matrix, which is cheaper than a cache lookup.
+    ranked_dice = _rank_dice(count_matrix, stats_by_die)
+    all_dice = _metrics_from_counts('all_yahtzee_dice', count_matrix.counts.sum(axis=0))
+    group_count = comb(len(count_matrix), group_size)
+    groups_searched = group_count > FULL_GROUP_RANKING_LIMIT
+    find_groups = _search_groups if groups_searched else _rank_groups
+    best_groups, worst_group, best_individual_group = find_groups(count_matrix, ranked_dice, group_size)
     return ComparisonSummary(
         ranked_dice=tuple(ranked_dice),
-        ranked_groups=tuple(ranked_groups),
+        ranked_groups=tuple(best_groups),
         all_dice=all_dice,
+        worst_group=worst_group,
+        best_individual_group=best_individual_group,
+        group_count=group_count,
+        group_size=group_size,
+        groups_searched=groups_searched,
     )
 
 
+def _count_word(value: int) -> str:
+    return _COUNT_WORDS[value] if value < len(_COUNT_WORDS) else str(value)
+
+
+def _format_die_list(dice: tuple[DieMetrics, ...] | list[DieMetrics]) -> str:
+    return ' and '.join(f'`{_format_die_name(item.dice_id)}`' for item in dice)
+
+
+def _significance_line(significant_dice: tuple[DieMetrics, ...]) -> str:
+    if not significant_dice:
+        return '- No die crosses the common alpha=0.05 rejection threshold on its own.'
+    if len(significant_dice) == 1:
+        die = significant_dice[0]
+        return f'- Only one die crosses the common alpha=0.05 rejection threshold on its own: `{_format_die_name(die.dice_id)}` (p-value {die.p_value:.3f}).'
+    details = ', '.join(f'`{_format_die_name(item.dice_id)}` (p-value {item.p_value:.3f})' for item in significant_dice)
+    return f'- {_count_word(len(significant_dice)).capitalize()} dice cross the common alpha=0.05 rejection threshold on their own: {details}.'
+
+
+def _complementary_dice_lines(complementary_dice: tuple[DieMetrics, ...], replaced_dice: tuple[DieMetrics, ...], group_word: str) -> list[str]:
+    if not complementary_dice:
+        return []
+    single = len(complementary_dice) == 1
+    return [
+        f'- The best pooled group includes {_format_die_list(complementary_dice)} even though '
+        f'{"it ranks" if single else "they rank"} outside the individual top {group_word}. '
+        f'{"Its" if single else "Their"} biases complement the top dice better than {_format_die_list(replaced_dice)} '
+        f'{"does" if len(replaced_dice) == 1 else "do"}.'
+    ]
+
+
 def _summary_highlights(summary: ComparisonSummary) -> dict[str, DieMetrics | GroupMetrics | tuple[str, ...] | float]:
     ranked_dice = summary.ranked_dice
     ranked_groups = summary.ranked_groups
-    best_individual_five = tuple(item.dice_id for item in ranked_dice[:5])
+    best_individual_dice = tuple(item.dice_id for item in ranked_dice[:summary.group_size])
     best_pooled_group = ranked_groups[0]
-    best_individual_group = next(group for group in ranked_groups if group.dice_ids == tuple(sorted(best_individual_five)))
-    worst_pooled_group = ranked_groups[-1]
+    best_individual_group = summary.best_individual_group
+    worst_pooled_group = summary.worst_group
 
-    chi_reduction = 1.0 - (best_pooled_group.pooled_metrics.chi_square / best_individual_group.pooled_metrics.chi_square)
+    individual_chi_square = best_individual_group.pooled_metrics.chi_square
+    chi_reduction = 1.0 - (best_pooled_group.pooled_metrics.chi_square / individual_chi_square) if individual_chi_square else 0.0
     return {
-        'best_individual_five': best_individual_five,
+        'best_individual_dice': best_individual_dice,
+        # Dice the best pooled group swaps in from outside the individual top picks, and the ones they replace.
+        'complementary_dice': tuple(item for item in ranked_dice if item.dice_id in best_pooled_group.dice_ids and item.dice_id not in best_individual_dice),
+        'replaced_dice': tuple(item for item in ranked_dice if item.dice_id in best_individual_dice and item.dice_id not in best_pooled_group.dice_ids),
+        'significant_dice': tuple(item for item in ranked_dice if item.p_value < 0.05),
         'best_pooled_group': best_pooled_group,
         'best_individual_group': best_individual_group,
         'worst_pooled_group': worst_pooled_group,
@@ -221,11 +372,14 @@ def _render_markdown_report(summary: ComparisonSummary) -> str:
     highest_repeat_die = highlights['highest_repeat_die']
     longest_streak_die = highlights['longest_streak_die']
     chi_reduction = highlights['chi_reduction']
+    group_size = summary.group_size
+    group_word = _count_word(group_size)
+    dice_word = _count_word(len(ranked_dice))
 
     lines = [
         '# Yahtzee Dice Comparison Report',
         '',
-        'This report compares the ten `six_sided_yahtzee_*` dice stored in the project database and ranks them by how close their observed face distribution is to a fair d6.',
+        f'This report compares the {dice_word} `six_sided_yahtzee_*` dice stored in the project database and ranks them by how close their observed face distribution is to a fair d6.',
         '',
         '## Dataset',
         '',
@@ -234,16 +388,21 @@ def _render_markdown_report(summary: ComparisonSummary) -> str:
         f'- Total rolls analyzed: {all_dice.sample_count}',
         '- Primary ranking metric: chi-square goodness-of-fit to a uniform d6 distribution',
         '- Supporting metrics: p-value, total variation distance (TVD), entropy gap, mean shift, repeat rate, and longest streak',
-        '- Group-of-5 ranking metric: pooled chi-square/TVD across all rolls from the five selected dice',
+        f'- Group-of-{group_size} ranking metric: pooled chi-square/TVD across all rolls from the {group_word} selected dice',
+        (
+            f'- Groups searched: the best {len(ranked_groups)} and the worst of {summary.group_count:,} combinations, found by branch-and-bound on pooled face counts'
+            if summary.groups_searched
+            else f'- Groups ranked: all {summary.group_count:,} combinations'
+        ),
         '- Caveat: the group ranking measures pooled balance, not physical independence between dice',
         '',
         '## Executive Summary',
         '',
         f'- Closest single die to random: `{_format_die_name(most_random_die.dice_id)}` with chi-square {most_random_die.chi_square:.3f} and p-value {most_random_die.p_value:.3f}.',
         f'- Weakest single die in this sample: `{_format_die_name(least_random_die.dice_id)}` with chi-square {least_random_die.chi_square:.3f} and p-value {least_random_die.p_value:.3f}.',
-        f'- Best five-die group by pooled fairness: `{_format_group(best_pooled_group)}` with pooled chi-square {best_pooled_group.pooled_metrics.chi_square:.3f}, TVD {best_pooled_group.pooled_metrics.tvd:.4f}, and p-value {best_pooled_group.pooled_metrics.p_value:.3f}.',
-        f'- The naive "pick the five best individual dice" set is `{_format_group(best_individual_group)}`. Its pooled chi-square is {best_individual_group.pooled_metrics.chi_square:.3f}, so the best pooled group improves that by {chi_reduction * 100:.1f}%.',
-        f'- All ten dice pooled together still look reasonably balanced: chi-square {all_dice.chi_square:.3f}, p-value {all_dice.p_value:.3f}, TVD {all_dice.tvd:.4f}.',
+        f'- Best {group_word}-die group by pooled fairness: `{_format_group(best_pooled_group)}` with pooled chi-square {best_pooled_group.pooled_metrics.chi_square:.3f}, TVD {best_pooled_group.pooled_metrics.tvd:.4f}, and p-value {best_pooled_group.pooled_metrics.p_value:.3f}.',
+        f'- The naive "pick the {group_word} best individual dice" set is `{_format_group(best_individual_group)}`. Its pooled chi-square is {best_individual_group.pooled_metrics.chi_square:.3f}, so the best pooled group improves that by {chi_reduction * 100:.1f}%.',
+        f'- All {dice_word} dice pooled together still look reasonably balanced: chi-square {all_dice.chi_square:.3f}, p-value {all_dice.p_value:.3f}, TVD {all_dice.tvd:.4f}.',
         '',
         '## Ranked Single Dice',
         '',
@@ -265,7 +424,7 @@ def _render_markdown_report(summary: ComparisonSummary) -> str:
 
     lines.extend([
         '',
-        '## Best Five-Die Groups',
+        f'## Best {group_word.title()}-Die Groups',
         '',
         '| Rank | Dice | Pooled chi-square | p-value | TVD | Mean | Most over/underrepresented faces |',
         '| --- | --- | ---: | ---: | ---: | ---: | --- |',
@@ -291,17 +450,17 @@ def _render_markdown_report(summary: ComparisonSummary) -> str:
         f'- Lowest repeat rate: `{_format_die_name(lowest_repeat_die.dice_id)}` at {lowest_repeat_die.repeat_rate * 100:.2f}% versus the ideal 16.67%.',
         f'- Highest repeat rate: `{_format_die_name(highest_repeat_die.dice_id)}` at {highest_repeat_die.repeat_rate * 100:.2f}%.',
         f'- Longest run of identical faces: `{_format_die_name(longest_streak_die.dice_id)}` with {longest_streak_die.longest_streak_length} consecutive `{longest_streak_die.longest_streak_value}`s.',
-        f'- Only one die crosses the common alpha=0.05 rejection threshold on its own: `{_format_die_name(least_random_die.dice_id)}` (p-value {least_random_die.p_value:.3f}).',
-        f'- The best pooled group includes `{_format_die_name(ranked_dice[5].dice_id)}` even though it ranks sixth individually. Its biases complement the top dice better than `{_format_die_name(ranked_dice[4].dice_id)}` does.',
+        _significance_line(highlights['significant_dice']),
+        *_complementary_dice_lines(highlights['complementary_dice'], highlights['replaced_dice'], group_word),
         '',
-        '## Worst Five-Die Group',
+        f'## Worst {group_word.title()}-Die Group',
         '',
         f'- Worst pooled set: `{_format_group(worst_pooled_group)}`.',
         f'- Pooled chi-square: {worst_pooled_group.pooled_metrics.chi_square:.3f}',
         f'- Pooled p-value: {worst_pooled_group.pooled_metrics.p_value:.4f}',
         f'- Pooled TVD: {worst_pooled_group.pooled_metrics.tvd:.4f}',
         '',
-        '## All Ten Dice Pooled',
+        f'## All {dice_word.title()} Dice Pooled',
         '',
         f'- Chi-square: {all_dice.chi_square:.3f}',
         f'- p-value: {all_dice.p_value:.3f}',
@@ -312,8 +471,8 @@ def _render_markdown_report(summary: ComparisonSummary) -> str:
         '## Recommendation',
         '',
         f'- If you want the single best die, pick `{_format_die_name(most_random_die.dice_id)}`.',
-        f'- If you want the most balanced set of five from the ten tested dice, use `{_format_group(best_pooled_group)}`.',
-        '- If you want a conservative shortlist for future re-testing, focus on dice `9` and `2` first, because they show the strongest single-die departures from uniformity in this sample.',
+        f'- If you want the most balanced set of {group_word} from the {dice_word} tested dice, use `{_format_group(best_pooled_group)}`.',
+        f'- If you want a conservative shortlist for future re-testing, focus on dice {_format_die_list(ranked_dice[:-3:-1])} first, because they show the strongest single-die departures from uniformity in this sample.',
         '',
     ])
     return '\n'.join(lines)
@@ -333,7 +492,6 @@ def _chart_bar_fill(index: int, total: int) -> str:
 
 def _render_single_die_rank_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
         width = 980
-        height = 520
         margin_left = 170
         margin_right = 70
         margin_top = 48
@@ -343,6 +501,7 @@ def _render_single_die_rank_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
         bar_height = 32
         max_value = max(die.chi_square for die in ranked_dice) * 1.1
         chart_height = (bar_height + row_gap) * len(ranked_dice) - row_gap
+        height = margin_top + chart_height + margin_bottom
 
         parts = [
                 f'<svg viewBox="0 0 {width} {height}" role="img" aria-label="Single-die chi-square rankings">',
@@ -389,7 +548,6 @@ def _heatmap_color(value: float, max_abs: float) -> str:
 
 def _render_face_bias_heatmap_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
         width = 980
-        height = 470
         margin_left = 170
         margin_top = 70
         cell_width = 108
@@ -397,6 +555,8 @@ def _render_face_bias_heatmap_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
         row_gap = 10
         col_gap = 10
         max_abs = max(abs(value) for die in ranked_dice for value in die.deviations)
+        legend_y = margin_top + len(ranked_dice) * (cell_height + row_gap) + 8
+        height = legend_y + 56
 
         parts = [
                 f'<svg viewBox="0 0 {width} {height}" role="img" aria-label="Face bias heatmap across all Yahtzee dice">',
@@ -417,7 +577,6 @@ def _render_face_bias_heatmap_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
                         parts.append(f'<rect x="{x}" y="{y}" width="{cell_width}" height="{cell_height}" rx="10" fill="{_heatmap_color(deviation, max_abs)}" stroke="rgba(79,59,43,0.10)"/>')
                         parts.append(f'<text x="{x + cell_width / 2:.2f}" y="{y + 22}" text-anchor="middle" fill="#1f1a17" font-size="13">{_format_pp(deviation)}</text>')
 
-        legend_y = margin_top + len(ranked_dice) * (cell_height + row_gap) + 8
         for index, sample in enumerate([-max_abs, -max_abs / 2, 0.0, max_abs / 2, max_abs]):
                 x = margin_left + index * 145
                 parts.append(f'<rect x="{x}" y="{legend_y}" width="110" height="20" rx="8" fill="{_heatmap_color(sample, max_abs)}"/>')
@@ -430,10 +589,10 @@ def _render_face_bias_heatmap_svg(ranked_dice: tuple[DieMetrics, ...]) -> str:
 def _render_group_comparison_svg(summary: ComparisonSummary) -> str:
         highlights = _summary_highlights(summary)
         scenarios = [
-                ('Best pooled 5', highlights['best_pooled_group'].pooled_metrics.chi_square, '#2f7a72'),
-                ('Top-5 individuals', highlights['best_individual_group'].pooled_metrics.chi_square, '#d06b2d'),
-                ('All 10 pooled', summary.all_dice.chi_square, '#7c6a58'),
-                ('Worst pooled 5', highlights['worst_pooled_group'].pooled_metrics.chi_square, '#a63f3f'),
+                (f'Best pooled {summary.group_size}', highlights['best_pooled_group'].pooled_metrics.chi_square, '#2f7a72'),
+                (f'Top-{summary.group_size} individuals', highlights['best_individual_group'].pooled_metrics.chi_square, '#d06b2d'),
+                (f'All {len(summary.ranked_dice)} pooled', summary.all_dice.chi_square, '#7c6a58'),
+                (f'Worst pooled {summary.group_size}', highlights['worst_pooled_group'].pooled_metrics.chi_square, '#a63f3f'),
         ]
 
         width = 920
@@ -452,7 +611,7 @@ def _render_group_comparison_svg(summary: ComparisonSummary) -> str:
                 f'<svg viewBox="0 0 {width} {height}" role="img" aria-label="Group fairness comparison chart">',
                 f'<rect x="0" y="0" width="{width}" height="{height}" rx="24" fill="#fffaf2"/>',
                 f'<text x="{margin_left}" y="28" fill="#1f1a17" font-size="22" font-weight="700">Group fairness comparison</text>',
-                f'<text x="{margin_left}" y="46" fill="#6e6258" font-size="13">Comparing the best pooled set, the naive top-five pick, all ten pooled, and the worst pooled set.</text>',
+                f'<text x="{margin_left}" y="46" fill="#6e6258" font-size="13">Comparing the best pooled set, the naive top-{summary.group_size} pick, all {len(summary.ranked_dice)} pooled, and the worst pooled set.</text>',
                 f'<line x1="{margin_left}" y1="{margin_top + chart_height}" x2="{margin_left + chart_width}" y2="{margin_top + chart_height}" stroke="#4f3b2b" stroke-width="2"/>',
         ]
 
@@ -491,6 +650,16 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
         least_random_die = highlights['least_random_die']
         closest_mean_die = highlights['closest_mean_die']
         chi_reduction = highlights['chi_reduction']
+        group_size = summary.group_size
+        group_word = _count_word(group_size)
+        dice_word = _count_word(len(ranked_dice))
+        significant_dice = highlights['significant_dice']
+        if not significant_dice:
+                significance_note = 'No single die rejects uniformity at the 0.05 level.'
+        elif len(significant_dice) == 1:
+                significance_note = f'Die {escape(_format_die_name(significant_dice[0].dice_id))} is the only single die that rejects uniformity at the 0.05 level.'
+        else:
+                significance_note = f'{_count_word(len(significant_dice)).capitalize()} dice reject uniformity at the 0.05 level on their own.'
 
         single_die_rows = ''.join(
                 (
@@ -702,7 +871,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
         <section class="hero">
             <span class="eyebrow">Dice Analysis Dashboard</span>
             <h1>Yahtzee Comparison</h1>
-            <p>This dashboard compares the ten recorded Yahtzee dice across 10,000 total rolls. It ranks single-die fairness, visualizes per-face biases, and compares the best and worst five-die groups using pooled goodness-of-fit metrics.</p>
+            <p>This dashboard compares the {dice_word} recorded Yahtzee dice across {all_dice.sample_count:,} total rolls. It ranks single-die fairness, visualizes per-face biases, and compares the best and worst {group_word}-die groups using pooled goodness-of-fit metrics.</p>
         </section>
 
         <section class="grid">
@@ -711,7 +880,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
                 <div class="metric-value">Die {escape(_format_die_name(most_random_die.dice_id))}<small>chi-square {most_random_die.chi_square:.3f} | p-value {most_random_die.p_value:.3f}</small></div>
             </article>
             <article class="card">
-                <span class="metric-label">Best Five-Die Group</span>
+                <span class="metric-label">Best {group_word.title()}-Die Group</span>
                 <div class="metric-value">{escape(_format_group(best_pooled_group))}<small>pooled chi-square {best_pooled_group.pooled_metrics.chi_square:.3f}</small></div>
             </article>
             <article class="card">
@@ -719,8 +888,8 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
                 <div class="metric-value">Die {escape(_format_die_name(least_random_die.dice_id))}<small>chi-square {least_random_die.chi_square:.3f} | p-value {least_random_die.p_value:.3f}</small></div>
             </article>
             <article class="card">
-                <span class="metric-label">Top-5 Improvement</span>
-                <div class="metric-value">{chi_reduction * 100:.1f}%<small>better pooled chi-square than the naive top-five pick</small></div>
+                <span class="metric-label">Top-{group_size} Improvement</span>
+                <div class="metric-value">{chi_reduction * 100:.1f}%<small>better pooled chi-square than the naive top-{group_word} pick</small></div>
             </article>
         </section>
 
@@ -729,14 +898,14 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
                 <h2>Executive Summary</h2>
                 <ul class="summary-list">
                     <li>Die {escape(_format_die_name(most_random_die.dice_id))} is the closest single die to a uniform d6 in this sample.</li>
-                    <li>The most balanced five-die set is {escape(_format_group(best_pooled_group))}, not the simple top-five by individual ranking.</li>
-                    <li>Die {escape(_format_die_name(least_random_die.dice_id))} is the only single die that rejects uniformity at the 0.05 level.</li>
-                    <li>All ten dice pooled together still look broadly acceptable: chi-square {all_dice.chi_square:.3f}, p-value {all_dice.p_value:.3f}, TVD {all_dice.tvd:.4f}.</li>
+                    <li>The most balanced {group_word}-die set is {escape(_format_group(best_pooled_group))}, not the simple top-{group_word} by individual ranking.</li>
+                    <li>{significance_note}</li>
+                    <li>All {dice_word} dice pooled together still look broadly acceptable: chi-square {all_dice.chi_square:.3f}, p-value {all_dice.p_value:.3f}, TVD {all_dice.tvd:.4f}.</li>
                     <li>Die {escape(_format_die_name(closest_mean_die.dice_id))} is closest to the expected mean of 3.5 with an observed mean of {closest_mean_die.mean_roll:.3f}.</li>
                 </ul>
                 <div class="badges">
                     <span class="badge">Best pooled set: {escape(_format_group(best_pooled_group))}</span>
-                    <span class="badge">Naive top five: {escape(_format_group(best_individual_group))}</span>
+                    <span class="badge">Naive top {group_word}: {escape(_format_group(best_individual_group))}</span>
                     <span class="badge">Worst pooled set: {escape(_format_group(worst_pooled_group))}</span>
                 </div>
             </article>
@@ -746,7 +915,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
                     <li>The primary fairness metric is chi-square goodness-of-fit against a uniform d6.</li>
                     <li>TVD is a direct measure of how far the observed distribution moves away from 16.67% per face.</li>
                     <li>Group rankings here measure pooled balance only. They do not establish physical independence between dice.</li>
-                    <li>Bias cancellation matters: a sixth-ranked die can improve a five-die pool if its face biases offset the others.</li>
+                    <li>Bias cancellation matters: a lower-ranked die can improve a {group_word}-die pool if its face biases offset the others.</li>
                 </ul>
             </article>
         </section>
@@ -754,7 +923,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
         <section class="section">
             <article class="card chart-card">
                 <h2>Single-Die Ranking Chart</h2>
-                <p class="section-note">This chart ranks all ten dice by chi-square. Lower values indicate a closer match to a fair six-sided die.</p>
+                <p class="section-note">This chart ranks all {dice_word} dice by chi-square. Lower values indicate a closer match to a fair six-sided die.</p>
                 {_render_single_die_rank_svg(ranked_dice)}
             </article>
         </section>
@@ -770,7 +939,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
         <section class="section">
             <article class="card chart-card">
                 <h2>Group Comparison Chart</h2>
-                <p class="section-note">The best pooled group outperforms the naive top-five selection, while the weakest pooled group is materially worse than both.</p>
+                <p class="section-note">The best pooled group outperforms the naive top-{group_word} selection, while the weakest pooled group is materially worse than both.</p>
                 {_render_group_comparison_svg(summary)}
             </article>
         </section>
@@ -796,7 +965,7 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
                 </table>
             </article>
             <article class="card">
-                <h2>Best Five-Die Groups</h2>
+                <h2>Best {group_word.title()}-Die Groups</h2>
                 <table>
                     <thead>
                         <tr>
@@ -820,16 +989,16 @@ def _render_html_dashboard(summary: ComparisonSummary) -> str:
 '''
 
 
-def build_report() -> str:
-    return _render_markdown_report(_build_summary())
+def build_report(group_size: int = DEFAULT_GROUP_SIZE) -> str:
+    return _render_markdown_report(_build_summary(group_size=group_size))
 
 
-def build_dashboard_html() -> str:
-    return _render_html_dashboard(_build_summary())
+def build_dashboard_html(group_size: int = DEFAULT_GROUP_SIZE) -> str:
+    return _render_html_dashboard(_build_summary(group_size=group_size))
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description='Compare the ten recorded Yahtzee dice and write Markdown and HTML reports.')
+    parser = argparse.ArgumentParser(description='Compare the recorded Yahtzee dice and write Markdown and HTML reports.')
     parser.add_argument(
     '--output',
         type=Path,
@@ -842,9 +1011,21 @@ def main() -> None:
     default=DEFAULT_HTML_OUTPUT_PATH,
     help='Path to the HTML dashboard to generate.',
     )
+    parser.add_argument(
+    '--db-path',
+    type=Path,
+    default=DBPath,
+    help='Database file to read results from.',
+    )
+    parser.add_argument(
+    '--group-size',
+    type=int,
+    default=DEFAULT_GROUP_SIZE,
+    help='Number of dice per ranked group.',
+    )
     args = parser.parse_args()
 
-    summary = _build_summary()
+    summary = _build_summary(db_path=args.db_path, group_size=args.group_size)
     markdown_report = _render_markdown_report(summary)
     html_dashboard = _render_html_dashboard(summary)
 
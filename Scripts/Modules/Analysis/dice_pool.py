@@ -0,0 +1,135 @@
+"""
+Exact outcome distributions for pools of independent dice with measured faces.
+
+Each die is a sequence of face probabilities, face 1 first, and dice in one pool
+may have different numbers of sides. A die is the polynomial sum_f p_f x^f, so the
+pool's sum distribution is the product of its dice's polynomials; likewise a count
+of dice showing some faces is the product of the dice's (1 - p + p x). Products are
+taken by direct convolution for small pools and by FFT for large ones, so the cost
+grows with the size of the result instead of the number of outcomes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+METHOD_AUTO = 'auto'
+METHOD_DIRECT = 'direct'
+METHOD_FFT = 'fft'
+METHODS = (METHOD_AUTO, METHOD_DIRECT, METHOD_FFT)
+
+# Pools with more dice than this are multiplied by FFT when the method is auto.
+FFT_DICE_THRESHOLD = 64
+# How far a die's probabilities may sum from 1 before it is rejected.
+_NORMALIZATION_TOLERANCE = 1e-6
+
+
+def _dice_arrays(dice: Iterable[Sequence[float]]) -> list[np.ndarray]:
+    arrays = [np.asarray(die, dtype=np.float64) for die in dice]
+    if not arrays:
+        raise ValueError('a pool needs at least one die')
+    for index, die in enumerate(arrays):
+        if die.ndim != 1 or not len(die):
+            raise ValueError(f'die {index} must be a non-empty sequence of face probabilities')
+        if np.any(die < 0.0) or abs(die.sum() - 1.0) > _NORMALIZATION_TOLERANCE:
+            raise ValueError(f'die {index} probabilities must be non-negative and sum to 1')
+    return arrays
+
+
+def _use_fft(method: str, dice_count: int) -> bool:
+    if method not in METHODS:
+        raise ValueError(f'method must be one of {METHODS}, got {method!r}')
+    return method == METHOD_FFT or (method == METHOD_AUTO and dice_count > FFT_DICE_THRESHOLD)
+
+
+def _clean(distribution: np.ndarray) -> np.ndarray:
+    # FFT round-off leaves tiny negative values where the true probability is zero.
+    return np.clip(distribution, 0.0, 1.0)
+
+
+def sum_distribution(dice: Iterable[Sequence[float]], method: str = METHOD_AUTO) -> np.ndarray:
+    """Return pmf with pmf[total] the probability the pool's faces sum to total.
+
+    Totals below the number of dice are impossible and hold 0.
+    """
+    arrays = _dice_arrays(dice)
+    length = sum(len(die) for die in arrays) + 1
+    if _use_fft(method, len(arrays)):
+        spectrum = np.ones(length // 2 + 1, dtype=np.complex128)
+        for die in arrays:
+            spectrum *= np.fft.rfft(np.concatenate(([0.0], die)), n=length)
+        return _clean(np.fft.irfft(spectrum, n=length))
+
+    distribution = np.ones(1)
+    for die in arrays:
+        distribution = np.convolve(distribution, np.concatenate(([0.0], die)))
+    return distribution
+
+
+def _count_distributions(success: np.ndarray, method: str) -> np.ndarray:
+    """Poisson-binomial pmfs for a (dice x events) matrix of success probabilities.
+
+    Returns an (events x dice + 1) array whose row e is the distribution of how many
+    dice succeed at event e.
+    """
+    dice_count, events = success.shape
+    if _use_fft(method, dice_count):
+        length = dice_count + 1
+        roots = np.exp(-2j * np.pi * np.arange(length // 2 + 1) / length)
+        # Each die's (1 - p + p x) evaluated at the FFT roots, multiplied across dice.
+        spectrum = np.prod(1.0 - success[:, :, None] + success[:, :, None] * roots, axis=0)
+        return _clean(np.fft.irfft(spectrum, n=length, axis=1))
+
+    distributions = np.zeros((events, dice_count + 1))
+    distributions[:, 0] = 1.0
+    for used, probabilities in enumerate(success, start=1):
+        probabilities = probabilities[:, None]
+        shifted = distributions[:, :used] * probabilities
+        distributions[:, :used] *= 1.0 - probabilities
+        distributions[:, 1:used + 1] += shifted
+    return distributions
+
+
+def face_count_distributions(dice: Iterable[Sequence[float]], method: str = METHOD_AUTO) -> np.ndarray:
+    """Return an (faces x dice + 1) array: row f - 1 is the pmf of how many dice show face f.
+
+    faces is the largest die's side count; smaller dice never show the faces they lack.
+    """
+    arrays = _dice_arrays(dice)
+    success = np.zeros((len(arrays), max(len(die) for die in arrays)))
+    for row, die in zip(success, arrays):
+        row[:len(die)] = die
+    return _count_distributions(success, method)
+
+
+def success_count_distribution(
+    dice: Iterable[Sequence[float]],
+    success_faces: Iterable[int],
+    method: str = METHOD_AUTO,
+) -> np.ndarray:
+    """Return pmf with pmf[k] the probability that exactly k dice show one of success_faces."""
+    arrays = _dice_arrays(dice)
+    faces = sorted(set(success_faces))
+    if not faces or faces[0] < 1:
+        raise ValueError('success_faces must be face numbers of 1 or more')
+    success = np.array([die[[face - 1 for face in faces if face <= len(die)]].sum() for die in arrays])
+    return _count_distributions(success[:, None], method)[0]
+
+
+def probability_at_least(
+    dice: Iterable[Sequence[float]],
+    count: int,
+    face: int,
+    method: str = METHOD_AUTO,
+) -> float:
+    """Return the probability that at least count of the dice roll face or higher."""
+    arrays = _dice_arrays(dice)
+    if count <= 0:
+        return 1.0
+    sides = max(len(die) for die in arrays)
+    if count > len(arrays) or face > sides:
+        return 0.0
+    success_faces = range(max(face, 1), sides + 1)
+    return float(success_count_distribution(arrays, success_faces, method)[count:].sum())
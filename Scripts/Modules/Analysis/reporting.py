@@ -1,16 +1,33 @@
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from html import escape
 import math
+import os
 from pathlib import Path
+import tempfile
+
+import numpy as np
+
+from Scripts.Modules.Analysis.sequential import SequentialDecision
+from Scripts.Modules.Database.database import DieStats, timestamp_to_us, us_to_timestamp
 
 
 _EPSILON = 1e-14
 _SMALL_NUMBER = 1e-30
 _MAX_ITERATIONS = 200
+RECENT_ROLL_COUNT = 12
+# Bump whenever _render_report_html output changes so bulk_reports re-renders existing reports.
+REPORT_TEMPLATE_VERSION = 2
+# The drift chart's rolling window holds this many expected rolls per face.
+DRIFT_WINDOW_EXPECTED_PER_FACE = 50
+# Consecutive windows overlap; each step advances by window / DRIFT_WINDOW_STEPS rolls.
+DRIFT_WINDOW_STEPS = 4
+# Upper bound on plotted points, so chart size does not grow with the sample count.
+DRIFT_MAX_POINTS = 200
+_DRIFT_CHUNK_BLOCKS = 4096
 
 
 @dataclass(frozen=True)
@@ -21,6 +38,20 @@ class OutcomeFrequency:
     percentage: float
 
 
+@dataclass(frozen=True)
+class DriftSeries:
+    """Downsampled rolling-window statistics over the timestamp-ordered rolls.
+
+    Point i describes the window of window_rolls rolls ending at roll roll_index[i]:
+    chi_square is that window's goodness-of-fit statistic and face_shares[i][f - 1]
+    is the cumulative share of face f over every roll up to roll_index[i].
+    """
+    window_rolls: int
+    roll_index: tuple[int, ...]
+    chi_square: tuple[float, ...]
+    face_shares: tuple[tuple[float, ...], ...]
+
+
 @dataclass(frozen=True)
 class DiceAnalysisReport:
     dice_id: str
@@ -35,7 +66,14 @@ class DiceAnalysisReport:
     longest_streak_value: int
     longest_streak_length: int
     frequencies: tuple[OutcomeFrequency, ...]
-    ordered_rolls: tuple[int, ...]
+    repeat_pair_count: int
+    recent_rolls: tuple[int, ...]
+    # Full timestamp-ordered faces as a read-only array, kept only when requested with keep_rolls=True.
+    ordered_rolls: np.ndarray | None = field(default=None, compare=False, repr=False)
+    # Set when the session that produced the rolls stopped on a sequential test.
+    sequential_decision: SequentialDecision | None = None
+    # Only available when the full roll history was analyzed and spans at least two windows.
+    drift: DriftSeries | None = None
 
 
 def _regularized_gamma_p_series(a: float, x: float) -> float:
@@ -92,81 +130,400 @@ def chi_square_p_value(statistic: float, degrees_of_freedom: int) -> float:
     return max(0.0, min(1.0, _regularized_gamma_q_continued_fraction(a, x)))
 
 
-def _longest_streak(values: list[int]) -> tuple[int, int]:
-    if not values:
-        return 0, 0
+_erfc = np.frompyfunc(math.erfc, 1, 1)
 
-    best_value = values[0]
-    best_length = 1
-    current_value = values[0]
-    current_length = 1
 
-    for value in values[1:]:
-        if value == current_value:
-            current_length += 1
-        else:
-            current_value = value
-            current_length = 1
-
-        if current_length > best_length:
-            best_value = current_value
-            best_length = current_length
-
-    return best_value, best_length
+def chi_square_p_values(statistics, degrees_of_freedom: int) -> np.ndarray:
+    """Vectorized chi_square_p_value() for many statistics with the same integer degrees of freedom.
 
+    Uses the closed-form upper tail for integer degrees of freedom: a finite Poisson-style
+    sum for even df, plus an erfc term for odd df.
+    """
+    if degrees_of_freedom <= 0:
+        raise ValueError('degrees_of_freedom must be positive')
+    half = np.asarray(statistics, dtype=np.float64) / 2.0
+    if np.any(half < 0):
+        raise ValueError('statistic must be non-negative')
 
-def _normalize_rows(rows: list[dict]) -> list[dict]:
-    return sorted(rows, key=lambda row: row['timestamp'])
+    with np.errstate(divide='ignore'):
+        log_half = np.log(half)
+    if degrees_of_freedom % 2 == 0:
+        tail = np.exp(-half)
+        for j in range(1, degrees_of_freedom // 2):
+            tail += np.exp(j * log_half - half - math.lgamma(j + 1))
+    else:
+        tail = np.asarray(_erfc(np.sqrt(half)), dtype=np.float64)
+        for j in range(1, (degrees_of_freedom - 1) // 2 + 1):
+            tail += np.exp((j - 0.5) * log_half - half - math.lgamma(j + 0.5))
+    return np.clip(tail, 0.0, 1.0)
+
+
+def _run_lengths(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Run-length encode values, returning (run start indices, run lengths)."""
+    # Run boundaries are the positions where the face changes.
+    run_starts = np.flatnonzero(values[1:] != values[:-1]) + 1
+    boundaries = np.concatenate(([0], run_starts, [values.size]))
+    return boundaries[:-1], np.diff(boundaries)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Pick threshold indices of (x, y) with Largest-Triangle-Three-Buckets downsampling."""
+    size = x.size
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+    # Interior points are split into threshold - 2 buckets; each keeps the point forming the
+    # largest triangle with the previously kept point and the next bucket's average.
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.int64)
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], max(edges[bucket + 1], edges[bucket] + 1)
+        next_start, next_stop = stop, edges[bucket + 2] if bucket + 2 < threshold - 1 else size
+        next_x = x[next_start:max(next_stop, next_start + 1)].mean()
+        next_y = y[next_start:max(next_stop, next_start + 1)].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def _drift_series(ordered_rolls: np.ndarray, dice_sides: int) -> DriftSeries | None:
+    """Build the rolling-window drift series, or None if there are fewer than two windows of rolls."""
+    step = DRIFT_WINDOW_EXPECTED_PER_FACE * dice_sides // DRIFT_WINDOW_STEPS
+    # Windows are whole blocks, so use the rolls they actually span (348 for a d7, not 350).
+    window_rolls = step * DRIFT_WINDOW_STEPS
+    block_count = ordered_rolls.size // step
+    if block_count < 2 * DRIFT_WINDOW_STEPS:
+        return None
+
+    # Per-face counts for each step-sized block, accumulated chunk by chunk so the
+    # temporary index array stays bounded; trailing rolls short of a block are left out.
+    block_counts = np.empty((block_count, dice_sides + 1), dtype=np.int64)
+    for first_block in range(0, block_count, _DRIFT_CHUNK_BLOCKS):
+        last_block = min(block_count, first_block + _DRIFT_CHUNK_BLOCKS)
+        faces = ordered_rolls[first_block * step:last_block * step]
+        block_ids = np.repeat(np.arange(last_block - first_block), step)
+        block_counts[first_block:last_block] = np.bincount(
+            block_ids * (dice_sides + 1) + faces,
+            minlength=(last_block - first_block) * (dice_sides + 1),
+        ).reshape(-1, dice_sides + 1)
+
+    cumulative = np.cumsum(block_counts[:, 1:], axis=0)
+    window_counts = cumulative[DRIFT_WINDOW_STEPS - 1:].copy()
+    window_counts[1:] -= cumulative[:-DRIFT_WINDOW_STEPS]
+    expected = window_rolls / dice_sides
+    chi_square = (((window_counts - expected) ** 2) / expected).sum(axis=1)
+    roll_index = np.arange(DRIFT_WINDOW_STEPS, block_count + 1) * step
+    face_shares = cumulative[DRIFT_WINDOW_STEPS - 1:] / roll_index[:, None]
+
+    keep = _lttb_indices(roll_index.astype(np.float64), chi_square, DRIFT_MAX_POINTS)
+    return DriftSeries(
+        window_rolls=window_rolls,
+        roll_index=tuple(roll_index[keep].tolist()),
+        chi_square=tuple(chi_square[keep].tolist()),
+        face_shares=tuple(tuple(shares) for shares in face_shares[keep].tolist()),
+    )
 
 
-def analyze_results(dice_id: str, rows: list[dict], dice_sides: int) -> DiceAnalysisReport:
-    if not rows:
+def _analyze_ordered_rolls(
+    dice_id: str,
+    ordered_rolls: np.ndarray,
+    first_timestamp: str,
+    last_timestamp: str,
+    dice_sides: int,
+    keep_rolls: bool = False,
+) -> DiceAnalysisReport:
+    if ordered_rolls.size == 0:
         raise ValueError('rows must not be empty')
     if dice_sides < 2:
         raise ValueError('dice_sides must be at least 2')
 
-    normalized_rows = _normalize_rows(rows)
-    ordered_rolls = [int(row['dice_result']) for row in normalized_rows]
+    invalid_mask = (ordered_rolls < 1) | (ordered_rolls > dice_sides)
+    if invalid_mask.any():
+        raise ValueError(f'Found roll values outside 1..{dice_sides}: {ordered_rolls[invalid_mask].tolist()}')
+
+    sample_count = int(ordered_rolls.size)
+    starts, lengths = _run_lengths(ordered_rolls)
+    best_run = int(np.argmax(lengths))
+    return _build_report(
+        dice_id=dice_id,
+        dice_sides=dice_sides,
+        counts=np.bincount(ordered_rolls, minlength=dice_sides + 1),
+        roll_sum=int(ordered_rolls.sum(dtype=np.int64)),
+        first_timestamp=first_timestamp,
+        last_timestamp=last_timestamp,
+        longest_streak_value=int(ordered_rolls[starts[best_run]]),
+        longest_streak_length=int(lengths[best_run]),
+        repeat_pair_count=sample_count - int(lengths.size),
+        recent_rolls=tuple(ordered_rolls[-RECENT_ROLL_COUNT:].tolist()),
+        ordered_rolls=_read_only(ordered_rolls) if keep_rolls else None,
+        drift=_drift_series(ordered_rolls, dice_sides),
+    )
 
-    invalid_rolls = [roll for roll in ordered_rolls if roll < 1 or roll > dice_sides]
-    if invalid_rolls:
-        raise ValueError(f'Found roll values outside 1..{dice_sides}: {invalid_rolls}')
 
-    sample_count = len(ordered_rolls)
+def _build_report(
+    dice_id: str,
+    dice_sides: int,
+    counts: np.ndarray,
+    roll_sum: int,
+    first_timestamp: str,
+    last_timestamp: str,
+    longest_streak_value: int,
+    longest_streak_length: int,
+    repeat_pair_count: int,
+    recent_rolls: tuple[int, ...],
+    ordered_rolls: np.ndarray | None = None,
+    drift: DriftSeries | None = None,
+) -> DiceAnalysisReport:
+    """Assemble a report from per-face counts (indexed by face, index 0 unused) and run summaries."""
+    sample_count = int(counts.sum())
     expected_count = sample_count / dice_sides
-    counts = Counter(ordered_rolls)
     frequencies = tuple(
         OutcomeFrequency(
             face=face,
-            count=counts.get(face, 0),
+            count=int(counts[face]),
             expected_count=expected_count,
-            percentage=(counts.get(face, 0) / sample_count) * 100,
+            percentage=(int(counts[face]) / sample_count) * 100,
         )
         for face in range(1, dice_sides + 1)
     )
-    chi_square_statistic = sum(
-        ((frequency.count - frequency.expected_count) ** 2) / frequency.expected_count
-        for frequency in frequencies
-    )
-    streak_value, streak_length = _longest_streak(ordered_rolls)
+    chi_square_statistic = float((((counts[1:] - expected_count) ** 2) / expected_count).sum())
 
     return DiceAnalysisReport(
         dice_id=str(dice_id),
         dice_sides=dice_sides,
         sample_count=sample_count,
-        first_timestamp=normalized_rows[0]['timestamp'],
-        last_timestamp=normalized_rows[-1]['timestamp'],
-        mean_roll=sum(ordered_rolls) / sample_count,
+        first_timestamp=first_timestamp,
+        last_timestamp=last_timestamp,
+        mean_roll=roll_sum / sample_count,
         expected_mean_roll=(dice_sides + 1) / 2,
         chi_square_statistic=chi_square_statistic,
         p_value=chi_square_p_value(chi_square_statistic, dice_sides - 1),
-        longest_streak_value=streak_value,
-        longest_streak_length=streak_length,
+        longest_streak_value=longest_streak_value,
+        longest_streak_length=longest_streak_length,
         frequencies=frequencies,
-        ordered_rolls=tuple(ordered_rolls),
+        repeat_pair_count=repeat_pair_count,
+        recent_rolls=recent_rolls,
+        ordered_rolls=ordered_rolls,
+        drift=drift,
     )
 
 
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values = values.view()
+    values.flags.writeable = False
+    return values
+
+
+def analyze_results(dice_id: str, rows: list[dict], dice_sides: int, keep_rolls: bool = False) -> DiceAnalysisReport:
+    """Analyze result row dicts; rows are ordered by timestamp only when they are not already sorted."""
+    if not rows:
+        raise ValueError('rows must not be empty')
+
+    faces = np.fromiter((int(row['dice_result']) for row in rows), dtype=np.int64, count=len(rows))
+    timestamps = np.array([row['timestamp'] for row in rows])
+    order = None
+    if np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind='stable')
+        faces = faces[order]
+    first_index, last_index = (0, -1) if order is None else (order[0], order[-1])
+
+    return _analyze_ordered_rolls(
+        dice_id,
+        faces,
+        rows[first_index]['timestamp'],
+        rows[last_index]['timestamp'],
+        dice_sides,
+        keep_rolls,
+    )
+
+
+def analyze_roll_columns(dice_id: str, faces, timestamps_us, dice_sides: int, keep_rolls: bool = False) -> DiceAnalysisReport:
+    """Analyze rolls given as parallel face/timestamp arrays, such as DBManager.read_columns_for_die().
+
+    The columns are reordered by timestamp only when they are not already sorted.
+    """
+    faces = np.asarray(faces, dtype=np.int64)
+    timestamps_us = np.asarray(timestamps_us, dtype=np.int64)
+    if faces.shape != timestamps_us.shape:
+        raise ValueError('faces and timestamps_us must have the same length')
+    if faces.size == 0:
+        raise ValueError('rows must not be empty')
+
+    if np.any(timestamps_us[1:] < timestamps_us[:-1]):
+        order = np.argsort(timestamps_us, kind='stable')
+        faces = faces[order]
+        timestamps_us = timestamps_us[order]
+
+    return _analyze_ordered_rolls(
+        dice_id,
+        faces,
+        us_to_timestamp(int(timestamps_us[0])),
+        us_to_timestamp(int(timestamps_us[-1])),
+        dice_sides,
+        keep_rolls,
+    )
+
+
+class ReportAccumulator:
+    """Running analysis of one die's rolls with O(1) work per roll.
+
+    Tracks face counts, the running mean and variance (Welford), the chi-square
+    statistic, repeat pairs and the current/longest streak, so live overlays can read
+    them every frame and snapshot() can produce a DiceAnalysisReport at any time
+    without revisiting earlier rolls.
+    """
+
+    def __init__(self, dice_id: str | None, dice_sides: int | None) -> None:
+        self.dice_id = None if dice_id is None else str(dice_id)
+        self.dice_sides = dice_sides
+        self.sample_count = 0
+        self.roll_sum = 0
+        self.repeat_pair_count = 0
+        self.current_streak_value: int | None = None
+        self.current_streak_length = 0
+        self.longest_streak_value: int | None = None
+        self.longest_streak_length = 0
+        self.first_timestamp_us: int | None = None
+        self.last_timestamp_us: int | None = None
+        self._counts: dict[int, int] = {}
+        self._sum_count_squares = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._recent: deque[int] = deque(maxlen=RECENT_ROLL_COUNT)
+
+    @classmethod
+    def from_die_stats(
+        cls,
+        stats: DieStats,
+        dice_sides: int | None = None,
+        recent_rolls=(),
+    ) -> ReportAccumulator:
+        """Seed an accumulator from DBManager.read_die_stats() without reading any rolls.
+
+        recent_rolls, oldest first, fills the recent-roll strip of later snapshots.
+        """
+        accumulator = cls(stats.dice_id, dice_sides if dice_sides is not None else stats.dice_sides)
+        accumulator.sample_count = stats.roll_count
+        accumulator.roll_sum = stats.roll_sum
+        accumulator.repeat_pair_count = stats.repeat_pairs
+        accumulator.current_streak_value = stats.last_result
+        accumulator.current_streak_length = stats.current_streak
+        accumulator.longest_streak_value = stats.longest_streak_value
+        accumulator.longest_streak_length = stats.longest_streak_length
+        if stats.first_timestamp is not None:
+            accumulator.first_timestamp_us = timestamp_to_us(stats.first_timestamp)
+        if stats.last_timestamp is not None:
+            accumulator.last_timestamp_us = timestamp_to_us(stats.last_timestamp)
+        accumulator._counts = dict(stats.face_counts)
+        accumulator._sum_count_squares = sum(count * count for count in stats.face_counts.values())
+        if stats.roll_count:
+            accumulator._mean = stats.roll_sum / stats.roll_count
+            accumulator._m2 = sum(
+                count * (face - accumulator._mean) ** 2
+                for face, count in stats.face_counts.items()
+            )
+        accumulator._recent.extend(int(face) for face in recent_rolls)
+        return accumulator
+
+    def add(self, face: int, timestamp_us: int | None = None) -> None:
+        """Record one roll; timestamp_us defaults to the current wall-clock time."""
+        face = int(face)
+        if face < 1 or (self.dice_sides is not None and face > self.dice_sides):
+            raise ValueError(f'Found roll values outside 1..{self.dice_sides}: {[face]}')
+        if timestamp_us is None:
+            timestamp_us = timestamp_to_us(datetime.now())
+
+        count = self._counts.get(face, 0)
+        self._counts[face] = count + 1
+        self._sum_count_squares += 2 * count + 1
+
+        self.sample_count += 1
+        self.roll_sum += face
+        delta = face - self._mean
+        self._mean += delta / self.sample_count
+        self._m2 += delta * (face - self._mean)
+
+        if face == self.current_streak_value:
+            self.repeat_pair_count += 1
+            self.current_streak_length += 1
+        else:
+            self.current_streak_value = face
+            self.current_streak_length = 1
+        if self.current_streak_length > self.longest_streak_length:
+            self.longest_streak_value = face
+            self.longest_streak_length = self.current_streak_length
+
+        if self.first_timestamp_us is None:
+            self.first_timestamp_us = timestamp_us
+        self.last_timestamp_us = timestamp_us
+        self._recent.append(face)
+
+    @property
+    def face_counts(self) -> dict[int, int]:
+        return dict(sorted(self._counts.items()))
+
+    @property
+    def recent_rolls(self) -> tuple[int, ...]:
+        return tuple(self._recent)
+
+    @property
+    def mean_roll(self) -> float | None:
+        return self.roll_sum / self.sample_count if self.sample_count else None
+
+    @property
+    def expected_mean_roll(self) -> float | None:
+        return (self.dice_sides + 1) / 2 if self.dice_sides else None
+
+    @property
+    def variance(self) -> float | None:
+        """Sample variance of the faces rolled so far."""
+        return self._m2 / (self.sample_count - 1) if self.sample_count > 1 else None
+
+    @property
+    def chi_square_statistic(self) -> float | None:
+        if not self.sample_count or not self.dice_sides:
+            return None
+        # sum((c - E)^2 / E) with E = n / k expands to k * sum(c^2) / n - n.
+        return max(0.0, self.dice_sides * self._sum_count_squares / self.sample_count - self.sample_count)
+
+    @property
+    def repeat_pair_rate(self) -> float | None:
+        return self.repeat_pair_count / (self.sample_count - 1) if self.sample_count > 1 else None
+
+    def snapshot(self) -> DiceAnalysisReport:
+        """Return the DiceAnalysisReport that analyze_results() would give for the rolls so far."""
+        if not self.sample_count:
+            raise ValueError('rows must not be empty')
+        if self.dice_sides is None or self.dice_sides < 2:
+            raise ValueError('dice_sides must be at least 2')
+        invalid_faces = [face for face in sorted(self._counts) if not 1 <= face <= self.dice_sides]
+        if invalid_faces:
+            raise ValueError(f'Found roll values outside 1..{self.dice_sides}: {invalid_faces}')
+
+        counts = np.zeros(self.dice_sides + 1, dtype=np.int64)
+        for face, count in self._counts.items():
+            counts[face] = count
+        return _build_report(
+            dice_id=str(self.dice_id),
+            dice_sides=self.dice_sides,
+            counts=counts,
+            roll_sum=self.roll_sum,
+            first_timestamp=us_to_timestamp(self.first_timestamp_us),
+            last_timestamp=us_to_timestamp(self.last_timestamp_us),
+            longest_streak_value=self.longest_streak_value,
+            longest_streak_length=self.longest_streak_length,
+            repeat_pair_count=self.repeat_pair_count,
+            recent_rolls=self.recent_rolls,
+        )
+
+
 def build_summary_lines(report: DiceAnalysisReport) -> list[str]:
     expected_per_face = report.sample_count / report.dice_sides
     has_adequate_sample = expected_per_face >= 5.0
@@ -191,8 +548,15 @@ def build_summary_lines(report: DiceAnalysisReport) -> list[str]:
         f'Chi-square p-value: {report.p_value:.4f}',
         interpretation,
         f'Longest streak: face {report.longest_streak_value} repeated {report.longest_streak_length} times',
-        'Observed face counts:',
     ]
+    decision = report.sequential_decision
+    if decision is not None:
+        summary.extend([
+            f'Sequential verdict: {decision.verdict} after {decision.samples_used} rolls '
+            f'(log LR {decision.log_likelihood_ratio:.3f})',
+            f'Decision rule: {decision.rule}',
+        ])
+    summary.append('Observed face counts:')
     summary.extend(
         f'  {frequency.face}: {frequency.count} ({frequency.percentage:.1f}%)'
         for frequency in report.frequencies
@@ -238,26 +602,132 @@ def _render_distribution_svg(report: DiceAnalysisReport) -> str:
     return ''.join(parts)
 
 
-def _render_recent_rolls(report: DiceAnalysisReport) -> str:
-  if report.sample_count > 1000:
+_FACE_LINE_COLORS = ('#2f7a72', '#d06b2d', '#7a4f9a', '#a63f3f', '#3f6fa6', '#8a7a2f')
+
+
+def chi_square_critical_value(degrees_of_freedom: int, alpha: float = 0.05) -> float:
+    """Return the statistic whose upper-tail p-value is alpha."""
+    low, high = 0.0, float(degrees_of_freedom)
+    while chi_square_p_value(high, degrees_of_freedom) > alpha:
+        high *= 2.0
+    for _ in range(60):
+        middle = (low + high) / 2.0
+        if chi_square_p_value(middle, degrees_of_freedom) > alpha:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2.0
+
+
+def _polyline_points(xs, ys, x_scale, y_scale) -> str:
+    return ' '.join(f'{x_scale(x):.1f},{y_scale(y):.1f}' for x, y in zip(xs, ys))
+
+
+def _render_line_chart(title: str, xs, series, y_max: float, reference_value: float, reference_label: str) -> str:
+    """Render (color, values) line series over a shared x axis with a dashed reference line."""
+    width = 860
+    height = 300
+    margin_left = 72
+    margin_right = 28
+    margin_top = 28
+    margin_bottom = 48
+    chart_width = width - margin_left - margin_right
+    chart_height = height - margin_top - margin_bottom
+    x_min, x_max = xs[0], max(xs[-1], xs[0] + 1)
+
+    def x_scale(value):
+        return margin_left + ((value - x_min) / (x_max - x_min)) * chart_width
+
+    def y_scale(value):
+        return margin_top + chart_height - (min(value, y_max) / y_max) * chart_height
+
+    reference_y = y_scale(reference_value)
+    parts = [
+        f'<svg viewBox="0 0 {width} {height}" role="img" aria-label="{escape(title)}">',
+        f'<rect x="0" y="0" width="{width}" height="{height}" rx="18" fill="#fffaf2"/>',
+        f'<line x1="{margin_left}" y1="{margin_top}" x2="{margin_left}" y2="{margin_top + chart_height}" stroke="#4f3b2b" stroke-width="2"/>',
+        f'<line x1="{margin_left}" y1="{margin_top + chart_height}" x2="{margin_left + chart_width}" y2="{margin_top + chart_height}" stroke="#4f3b2b" stroke-width="2"/>',
+        f'<line x1="{margin_left}" y1="{reference_y:.1f}" x2="{margin_left + chart_width}" y2="{reference_y:.1f}" stroke="#d06b2d" stroke-width="2" stroke-dasharray="8 6"/>',
+        f'<text x="{margin_left + chart_width - 4}" y="{reference_y - 8:.1f}" text-anchor="end" fill="#d06b2d" font-size="13">{escape(reference_label)}</text>',
+        f'<text x="{margin_left}" y="{height - 14}" fill="#4f3b2b" font-size="13">Roll {x_min}</text>',
+        f'<text x="{margin_left + chart_width}" y="{height - 14}" text-anchor="end" fill="#4f3b2b" font-size="13">Roll {xs[-1]}</text>',
+        f'<text x="{margin_left - 10}" y="{margin_top + 4}" text-anchor="end" fill="#4f3b2b" font-size="13">{y_max:.3g}</text>',
+    ]
+    parts.extend(
+        f'<polyline points="{_polyline_points(xs, values, x_scale, y_scale)}" fill="none" stroke="{color}" stroke-width="2"/>'
+        for color, values in series
+    )
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def _render_drift_charts(report: DiceAnalysisReport) -> str:
+    drift = report.drift
+    if drift is None:
+        return (
+            '<p class="muted-note">'
+            'Drift over time needs at least two full windows of ordered rolls.'
+            '</p>'
+        )
+
+    critical_value = chi_square_critical_value(report.dice_sides - 1)
+    chi_square_chart = _render_line_chart(
+        'Rolling-window chi-square',
+        drift.roll_index,
+        [('#2f7a72', drift.chi_square)],
+        y_max=max(max(drift.chi_square), critical_value) * 1.1,
+        reference_value=critical_value,
+        reference_label='alpha=0.05 critical value',
+    )
+    expected_share = 1 / report.dice_sides
+    face_series = [
+        (_FACE_LINE_COLORS[index % len(_FACE_LINE_COLORS)], [shares[index] for shares in drift.face_shares])
+        for index in range(report.dice_sides)
+    ]
+    shares_chart = _render_line_chart(
+        'Cumulative face shares',
+        drift.roll_index,
+        face_series,
+        y_max=max(max(max(shares) for shares in drift.face_shares), expected_share) * 1.1,
+        reference_value=expected_share,
+        reference_label='Expected share',
+    )
+    legend = ''.join(
+        f'<span class="legend-item"><span class="legend-swatch" style="background: {color}"></span>Face {index + 1}</span>'
+        for index, (color, _) in enumerate(face_series)
+    )
     return (
-      '<p class="muted-note">'
-      'Recent rolls are hidden for large sample sizes. '
-      'Use the distribution chart and frequency table for interpretation.'
-      '</p>'
+        f'<p>Chi-square over a sliding window of {drift.window_rolls} rolls.</p>'
+        f'<div class="chart">{chi_square_chart}</div>'
+        '<p>Share of each face over all rolls so far.</p>'
+        f'<div class="chart">{shares_chart}</div>'
+        f'<div class="legend">{legend}</div>'
     )
 
-    recent = report.ordered_rolls[-12:]
-    if not recent:
+
+def _render_recent_rolls(report: DiceAnalysisReport) -> str:
+    if not report.recent_rolls:
         return ''
 
     cells = ''.join(
         f'<span class="roll-chip">{value}</span>'
-        for value in recent
+        for value in report.recent_rolls
     )
     return f'<div class="roll-strip">{cells}</div>'
 
 
+def _render_sequential_decision(report: DiceAnalysisReport) -> str:
+    decision = report.sequential_decision
+    if decision is None:
+        return ''
+
+    return (
+        f'<p>Sequential verdict: <strong>{escape(decision.verdict)}</strong> after {decision.samples_used} rolls '
+        f'(log likelihood ratio {decision.log_likelihood_ratio:.3f}).</p>'
+        f'<p class="muted-note">{escape(decision.rule)}</p>'
+    )
+
+
 def _render_report_html(report: DiceAnalysisReport) -> str:
     expected_per_face = report.sample_count / report.dice_sides
     has_adequate_sample = expected_per_face >= 5.0
@@ -284,7 +754,8 @@ def _render_report_html(report: DiceAnalysisReport) -> str:
     )
     distribution_svg = _render_distribution_svg(report)
     recent_rolls = _render_recent_rolls(report)
-    recent_rolls_label = 'Recent rolls' if report.sample_count <= 1000 else 'Recent rolls (scaled view)'
+    sequential_decision = _render_sequential_decision(report)
+    drift_charts = _render_drift_charts(report)
     title = escape(f'Dice {report.dice_id} analysis report')
 
     return f'''<!DOCTYPE html>
@@ -417,6 +888,23 @@ def _render_report_html(report: DiceAnalysisReport) -> str:
       letter-spacing: 0.08em;
       font-size: 0.8rem;
     }}
+    .legend {{
+      display: flex;
+      flex-wrap: wrap;
+      gap: 14px;
+      margin-top: 12px;
+    }}
+    .legend-item {{
+      display: inline-flex;
+      align-items: center;
+      gap: 6px;
+      color: var(--muted);
+    }}
+    .legend-swatch {{
+      width: 14px;
+      height: 14px;
+      border-radius: 4px;
+    }}
     .roll-strip {{
       display: flex;
       flex-wrap: wrap;
@@ -469,11 +957,16 @@ def _render_report_html(report: DiceAnalysisReport) -> str:
       <span class="label">Statistical interpretation</span>
       <p>Sample adequacy (expected &gt;= 5 per face): <strong>{'PASS' if has_adequate_sample else 'LOW'}</strong></p>
       <p>{interpretation}</p>
+      {sequential_decision}
     </section>
     <section class="card wide">
       <span class="label">Observed distribution</span>
       <div class="chart">{distribution_svg}</div>
     </section>
+    <section class="card wide">
+      <span class="label">Drift over time</span>
+      {drift_charts}
+    </section>
     <section class="card wide">
       <span class="label">Face frequency table</span>
       <table>
@@ -489,7 +982,7 @@ def _render_report_html(report: DiceAnalysisReport) -> str:
           {frequencies}
         </tbody>
       </table>
-      <span class="label" style="margin-top: 18px; display: block;">{recent_rolls_label}</span>
+      <span class="label" style="margin-top: 18px; display: block;">Recent rolls</span>
       {recent_rolls}
     </section>
   </main>
@@ -498,8 +991,20 @@ def _render_report_html(report: DiceAnalysisReport) -> str:
 '''
 
 
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write text to path through a temporary sibling file, so readers never see a partial file."""
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as temp_file:
+            temp_file.write(text)
+        os.replace(temp_name, path)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
 def write_report(report: DiceAnalysisReport, output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / 'results.html'
-    output_path.write_text(_render_report_html(report), encoding='utf-8')
+    write_text_atomic(output_path, _render_report_html(report))
     return output_path
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+On-disk cache of analysis results keyed by the fingerprints of the dice they read.
+
+A die's fingerprint is its roll count, highest roll ID and side count, which
+change whenever it gains, loses or has its sides corrected. A cached result is
+stored under a digest of its namespace, the producing algorithm's version, any
+parameters, and the fingerprint of every die it depends on, so a per-group result
+is reused until one of that group's dice changes. Entries live in a small SQLite
+file and the least recently used ones are evicted past max_entries.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import hashlib
+from pathlib import Path
+import pickle
+import sqlite3
+import time
+from typing import Any
+
+from Scripts.Modules.Database.database import DBManager
+
+CACHE_FILENAME = 'analysis_cache.db'
+DEFAULT_MAX_ENTRIES = 100_000
+# Keys per SELECT, below SQLite's bound-parameter limit.
+_LOOKUP_CHUNK = 500
+
+
+def default_cache_path(db_path: Path) -> Path:
+    """Cache file kept beside the database, so results never mix between databases."""
+    return Path(db_path).parent / CACHE_FILENAME
+
+
+def die_fingerprint(roll_count: int, max_roll_id: int, dice_sides: int | None) -> str:
+    return f'rolls={roll_count};max_roll_id={max_roll_id};sides={dice_sides}'
+
+
+def read_die_fingerprints(db_path: Path, dice_ids: Iterable[str] | None = None) -> dict[str, str]:
+    """Return {dice_id: fingerprint} for every die with results, or only dice_ids."""
+    inputs = DBManager(db_path=db_path).read_report_inputs()
+    if dice_ids is not None:
+        inputs = {dice_id: inputs[dice_id] for dice_id in dice_ids if dice_id in inputs}
+    return {dice_id: die_fingerprint(*values) for dice_id, values in inputs.items()}
+
+
+def result_key(namespace: str, version: int, fingerprints: Mapping[str, str], dice_ids: Iterable[str], *params) -> str:
+    """Digest identifying one result: what produced it, from which dice and with which parameters."""
+    parts = [namespace, f'v{version}', *map(repr, params)]
+    parts.extend(f'{dice_id}={fingerprints[dice_id]}' for dice_id in dice_ids)
+    return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Pickled results by key in a SQLite file, trimmed to the max_entries most recently used."""
+
+    def __init__(self, path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30.0)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(
+            '''
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                last_used_ns INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_results_last_used ON results (last_used_ns);
+            '''
+        )
+
+    def __enter__(self) -> ResultCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Return {key: value} for the keys present, marking them as just used."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ', '.join('?' * len(chunk))
+            rows = self._conn.execute(f'SELECT key, value FROM results WHERE key IN ({placeholders})', chunk)
+            for key, value in rows:
+                try:
+                    found[key] = pickle.loads(value)
+                except Exception:
+                    # Written by an incompatible version of the result's class; recompute it.
+                    continue
+        if found:
+            now = time.time_ns()
+            with self._conn:
+                self._conn.executemany('UPDATE results SET last_used_ns = ? WHERE key = ?', [(now, key) for key in found])
+        return found
+
+    def put_many(self, items: Mapping[str, Any]) -> None:
+        """Store every item, then evict the least recently used entries over max_entries."""
+        if not items:
+            return
+        now = time.time_ns()
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO results (key, value, last_used_ns) VALUES (?, ?, ?)',
+                [(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), now) for key, value in items.items()],
+            )
+            excess = len(self) - self.max_entries
+            if excess > 0:
+                self._conn.execute(
+                    'DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used_ns, key LIMIT ?)',
+                    (excess,),
+                )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+
+
+VERDICT_FAIR = 'fair'
+VERDICT_BIASED = 'biased'
+VERDICT_UNDECIDED = 'undecided'
+
+
+@dataclass(frozen=True)
+class SequentialDecision:
+    verdict: str
+    samples_used: int
+    log_likelihood_ratio: float
+    effect_size: float
+    alpha: float
+    beta: float
+    lower_bound: float
+    upper_bound: float
+
+    @property
+    def decided(self) -> bool:
+        return self.verdict != VERDICT_UNDECIDED
+
+    @property
+    def rule(self) -> str:
+        return (
+            f'Dirichlet-multinomial SPRT (effect size w={self.effect_size:g}, '
+            f'alpha={self.alpha:g}, beta={self.beta:g}): biased when log LR >= {self.upper_bound:.3f}, '
+            f'fair when log LR <= {self.lower_bound:.3f}'
+        )
+
+
+class SequentialTest:
+    """Wald sequential probability ratio test of a fair die, updated once per roll.
+
+    H0 is the uniform die. H1 spreads its probability over biased dice with a
+    symmetric Dirichlet prior whose concentration makes the expected Cohen's w
+    equal effect_size, so the likelihood ratio is the Dirichlet-multinomial
+    predictive over the uniform one and each update costs O(1). The test stops
+    at the first roll where the log ratio leaves Wald's bounds
+    [log(beta / (1 - alpha)), log((1 - beta) / alpha)], with alpha the rate of
+    calling a fair die biased and beta the rate of calling a biased die fair.
+    """
+
+    def __init__(self, dice_sides: int, effect_size: float = 0.1, alpha: float = 0.05, beta: float = 0.05) -> None:
+        if dice_sides < 2:
+            raise ValueError('dice_sides must be at least 2')
+        if not 0.0 < effect_size < math.sqrt(dice_sides - 1):
+            raise ValueError(f'effect_size must be between 0 and {math.sqrt(dice_sides - 1):.3f}')
+        if not (0.0 < alpha < 1.0 and 0.0 < beta < 1.0 and alpha + beta < 1.0):
+            raise ValueError('alpha and beta must be in (0, 1) and sum to less than 1')
+
+        self.dice_sides = dice_sides
+        self.effect_size = effect_size
+        self.alpha = alpha
+        self.beta = beta
+        # Under Dirichlet(a, ..., a) the expected w^2 is (k - 1) / (k * a + 1).
+        self._concentration = ((dice_sides - 1) / effect_size ** 2 - 1.0) / dice_sides
+        self.lower_bound = math.log(beta / (1.0 - alpha))
+        self.upper_bound = math.log((1.0 - beta) / alpha)
+        self.sample_count = 0
+        self.log_likelihood_ratio = 0.0
+        self.verdict = VERDICT_UNDECIDED
+        self._counts = [0] * (dice_sides + 1)
+        self._log_sides = math.log(dice_sides)
+
+    @property
+    def decided(self) -> bool:
+        return self.verdict != VERDICT_UNDECIDED
+
+    def update(self, face: int) -> SequentialDecision:
+        """Add one roll and return the current decision; rolls after a verdict are ignored."""
+        if self.decided:
+            return self.decision()
+
+        face = int(face)
+        if not 1 <= face <= self.dice_sides:
+            raise ValueError(f'Found roll values outside 1..{self.dice_sides}: {[face]}')
+
+        predictive = (self._concentration + self._counts[face]) / (
+            self.dice_sides * self._concentration + self.sample_count
+        )
+        self.log_likelihood_ratio += math.log(predictive) + self._log_sides
+        self._counts[face] += 1
+        self.sample_count += 1
+
+        if self.log_likelihood_ratio >= self.upper_bound:
+            self.verdict = VERDICT_BIASED
+        elif self.log_likelihood_ratio <= self.lower_bound:
+            self.verdict = VERDICT_FAIR
+        return self.decision()
+
+    def update_many(self, faces) -> SequentialDecision:
+        """Feed rolls in order until a verdict is reached."""
+        for face in faces:
+            if self.update(face).decided:
+                break
+        return self.decision()
+
+    def decision(self) -> SequentialDecision:
+        return SequentialDecision(
+            verdict=self.verdict,
+            samples_used=self.sample_count,
+            log_likelihood_ratio=self.log_likelihood_ratio,
+            effect_size=self.effect_size,
+            alpha=self.alpha,
+            beta=self.beta,
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+        )
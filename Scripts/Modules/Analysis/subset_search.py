@@ -0,0 +1,174 @@
+"""
+Branch-and-bound search for the dice subsets whose pooled face counts are closest
+to (or furthest from) uniform, without enumerating every combination.
+
+Each die is a row of face counts. A subset's pooled deviation from uniform is the
+sum of its rows' deviation vectors d_j = counts_j - n_j / sides, so both objectives
+are a norm of that sum over the pooled sample count T:
+
+    chi_square = sides * ||D||_2^2 / T
+    tvd        = 0.5 * ||D||_1 / T
+
+While dice are being chosen, a projection onto the partial deviation (its unit
+vector for L2, its sign vector for L1) bounds how far the remaining picks can pull
+the sum back towards zero, which lets whole branches be skipped. The bounds are
+valid for any input, so the returned top-K matches full enumeration exactly.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, combinations
+from math import comb
+import heapq
+
+import numpy as np
+
+OBJECTIVE_CHI_SQUARE = 'chi_square'
+OBJECTIVE_TVD = 'tvd'
+OBJECTIVES = (OBJECTIVE_CHI_SQUARE, OBJECTIVE_TVD)
+
+# Branches with at most this many completions are scored in one vectorized block.
+LEAF_BLOCK_SIZE = 4096
+# Relative slack on pruning so floating-point rounding in a bound never drops a tie.
+_BOUND_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class SubsetScore:
+    indices: tuple[int, ...]
+    score: float
+
+
+def subset_scores(counts: np.ndarray, subsets: np.ndarray, objective: str = OBJECTIVE_CHI_SQUARE) -> np.ndarray:
+    """Score each row of subsets (row indices into counts) by the pooled objective."""
+    counts = np.asarray(counts, dtype=np.float64)
+    pooled = counts[np.asarray(subsets)].sum(axis=-2)
+    totals = pooled.sum(axis=-1)
+    return _objective(pooled - totals[..., None] / counts.shape[1], totals, objective)
+
+
+def _objective(deviations: np.ndarray, totals: np.ndarray, objective: str) -> np.ndarray:
+    if objective == OBJECTIVE_CHI_SQUARE:
+        return deviations.shape[-1] * np.square(deviations).sum(axis=-1) / totals
+    return 0.5 * np.abs(deviations).sum(axis=-1) / totals
+
+
+def search_subsets(
+    counts: np.ndarray,
+    group_size: int,
+    top_k: int = 1,
+    objective: str = OBJECTIVE_CHI_SQUARE,
+    largest: bool = False,
+) -> list[SubsetScore]:
+    """Return the top_k group_size-subsets of counts' rows, most uniform first.
+
+    counts is a (dice x faces) array of non-negative counts; rows may be
+    probabilities instead, which weights every die equally. With largest=True the
+    least uniform subsets are returned instead, worst first. Ties are broken by the
+    sorted row indices, so the result is deterministic.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    if counts.ndim != 2:
+        raise ValueError('counts must be a (dice x faces) array')
+    if objective not in OBJECTIVES:
+        raise ValueError(f'objective must be one of {OBJECTIVES}, got {objective!r}')
+    dice_count, sides = counts.shape
+    if not 1 <= group_size <= dice_count:
+        raise ValueError(f'group_size must be between 1 and {dice_count}, got {group_size}')
+    if top_k < 1:
+        raise ValueError('top_k must be at least 1')
+
+    sample_counts = counts.sum(axis=1)
+    if np.any(sample_counts <= 0):
+        raise ValueError('every die needs at least one roll')
+    deviations = counts - sample_counts[:, None] / sides
+    ord_ = 2 if objective == OBJECTIVE_CHI_SQUARE else 1
+    norms = np.linalg.norm(deviations, ord=ord_, axis=1)
+    # Searching for the largest scores is the same search on negated keys.
+    sign = -1.0 if largest else 1.0
+
+    # Max-heap of the best keys found so far, stored as (-key, negated indices).
+    best: list[tuple[float, tuple[int, ...]]] = []
+
+    def threshold() -> float:
+        if len(best) < top_k:
+            return np.inf
+        worst = -best[0][0]
+        return worst + _BOUND_TOLERANCE * max(abs(worst), 1.0)
+
+    def offer(key: float, indices: tuple[int, ...]) -> None:
+        item = (-key, tuple(-index for index in indices))
+        if len(best) < top_k:
+            heapq.heappush(best, item)
+        elif item > best[0]:
+            heapq.heapreplace(best, item)
+
+    def bound(partial: np.ndarray, partial_total: float, remaining: np.ndarray, picks: int) -> float:
+        """Lowest key any completion of the partial subset can reach."""
+        if not picks:
+            return sign * _objective_from_norm(np.linalg.norm(partial, ord=ord_), partial_total, sides, objective)
+        if largest:
+            # Triangle inequality: each pick can add at most its own norm.
+            reach = np.linalg.norm(partial, ord=ord_) + np.sort(norms[remaining])[-picks:].sum()
+            total = partial_total + np.sort(sample_counts[remaining])[:picks].sum()
+            return -_objective_from_norm(reach, total, sides, objective)
+        partial_norm = np.linalg.norm(partial, ord=ord_)
+        if partial_norm == 0.0:
+            return 0.0
+        # Dual-norm projection: ||D|| >= <direction, D> with ||direction||_dual = 1, and the
+        # remaining picks can lower that by at most their picks smallest projections.
+        direction = partial / partial_norm if ord_ == 2 else np.sign(partial)
+        pull = np.sort(deviations[remaining] @ direction)[:picks].sum()
+        reach = partial_norm + pull
+        total = partial_total + np.sort(sample_counts[remaining])[-picks:].sum()
+        return _objective_from_norm(max(reach, 0.0), total, sides, objective)
+
+    def visit(chosen: tuple[int, ...], partial: np.ndarray, partial_total: float, remaining: np.ndarray) -> None:
+        picks = group_size - len(chosen)
+        if not picks:
+            offer(sign * _objective_from_norm(np.linalg.norm(partial, ord=ord_), partial_total, sides, objective), tuple(sorted(chosen)))
+            return
+        if comb(len(remaining), picks) <= LEAF_BLOCK_SIZE:
+            # Few enough completions left to score them all at once.
+            completions = remaining[_combination_block(len(remaining), picks)]
+            keys = sign * _objective(
+                partial + deviations[completions].sum(axis=1),
+                partial_total + sample_counts[completions].sum(axis=1),
+                objective,
+            )
+            limit = threshold()
+            for position in np.flatnonzero(keys <= limit):
+                offer(float(keys[position]), tuple(sorted(chosen + tuple(completions[position].tolist()))))
+            return
+
+        # Explore the children that move the partial sum closest to the goal first.
+        step_keys = sign * _objective(partial + deviations[remaining], partial_total + sample_counts[remaining], objective)
+        order = remaining[np.argsort(step_keys, kind='stable')]
+        for position in range(len(order) - picks + 1):
+            index = int(order[position])
+            rest = order[position + 1:]
+            child = partial + deviations[index]
+            child_total = partial_total + sample_counts[index]
+            if bound(child, child_total, rest, picks - 1) > threshold():
+                continue
+            visit(chosen + (index,), child, child_total, rest)
+
+    visit((), np.zeros(sides), 0.0, np.arange(dice_count))
+    ranked = sorted((-negated_key, tuple(-index for index in negated)) for negated_key, negated in best)
+    return [SubsetScore(indices=indices, score=sign * key) for key, indices in ranked]
+
+
+def _objective_from_norm(norm: float, total: float, sides: int, objective: str) -> float:
+    if objective == OBJECTIVE_CHI_SQUARE:
+        return sides * norm * norm / total
+    return 0.5 * norm / total
+
+
+@lru_cache(maxsize=256)
+def _combination_block(count: int, picks: int) -> np.ndarray:
+    """Every picks-combination of range(count) as a read-only index array."""
+    block = np.fromiter(chain.from_iterable(combinations(range(count), picks)), dtype=np.int64).reshape(-1, picks)
+    block.flags.writeable = False
+    return block
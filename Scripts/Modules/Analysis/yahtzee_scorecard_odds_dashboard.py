@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from html import escape
 from itertools import combinations
 from math import comb, sqrt
 from pathlib import Path
 import argparse
-import sqlite3
 
-from Scripts.Modules.Database.database import DBPath
+import numpy as np
+
+from Scripts.Modules.Analysis.dice_pool import METHOD_DIRECT, face_count_distributions
+from Scripts.Modules.Analysis.result_cache import ResultCache, default_cache_path, read_die_fingerprints, result_key
+from Scripts.Modules.Analysis.subset_search import OBJECTIVE_CHI_SQUARE, search_subsets
+from Scripts.Modules.Database.database import DBManager, DBPath
 
 
 YAHTZEE_PREFIX = 'six_sided_yahtzee_'
+YAHTZEE_GROUP = 'six_sided_yahtzee'
 DEFAULT_HTML_OUTPUT_PATH = Path('Scripts/Modules/Database/Captures/yahtzee_scorecard_odds_dashboard.html')
 FACES = (1, 2, 3, 4, 5, 6)
+GROUP_SIZE = 5
+# Closest and furthest groups, by mean face distribution, given the full turn-odds evaluation
+# when there are too many combinations to evaluate them all.
+ODDS_CANDIDATE_COUNT = 250
+# Groups evaluated per task handed to a pool worker.
+GROUP_EVALUATION_CHUNK = 32
+# Groups shown at each end of the ranking: the closest and furthest tables.
+REPORTED_GROUP_COUNT = 10
+# Turn-odds engines: each labelled die with its own distribution, or the group's mean as i.i.d. dice.
+# Candidates are always ranked with the i.i.d. engine; the selected one only re-solves the reported groups.
+TURN_MODEL_EXACT = 'exact'
+TURN_MODEL_IID = 'iid'
+# Bump when the group odds computed for the same dice change, so cached groups are recomputed.
+ODDS_CACHE_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -33,41 +54,11 @@ def _format_group(dice_ids: tuple[str, ...]) -> str:
     return ', '.join(_format_die_name(dice_id) for dice_id in dice_ids)
 
 
-def _load_rows() -> dict[str, list[int]]:
-    connection = sqlite3.connect(DBPath)
-    connection.row_factory = sqlite3.Row
-    try:
-        rows = connection.execute(
-            '''
-            SELECT dice_id, dice_result
-            FROM test_results
-            WHERE dice_id LIKE ?
-            ORDER BY dice_id, timestamp
-            ''',
-            (f'{YAHTZEE_PREFIX}%',),
-        ).fetchall()
-    finally:
-        connection.close()
-
-    by_die: dict[str, list[int]] = {}
-    for row in rows:
-        by_die.setdefault(str(row['dice_id']), []).append(int(row['dice_result']))
-    return by_die
-
-
-def _face_probabilities(rolls_by_die: dict[str, list[int]]) -> dict[str, tuple[float, ...]]:
-    probabilities: dict[str, tuple[float, ...]] = {}
-    for dice_id, rolls in sorted(rolls_by_die.items()):
-        if not rolls:
-            raise ValueError(f'No rolls available for die {dice_id}')
-        counts = [0, 0, 0, 0, 0, 0]
-        for roll in rolls:
-            if roll < 1 or roll > 6:
-                raise ValueError(f'Invalid face value {roll} for die {dice_id}')
-            counts[roll - 1] += 1
-        total = float(len(rolls))
-        probabilities[dice_id] = tuple(count / total for count in counts)
-    return probabilities
+def _load_face_probabilities(db_path: Path = DBPath) -> dict[str, tuple[float, ...]]:
+    """Return each Yahtzee die's face probabilities from the aggregated face counts."""
+    count_matrix = DBManager(db_path=db_path).read_count_matrix(dice_group=YAHTZEE_GROUP, faces=len(FACES))
+    probabilities = count_matrix.counts / count_matrix.sample_counts[:, None]
+    return {dice_id: tuple(row.tolist()) for dice_id, row in zip(count_matrix.dice_ids, probabilities)}
 
 
 def _ordered_metric_labels() -> list[tuple[str, str]]:
@@ -178,106 +169,172 @@ def _multinomial_probability(counts: tuple[int, ...], probabilities: tuple[float
     return probability
 
 
+@lru_cache(maxsize=1)
+def _outcome_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Return (face_indices, indicators) for all 6^5 ordered outcomes of five dice.
+
+    face_indices[outcome, die] is the zero-based face that die shows, and
+    indicators[outcome, metric] is 1.0 when the outcome scores that metric, in
+    _ordered_metric_labels() order. Built once from the 252 distinct count states.
+    """
+    metric_keys = [key for key, _ in _ordered_metric_labels()]
+    face_indices = np.indices((len(FACES),) * GROUP_SIZE).reshape(GROUP_SIZE, -1).T
+    outcome_counts = np.zeros((len(face_indices), len(FACES)), dtype=np.int64)
+    for die in range(GROUP_SIZE):
+        outcome_counts[np.arange(len(face_indices)), face_indices[:, die]] += 1
+
+    states, outcome_states = np.unique(outcome_counts, axis=0, return_inverse=True)
+    state_indicators = np.array([
+        [_metrics_from_counts(tuple(state))[key] for key in metric_keys]
+        for state in states.tolist()
+    ])
+    indicators = state_indicators[outcome_states.reshape(-1)]
+    face_indices.flags.writeable = False
+    indicators.flags.writeable = False
+    return face_indices, indicators
+
+
 def _one_roll_metrics_exact(group_probs: tuple[tuple[float, ...], ...]) -> dict[str, float]:
-    # Exact by explicit 6^5 outcomes, preserving per-die biases.
-    values: dict[str, float] = {key: 0.0 for key, _ in _ordered_metric_labels()}
-    for d1 in FACES:
-        p1 = group_probs[0][d1 - 1]
-        for d2 in FACES:
-            p2 = group_probs[1][d2 - 1]
-            for d3 in FACES:
-                p3 = group_probs[2][d3 - 1]
-                for d4 in FACES:
-                    p4 = group_probs[3][d4 - 1]
-                    for d5 in FACES:
-                        p5 = group_probs[4][d5 - 1]
-                        probability = p1 * p2 * p3 * p4 * p5
-                        if probability == 0.0:
-                            continue
-                        counts = [0, 0, 0, 0, 0, 0]
-                        counts[d1 - 1] += 1
-                        counts[d2 - 1] += 1
-                        counts[d3 - 1] += 1
-                        counts[d4 - 1] += 1
-                        counts[d5 - 1] += 1
-                        signal = _metrics_from_counts(tuple(counts))
-                        for key in values:
-                            values[key] += probability * signal[key]
-    return values
+    # Face-count odds come straight from the dice-pool engine; full house and straights
+    # depend on the joint outcome, so they stay exact over all 6^5 ordered outcomes.
+    face_indices, indicators = _outcome_tables()
+    probabilities = np.asarray(group_probs, dtype=np.float64)
+    outcome_probabilities = np.prod(probabilities[np.arange(GROUP_SIZE), face_indices], axis=1)
+    metrics = {
+        key: float(value)
+        for (key, _), value in zip(_ordered_metric_labels()[1:4], outcome_probabilities @ indicators[:, 1:4])
+    }
 
+    count_distributions = face_count_distributions(probabilities, method=METHOD_DIRECT)
+    metrics['yahtzee_any'] = float(count_distributions[:, GROUP_SIZE].sum())
+    for face, distribution in zip(FACES, count_distributions):
+        metrics[f'at_least_3_face_{face}'] = float(distribution[3:].sum())
+        metrics[f'at_least_4_face_{face}'] = float(distribution[4:].sum())
+        metrics[f'exact_5_face_{face}'] = float(distribution[GROUP_SIZE])
+    return {key: metrics[key] for key, _ in _ordered_metric_labels()}
 
-def _turn_metrics_3roll_optimal_iid(group_probs: tuple[tuple[float, ...], ...]) -> dict[str, float]:
-    # Strategy-aware, up to two rerolls, modeled as i.i.d using the group's mean face distribution.
-    avg = tuple(sum(prob[face] for prob in group_probs) / 5.0 for face in range(6))
-    states = _all_count_states(5)
-    state_index = {state: index for index, state in enumerate(states)}
 
+@dataclass(frozen=True)
+class _TurnModel:
+    """Group-independent structure of the three-roll hold DP, as flat index arrays.
+
+    A hold action depends only on the dice kept, so transitions are stored once per
+    distinct keep: keep k moves to transition_next_states with the probability of
+    rerolling transition_outcomes (compositions in outcome_counts), for the slice
+    starting at transition_starts[k]. Each state's actions are the keeps in
+    action_keeps from action_starts[state]. Only the outcome probabilities depend
+    on the group's face distribution.
+    """
+    terminal_values: np.ndarray
+    action_starts: np.ndarray
+    action_keeps: np.ndarray
+    transition_starts: np.ndarray
+    transition_next_states: np.ndarray
+    transition_outcomes: np.ndarray
+    outcome_counts: np.ndarray
+    outcome_coefficients: np.ndarray
+    initial_outcomes: np.ndarray
+
+
+@lru_cache(maxsize=1)
+def _turn_model() -> _TurnModel:
+    states = _all_count_states(GROUP_SIZE)
+    state_index = {state: index for index, state in enumerate(states)}
     metric_keys = [key for key, _ in _ordered_metric_labels()]
-    metric_count = len(metric_keys)
 
-    # Terminal values for each state/metric.
-    terminal_values: list[list[float]] = []
-    for state in states:
-        metrics = _metrics_from_counts(state)
-        terminal_values.append([metrics[key] for key in metric_keys])
-
-    # Precompute multinomial outcomes and probabilities for reroll counts 0..5.
-    outcome_options: dict[int, tuple[tuple[tuple[int, ...], float], ...]] = {}
-    for reroll_count in range(6):
-        options: list[tuple[tuple[int, ...], float]] = []
-        for outcome in _compositions6(reroll_count):
-            probability = _multinomial_probability(outcome, avg)
-            if probability > 0.0:
-                options.append((outcome, probability))
-        outcome_options[reroll_count] = tuple(options)
-
-    # For each state and hold action, cache transition probabilities to next states.
-    transitions_by_state: list[list[tuple[tuple[int, float], ...]]] = []
+    # Kept dice and rerolled dice are both compositions of at most five dice.
+    outcomes = [outcome for reroll_count in range(GROUP_SIZE + 1) for outcome in _compositions6(reroll_count)]
+    outcome_index = {outcome: index for index, outcome in enumerate(outcomes)}
+
+    transition_starts: list[int] = []
+    next_states: list[int] = []
+    transition_outcomes: list[int] = []
+    for keep in outcomes:
+        transition_starts.append(len(next_states))
+        for outcome in _compositions6(GROUP_SIZE - sum(keep)):
+            next_states.append(state_index[tuple(keep[face] + outcome[face] for face in range(6))])
+            transition_outcomes.append(outcome_index[outcome])
+
+    action_starts: list[int] = []
+    action_keeps: list[int] = []
     for state in states:
-        state_transitions: list[tuple[tuple[int, float], ...]] = []
-        for keep in _all_keeps_for_state(state):
-            reroll_count = 5 - sum(keep)
-            transitions: list[tuple[int, float]] = []
-            for outcome, probability in outcome_options[reroll_count]:
-                next_state = tuple(keep[index] + outcome[index] for index in range(6))
-                transitions.append((state_index[next_state], probability))
-            state_transitions.append(tuple(transitions))
-        transitions_by_state.append(state_transitions)
-
-    initial_distribution = [
-        _multinomial_probability(state, avg)
-        for state in states
-    ]
+        action_starts.append(len(action_keeps))
+        action_keeps.extend(outcome_index[keep] for keep in _all_keeps_for_state(state))
+
+    model = _TurnModel(
+        terminal_values=np.array([[_metrics_from_counts(state)[key] for key in metric_keys] for state in states]),
+        action_starts=np.array(action_starts),
+        action_keeps=np.array(action_keeps),
+        transition_starts=np.array(transition_starts),
+        transition_next_states=np.array(next_states),
+        transition_outcomes=np.array(transition_outcomes),
+        outcome_counts=np.array(outcomes),
+        outcome_coefficients=np.array([_multinomial_probability(outcome, (1.0,) * 6) for outcome in outcomes]),
+        # A fresh roll of all five dice, in state order.
+        initial_outcomes=np.array([outcome_index[state] for state in states]),
+    )
+    for array in vars(model).values():
+        array.flags.writeable = False
+    return model
 
-    def _dp_step(next_values: list[list[float]]) -> list[list[float]]:
-        current_values: list[list[float]] = []
-        for state_actions in transitions_by_state:
-            best = [0.0] * metric_count
-            for action_transitions in state_actions:
-                expected = [0.0] * metric_count
-                for next_index, probability in action_transitions:
-                    row = next_values[next_index]
-                    for metric_index in range(metric_count):
-                        expected[metric_index] += probability * row[metric_index]
-                for metric_index in range(metric_count):
-                    if expected[metric_index] > best[metric_index]:
-                        best[metric_index] = expected[metric_index]
-            current_values.append(best)
-        return current_values
-
-    values_with_zero_rerolls = terminal_values
-    values_with_one_reroll = _dp_step(values_with_zero_rerolls)
-    values_with_two_rerolls = _dp_step(values_with_one_reroll)
-
-    start_values = [0.0] * metric_count
-    for state_probability, row in zip(initial_distribution, values_with_two_rerolls):
-        for metric_index in range(metric_count):
-            start_values[metric_index] += state_probability * row[metric_index]
-
-    return {
-        key: start_values[index]
-        for index, key in enumerate(metric_keys)
-    }
+
+def _turn_metrics_3roll_optimal_iid(group_probs: tuple[tuple[float, ...], ...]) -> dict[str, float]:
+    # Strategy-aware, up to two rerolls, modeled as i.i.d using the group's mean face distribution.
+    # Every metric gets its own optimal hold policy, so each DP step takes a per-metric max over actions.
+    model = _turn_model()
+    avg = np.asarray(group_probs, dtype=np.float64).mean(axis=0)
+    outcome_probabilities = model.outcome_coefficients * np.prod(avg ** model.outcome_counts, axis=1)
+    transition_probabilities = outcome_probabilities[model.transition_outcomes][:, None]
+
+    def _dp_step(next_values: np.ndarray) -> np.ndarray:
+        by_keep = np.add.reduceat(transition_probabilities * next_values[model.transition_next_states], model.transition_starts)
+        return np.maximum.reduceat(by_keep[model.action_keeps], model.action_starts)
+
+    values_with_two_rerolls = _dp_step(_dp_step(model.terminal_values))
+    start_values = outcome_probabilities[model.initial_outcomes] @ values_with_two_rerolls
+    return {key: float(value) for (key, _), value in zip(_ordered_metric_labels(), start_values)}
+
+
+def _best_hold_values(values: np.ndarray, probabilities: np.ndarray) -> np.ndarray:
+    """One reroll decision over labelled dice: the best expected value of every hold, per metric.
+
+    values has one axis per die (indexed by the face it shows) plus a metric axis.
+    Rerolling die i replaces axis i by its expectation under that die's own face
+    distribution, so the expectation for a rerolled set is built from the set
+    without its lowest die by one more contraction; all 2^5 holds cost 31 of them.
+    """
+    dice_count = probabilities.shape[0]
+    rerolled_values = [values]
+    best = values
+    for mask in range(1, 1 << dice_count):
+        die = (mask & -mask).bit_length() - 1
+        parent = rerolled_values[mask & (mask - 1)]
+        expected = np.expand_dims(np.tensordot(parent, probabilities[die], axes=([die], [0])), die)
+        rerolled_values.append(expected)
+        best = np.maximum(best, expected)
+    return best
+
+
+def _turn_metrics_3roll_optimal_exact(group_probs: tuple[tuple[float, ...], ...]) -> dict[str, float]:
+    # Strategy-aware, up to two rerolls, tracking which physical die is held or rerolled.
+    # The state is the face each labelled die shows (6^5 states, 2^5 holds); each die
+    # keeps its own measured distribution, so no i.i.d. approximation is made.
+    _, indicators = _outcome_tables()
+    probabilities = np.asarray(group_probs, dtype=np.float64)
+    values = indicators.reshape((len(FACES),) * GROUP_SIZE + (indicators.shape[1],))
+    for _ in range(2):
+        values = _best_hold_values(values, probabilities)
+
+    # The opening roll rerolls every die.
+    for die in reversed(range(GROUP_SIZE)):
+        values = np.tensordot(values, probabilities[die], axes=([die], [0]))
+    return {key: float(value) for (key, _), value in zip(_ordered_metric_labels(), values)}
+
+
+_TURN_ENGINES = {
+    TURN_MODEL_EXACT: _turn_metrics_3roll_optimal_exact,
+    TURN_MODEL_IID: _turn_metrics_3roll_optimal_iid,
+}
 
 
 def _distance_from_ideal(group_values: dict[str, float], ideal_values: dict[str, float]) -> float:
@@ -286,26 +343,117 @@ def _distance_from_ideal(group_values: dict[str, float], ideal_values: dict[str,
     return sqrt(squared_error_sum / len(keys))
 
 
-def _analyze_groups(probabilities_by_die: dict[str, tuple[float, ...]]) -> tuple[GroupOdds, GroupOdds, list[GroupOdds], dict[str, float], dict[str, float]]:
-    ideal_iid = tuple(tuple(1.0 / 6.0 for _ in range(6)) for _ in range(5))
+def _candidate_groups(probabilities_by_die: dict[str, tuple[float, ...]], candidate_count: int) -> list[tuple[str, ...]]:
+    """Pick the groups worth a full turn-odds evaluation.
+
+    Turn-odds distance from the ideal is zero for uniform dice and tracks how far the
+    group's mean face distribution is from uniform, so the groups whose mean is closest
+    to (and furthest from) uniform are searched for with branch-and-bound instead of
+    evaluating every combination. Exact when every combination fits in the budget.
+    """
+    dice_ids = sorted(probabilities_by_die)
+    if comb(len(dice_ids), GROUP_SIZE) <= 2 * candidate_count:
+        return list(combinations(dice_ids, GROUP_SIZE))
+
+    # Probability rows weight every die equally, matching a plain mean over the group.
+    rows = [probabilities_by_die[dice_id] for dice_id in dice_ids]
+    found = search_subsets(rows, GROUP_SIZE, top_k=candidate_count, objective=OBJECTIVE_CHI_SQUARE)
+    found += search_subsets(rows, GROUP_SIZE, top_k=candidate_count, objective=OBJECTIVE_CHI_SQUARE, largest=True)
+    return sorted({tuple(dice_ids[index] for index in item.indices) for item in found})
+
+
+def _evaluate_group(
+    dice_ids: tuple[str, ...],
+    group_probs: tuple[tuple[float, ...], ...],
+    ideal_turn_3roll: dict[str, float],
+    turn_model: str = TURN_MODEL_IID,
+) -> GroupOdds:
+    """Pool worker: one-roll and three-roll odds for one group."""
+    turn_3roll = _TURN_ENGINES[turn_model](group_probs)
+    return GroupOdds(
+        dice_ids=dice_ids,
+        one_roll=_one_roll_metrics_exact(group_probs),
+        turn_3roll=turn_3roll,
+        turn_distance=_distance_from_ideal(turn_3roll, ideal_turn_3roll),
+    )
+
+
+def _evaluate_groups(
+    groups: list[tuple[str, ...]],
+    probabilities_by_die: dict[str, tuple[float, ...]],
+    ideal_turn_3roll: dict[str, float],
+    turn_model: str,
+    workers: int | None,
+    cache: ResultCache | None,
+    fingerprints: dict[str, str] | None,
+) -> list[GroupOdds]:
+    """Return GroupOdds for groups, in order, evaluating only those missing from the cache."""
+    keys = {}
+    cached = {}
+    if cache is not None and fingerprints is not None:
+        keys = {
+            dice_ids: result_key('yahtzee_group_odds', ODDS_CACHE_VERSION, fingerprints, dice_ids, turn_model)
+            for dice_ids in groups
+        }
+        stored = cache.get_many(keys.values())
+        cached = {dice_ids: stored[key] for dice_ids, key in keys.items() if key in stored}
+
+    pending = [dice_ids for dice_ids in groups if dice_ids not in cached]
+    arguments = (
+        pending,
+        [tuple(probabilities_by_die[dice_id] for dice_id in dice_ids) for dice_ids in pending],
+        [ideal_turn_3roll] * len(pending),
+        [turn_model] * len(pending),
+    )
+    if workers == 1 or len(pending) <= GROUP_EVALUATION_CHUNK:
+        evaluated = list(map(_evaluate_group, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            evaluated = list(executor.map(_evaluate_group, *arguments, chunksize=GROUP_EVALUATION_CHUNK))
+    if keys:
+        cache.put_many({keys[group.dice_ids]: group for group in evaluated})
+
+    cached.update((group.dice_ids, group) for group in evaluated)
+    return [cached[dice_ids] for dice_ids in groups]
+
+
+def _analyze_groups(
+    probabilities_by_die: dict[str, tuple[float, ...]],
+    candidate_count: int = ODDS_CANDIDATE_COUNT,
+    workers: int | None = None,
+    turn_model: str = TURN_MODEL_EXACT,
+    cache: ResultCache | None = None,
+    fingerprints: dict[str, str] | None = None,
+) -> tuple[GroupOdds, GroupOdds, list[GroupOdds], dict[str, float], dict[str, float]]:
+    """Rank candidate groups by turn-odds distance from ideal dice.
+
+    Candidates are ranked with the i.i.d. turn model. Under the exact model, the
+    REPORTED_GROUP_COUNT groups at each end of that ranking are then re-solved per
+    die and reordered by their exact distance. With workers=1 the groups are
+    evaluated in this process; otherwise a process pool of that many workers
+    (default: one per CPU) shares them. Given a cache and each die's fingerprint,
+    only groups without a stored result are evaluated.
+    """
+    if len(probabilities_by_die) < GROUP_SIZE:
+        raise ValueError(f'Expected at least {GROUP_SIZE} Yahtzee dice, found {len(probabilities_by_die)}')
+
+    ideal_iid = tuple(tuple(1.0 / 6.0 for _ in range(6)) for _ in range(GROUP_SIZE))
     ideal_one_roll = _one_roll_metrics_exact(ideal_iid)
+    # Fair dice are identical, so every turn engine gives them the same odds.
     ideal_turn_3roll = _turn_metrics_3roll_optimal_iid(ideal_iid)
 
-    groups: list[GroupOdds] = []
-    for dice_ids in combinations(sorted(probabilities_by_die), 5):
-        group_probs = tuple(probabilities_by_die[dice_id] for dice_id in dice_ids)
-        one_roll = _one_roll_metrics_exact(group_probs)
-        turn_3roll = _turn_metrics_3roll_optimal_iid(group_probs)
-        groups.append(
-            GroupOdds(
-                dice_ids=dice_ids,
-                one_roll=one_roll,
-                turn_3roll=turn_3roll,
-                turn_distance=_distance_from_ideal(turn_3roll, ideal_turn_3roll),
-            )
-        )
-
-    ranked = sorted(groups, key=lambda item: item.turn_distance)
+    def evaluate(groups: list[tuple[str, ...]], model: str) -> list[GroupOdds]:
+        evaluated = _evaluate_groups(groups, probabilities_by_die, ideal_turn_3roll, model, workers, cache, fingerprints)
+        return sorted(evaluated, key=lambda item: item.turn_distance)
+
+    ranked = evaluate(_candidate_groups(probabilities_by_die, candidate_count), TURN_MODEL_IID)
+    if turn_model != TURN_MODEL_IID:
+        if len(ranked) <= 2 * REPORTED_GROUP_COUNT:
+            ranked = evaluate([group.dice_ids for group in ranked], turn_model)
+        else:
+            head = evaluate([group.dice_ids for group in ranked[:REPORTED_GROUP_COUNT]], turn_model)
+            tail = evaluate([group.dice_ids for group in ranked[-REPORTED_GROUP_COUNT:]], turn_model)
+            ranked = head + ranked[REPORTED_GROUP_COUNT:-REPORTED_GROUP_COUNT] + tail
     return ranked[0], ranked[-1], ranked, ideal_one_roll, ideal_turn_3roll
 
 
@@ -378,7 +526,23 @@ def _render_dashboard_html(
     ideal_one_roll: dict[str, float],
     ideal_turn_3roll: dict[str, float],
   generated_at: str,
+  dice_count: int,
+  turn_model: str = TURN_MODEL_EXACT,
 ) -> str:
+    if turn_model == TURN_MODEL_EXACT:
+        turn_model_note = (
+            "groups are ranked with each group's mean face probabilities as i.i.d. dice, then the "
+            f'{REPORTED_GROUP_COUNT} closest and {REPORTED_GROUP_COUNT} furthest are re-solved with each labelled die keeping its own measured face probabilities, '
+            'tracking which physical dice are held or rerolled over all 6^5 face states and 2^5 hold choices per roll'
+        )
+    else:
+        turn_model_note = "each five-die group is modeled as i.i.d per roll using that group's mean face probabilities, then solved exactly with dynamic programming over hold decisions"
+    group_count = comb(dice_count, GROUP_SIZE)
+    if len(ranked_groups) == group_count:
+        evaluated_note = f'all combinations of {GROUP_SIZE} from {dice_count} dice'
+    else:
+        evaluated_note = f'closest and furthest candidates of {group_count:,} combinations from {dice_count} dice'
+
     top_rows = ''.join(
         (
             '<tr>'
@@ -387,7 +551,7 @@ def _render_dashboard_html(
             f'<td>{group.turn_distance:.6f}</td>'
             '</tr>'
         )
-        for index, group in enumerate(ranked_groups[:10], start=1)
+        for index, group in enumerate(ranked_groups[:REPORTED_GROUP_COUNT], start=1)
     )
     bottom_rows = ''.join(
         (
@@ -397,7 +561,7 @@ def _render_dashboard_html(
             f'<td>{group.turn_distance:.6f}</td>'
             '</tr>'
         )
-        for index, group in enumerate(reversed(ranked_groups[-10:]), start=1)
+        for index, group in enumerate(reversed(ranked_groups[-REPORTED_GROUP_COUNT:]), start=1)
     )
 
     primary_rows = _render_primary_metric_rows(best_group, worst_group, ideal_turn_3roll)
@@ -565,7 +729,7 @@ def _render_dashboard_html(
       <h1>Ideal vs Your Dice</h1>
       <p>Generated: {escape(generated_at)}</p>
       <p>This dashboard is now prioritized around full-turn Yahtzee odds: initial roll plus up to two rerolls using an optimal hold policy for each scorecard event. Rankings use turn-based odds. One-roll probabilities are included as a secondary reference table.</p>
-      <p>Turn model note: to keep optimization tractable across all 252 groups and all events, each five-die group is modeled as i.i.d per roll using that group's mean face probabilities, then solved exactly with dynamic programming over hold decisions.</p>
+      <p>Turn model note: across all {len(ranked_groups)} evaluated groups and all events, {turn_model_note}.</p>
     </section>
 
     <section class="grid">
@@ -583,7 +747,7 @@ def _render_dashboard_html(
       </article>
       <article class="card">
         <span class="label">Groups Evaluated</span>
-        <div class="value">{len(ranked_groups)}<small>all combinations of 5 from 10 dice</small></div>
+        <div class="value">{len(ranked_groups)}<small>{evaluated_note}</small></div>
       </article>
     </section>
 
@@ -664,15 +828,22 @@ def _render_dashboard_html(
 '''
 
 
-def build_dashboard_html() -> str:
-  rows_by_die = _load_rows()
-  if len(rows_by_die) != 10:
-    raise ValueError(f'Expected 10 Yahtzee dice, found {len(rows_by_die)}')
-
-  probabilities_by_die = _face_probabilities(rows_by_die)
-  best_group, worst_group, ranked_groups, ideal_one_roll, ideal_turn_3roll = _analyze_groups(probabilities_by_die)
+def build_dashboard_html(
+  db_path: Path = DBPath,
+  workers: int | None = None,
+  turn_model: str = TURN_MODEL_EXACT,
+  cache_path: Path | None = None,
+) -> str:
+  probabilities_by_die = _load_face_probabilities(db_path)
+  if cache_path is None:
+    analysis = _analyze_groups(probabilities_by_die, workers=workers, turn_model=turn_model)
+  else:
+    fingerprints = read_die_fingerprints(db_path, probabilities_by_die)
+    with ResultCache(cache_path) as cache:
+      analysis = _analyze_groups(probabilities_by_die, workers=workers, turn_model=turn_model, cache=cache, fingerprints=fingerprints)
+  best_group, worst_group, ranked_groups, ideal_one_roll, ideal_turn_3roll = analysis
   generated_at = datetime.now().astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')
-  return _render_dashboard_html(best_group, worst_group, ranked_groups, ideal_one_roll, ideal_turn_3roll, generated_at)
+  return _render_dashboard_html(best_group, worst_group, ranked_groups, ideal_one_roll, ideal_turn_3roll, generated_at, len(probabilities_by_die), turn_model)
 
 
 def main() -> None:
@@ -685,9 +856,36 @@ def main() -> None:
     default=DEFAULT_HTML_OUTPUT_PATH,
     help='Path to the HTML dashboard to generate.',
   )
+  parser.add_argument(
+    '--db-path',
+    type=Path,
+    default=DBPath,
+    help='Database file to read results from.',
+  )
+  parser.add_argument(
+    '--workers',
+    type=int,
+    default=None,
+    help='Worker processes for group evaluation (default: one per CPU).',
+  )
+  parser.add_argument(
+    '--turn-model',
+    choices=(TURN_MODEL_EXACT, TURN_MODEL_IID),
+    default=TURN_MODEL_EXACT,
+    help=(
+      'Turn odds for the reported closest and furthest groups: the exact per-die model (default), '
+      'or each group\'s mean face probabilities as i.i.d. dice. Groups are always ranked with the i.i.d. model.'
+    ),
+  )
+  parser.add_argument(
+    '--no-cache',
+    action='store_true',
+    help='Recompute every group instead of reusing results cached beside the database.',
+  )
   args = parser.parse_args()
 
-  html = build_dashboard_html()
+  cache_path = None if args.no_cache else default_cache_path(args.db_path)
+  html = build_dashboard_html(args.db_path, workers=args.workers, turn_model=args.turn_model, cache_path=cache_path)
   args.html_output.parent.mkdir(parents=True, exist_ok=True)
   args.html_output.write_text(html, encoding='utf-8')
   print(f'Wrote HTML dashboard to {args.html_output}')
@@ -0,0 +1,326 @@
+"""
+Monte Carlo simulation of full 13-category Yahtzee games with measured dice.
+
+    python -m Scripts.Modules.Analysis.yahtzee_simulator [--games N] [--group 1,2,3,4,5 ...]
+
+Each of the five dice rolls from its own measured face distribution. Games are
+played in NumPy batches: every batch advances all of its games through the same
+turn and roll together, so the Python loop runs 13 x 3 times per batch no matter
+how many games it holds. Batches get independent streams spawned from one seed,
+so results do not depend on how many worker processes share them.
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import sqrt
+from pathlib import Path
+import time
+
+import numpy as np
+
+from Scripts.Modules.Database.database import DBManager, DBPath
+
+YAHTZEE_GROUP = 'six_sided_yahtzee'
+YAHTZEE_PREFIX = 'six_sided_yahtzee_'
+DICE_COUNT = 5
+FACES = 6
+TURNS = 13
+ROLLS_PER_TURN = 3
+DEFAULT_GAMES = 100_000
+DEFAULT_BATCH_SIZE = 50_000
+
+CATEGORIES = (
+    'ones', 'twos', 'threes', 'fours', 'fives', 'sixes',
+    'three_of_a_kind', 'four_of_a_kind', 'full_house',
+    'small_straight', 'large_straight', 'yahtzee', 'chance',
+)
+UPPER_CATEGORY_COUNT = 6
+THREE_OF_A_KIND, FOUR_OF_A_KIND, FULL_HOUSE, SMALL_STRAIGHT, LARGE_STRAIGHT, YAHTZEE, CHANCE = range(6, 13)
+UPPER_BONUS_THRESHOLD = 63
+UPPER_BONUS = 35
+YAHTZEE_BONUS = 100
+
+_SMALL_STRAIGHT_WINDOWS = ((0, 1, 2, 3), (1, 2, 3, 4), (2, 3, 4, 5))
+_LARGE_STRAIGHT_WINDOWS = ((0, 1, 2, 3, 4), (1, 2, 3, 4, 5))
+
+
+@dataclass(frozen=True)
+class Strategy:
+    """Heuristic play: hold toward the best open target, then score relative to par.
+
+    Each turn's score goes to the open category with the highest score minus its
+    par value, so a low roll is dumped where it costs least. With chase_straights,
+    a roll holding three or more faces of an open straight keeps one die per face
+    of that run instead of chasing a single face.
+    """
+    name: str
+    par_scores: tuple[float, ...]
+    chase_straights: bool = True
+
+
+# Immediate score only: each turn takes whatever box pays most right now.
+GREEDY_STRATEGY = Strategy(name='greedy', par_scores=(0.0,) * len(CATEGORIES), chase_straights=False)
+# Pars near a typical game's box averages, with upper boxes at three of their face.
+PAR_STRATEGY = Strategy(
+    name='par',
+    par_scores=(3.0, 6.0, 9.0, 12.0, 15.0, 18.0, 17.0, 8.0, 18.0, 22.0, 20.0, 12.0, 22.0),
+)
+STRATEGIES = {strategy.name: strategy for strategy in (GREEDY_STRATEGY, PAR_STRATEGY)}
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    dice_ids: tuple[str, ...]
+    games: int
+    mean_score: float
+    score_std: float
+    upper_bonus_rate: float
+    yahtzee_rate: float
+
+    @property
+    def standard_error(self) -> float:
+        return self.score_std / sqrt(self.games) if self.games else 0.0
+
+
+def score_table(counts: np.ndarray) -> np.ndarray:
+    """Return the (games x 13) box scores for rolls given as (games x 6) face counts."""
+    counts = np.asarray(counts)
+    face_values = np.arange(1, FACES + 1)
+    totals = counts @ face_values
+    most = counts.max(axis=1)
+    present = counts > 0
+    scores = np.zeros((len(counts), len(CATEGORIES)), dtype=np.int64)
+    scores[:, :UPPER_CATEGORY_COUNT] = counts * face_values
+    scores[:, THREE_OF_A_KIND] = np.where(most >= 3, totals, 0)
+    scores[:, FOUR_OF_A_KIND] = np.where(most >= 4, totals, 0)
+    scores[:, FULL_HOUSE] = np.where((counts == 3).any(axis=1) & (counts == 2).any(axis=1), 25, 0)
+    scores[:, SMALL_STRAIGHT] = np.where(_has_window(present, _SMALL_STRAIGHT_WINDOWS), 30, 0)
+    scores[:, LARGE_STRAIGHT] = np.where(_has_window(present, _LARGE_STRAIGHT_WINDOWS), 40, 0)
+    scores[:, YAHTZEE] = np.where(most == DICE_COUNT, 50, 0)
+    scores[:, CHANCE] = totals
+    return scores
+
+
+def _has_window(present: np.ndarray, windows) -> np.ndarray:
+    return np.any([present[:, list(window)].all(axis=1) for window in windows], axis=0)
+
+
+_COUNT_KEY_WEIGHTS = (DICE_COUNT + 1) ** np.arange(FACES)
+
+
+@lru_cache(maxsize=1)
+def _score_lookup() -> np.ndarray:
+    """Box scores for all 252 distinct hands, indexed by their face-count key, read-only."""
+    hands = np.array(list(combinations_with_replacement(range(FACES), DICE_COUNT)))
+    counts = (hands[:, :, None] == np.arange(FACES)).sum(axis=1)
+    lookup = np.zeros(((DICE_COUNT + 1) ** FACES, len(CATEGORIES)), dtype=np.int64)
+    lookup[counts @ _COUNT_KEY_WEIGHTS] = score_table(counts)
+    lookup.flags.writeable = False
+    return lookup
+
+
+def _face_counts(faces: np.ndarray) -> np.ndarray:
+    games = len(faces)
+    flat = (np.arange(games)[:, None] * FACES + faces).ravel()
+    return np.bincount(flat, minlength=games * FACES).reshape(games, FACES)
+
+
+def _roll(rng: np.random.Generator, cumulative: np.ndarray, games: int) -> np.ndarray:
+    """Draw zero-based faces for every die of every game from each die's own distribution."""
+    draws = rng.random((DICE_COUNT, games))
+    faces = np.stack([np.searchsorted(cumulative[die], draws[die], side='right') for die in range(DICE_COUNT)], axis=1)
+    return np.minimum(faces, FACES - 1)
+
+
+def _choose_holds(faces: np.ndarray, counts: np.ndarray, open_boxes: np.ndarray, strategy: Strategy) -> np.ndarray:
+    """Return a (games x 5) mask of the physical dice to keep for the next roll."""
+    # Of-a-kind target: the most common face whose upper or of-a-kind boxes are still useful,
+    # preferring higher faces on ties.
+    kind_open = open_boxes[:, [THREE_OF_A_KIND, FOUR_OF_A_KIND, YAHTZEE]].any(axis=1, keepdims=True)
+    useful = open_boxes[:, :UPPER_CATEGORY_COUNT] | kind_open
+    useful[~useful.any(axis=1)] = True
+    weights = np.where(useful, counts + np.arange(FACES) / 10.0, -1.0)
+    target = weights.argmax(axis=1)
+    holds = faces == target[:, None]
+
+    if strategy.chase_straights:
+        present = counts > 0
+        # Straight target: the open small-straight window with the most faces present.
+        window_hits = np.stack([present[:, list(window)].sum(axis=1) for window in _SMALL_STRAIGHT_WINDOWS], axis=1)
+        best_window = window_hits.argmax(axis=1)
+        straights_open = open_boxes[:, SMALL_STRAIGHT] | open_boxes[:, LARGE_STRAIGHT]
+        chase = straights_open & (window_hits.max(axis=1) >= 3) & (counts.max(axis=1) <= 2)
+        if chase.any():
+            window_start = best_window[:, None]
+            in_window = (faces >= window_start) & (faces < window_start + 4)
+            # A large straight in hand, or a chance at one, keeps the fifth face too.
+            large_open = open_boxes[:, LARGE_STRAIGHT][:, None]
+            in_window |= large_open & (faces == window_start + 4) & (window_start + 4 < FACES)
+            in_window |= large_open & (faces == window_start - 1) & (window_start > 0)
+            earlier = np.tril(np.ones((DICE_COUNT, DICE_COUNT), dtype=bool), k=-1)
+            first_of_face = ~((faces[:, :, None] == faces[:, None, :]) & earlier).any(axis=2)
+            holds = np.where(chase[:, None], in_window & first_of_face, holds)
+
+    # A finished large straight or Yahtzee that can still be scored is kept whole.
+    scores = _score_lookup()[counts @ _COUNT_KEY_WEIGHTS]
+    made = (scores[:, LARGE_STRAIGHT] > 0) & open_boxes[:, LARGE_STRAIGHT]
+    made |= scores[:, YAHTZEE] > 0
+    holds[made] = True
+    return holds
+
+
+def _play_batch(probabilities: np.ndarray, games: int, seed: np.random.SeedSequence, strategy: Strategy) -> np.ndarray:
+    """Play games full games and return (final scores, upper bonus hit, any yahtzee) as a (games x 3) array."""
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(probabilities, axis=1)
+    cumulative[:, -1] = 1.0
+    par = np.asarray(strategy.par_scores, dtype=np.float64)
+    rows = np.arange(games)
+
+    open_boxes = np.ones((games, len(CATEGORIES)), dtype=bool)
+    box_scores = np.zeros((games, len(CATEGORIES)), dtype=np.int64)
+    yahtzee_bonus = np.zeros(games, dtype=np.int64)
+    for _ in range(TURNS):
+        faces = _roll(rng, cumulative, games)
+        for _ in range(ROLLS_PER_TURN - 1):
+            holds = _choose_holds(faces, _face_counts(faces), open_boxes, strategy)
+            faces = np.where(holds, faces, _roll(rng, cumulative, games))
+
+        scores = _score_lookup()[_face_counts(faces) @ _COUNT_KEY_WEIGHTS]
+        # A further Yahtzee after scoring 50 in its box earns the bonus wherever it is placed.
+        yahtzee_bonus += np.where((scores[:, YAHTZEE] > 0) & (box_scores[:, YAHTZEE] == 50), YAHTZEE_BONUS, 0)
+        utility = np.where(open_boxes, scores - par, -np.inf)
+        choice = utility.argmax(axis=1)
+        box_scores[rows, choice] = scores[rows, choice]
+        open_boxes[rows, choice] = False
+
+    upper_bonus = box_scores[:, :UPPER_CATEGORY_COUNT].sum(axis=1) >= UPPER_BONUS_THRESHOLD
+    totals = box_scores.sum(axis=1) + np.where(upper_bonus, UPPER_BONUS, 0) + yahtzee_bonus
+    return np.stack([totals, upper_bonus, box_scores[:, YAHTZEE] > 0], axis=1)
+
+
+def _run_batch(task: tuple[int, np.ndarray, int, np.random.SeedSequence, Strategy]) -> tuple[int, int, float, float, int, int]:
+    """Pool worker: play one batch and return (group index, games, score sum, sum of squares, bonuses, yahtzees)."""
+    group_index, probabilities, games, seed, strategy = task
+    results = _play_batch(probabilities, games, seed, strategy)
+    totals = results[:, 0].astype(np.float64)
+    return (
+        group_index,
+        games,
+        float(totals.sum()),
+        float(np.square(totals).sum()),
+        int(results[:, 1].sum()),
+        int(results[:, 2].sum()),
+    )
+
+
+def simulate_groups(
+    probabilities_by_die: dict[str, tuple[float, ...]],
+    groups: list[tuple[str, ...]],
+    games: int = DEFAULT_GAMES,
+    strategy: Strategy = PAR_STRATEGY,
+    seed: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    workers: int | None = None,
+) -> list[SimulationResult]:
+    """Simulate games full games for each 5-die group, best expected score first.
+
+    Each group's batches draw from streams spawned from (seed, group position), so
+    a group's result is reproducible on its own. With workers=1 the batches run in
+    this process; otherwise a process pool of that many workers (default: one per
+    CPU) shares them.
+    """
+    if games < 1:
+        raise ValueError('games must be at least 1')
+    tasks = []
+    for group_index, dice_ids in enumerate(groups):
+        if len(dice_ids) != DICE_COUNT:
+            raise ValueError(f'Yahtzee groups need {DICE_COUNT} dice, got {len(dice_ids)}')
+        probabilities = np.array([probabilities_by_die[dice_id] for dice_id in dice_ids], dtype=np.float64)
+        batch_games = [batch_size] * (games // batch_size) + ([games % batch_size] if games % batch_size else [])
+        streams = np.random.SeedSequence([seed, group_index]).spawn(len(batch_games))
+        tasks.extend(
+            (group_index, probabilities, count, stream, strategy)
+            for count, stream in zip(batch_games, streams)
+        )
+
+    if workers == 1 or len(tasks) <= 1:
+        batches = list(map(_run_batch, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(executor.map(_run_batch, tasks))
+
+    sums = np.zeros((len(groups), 5))
+    for group_index, *values in batches:
+        sums[group_index] += values
+
+    results = []
+    for dice_ids, (played, score_sum, square_sum, bonuses, yahtzees) in zip(groups, sums):
+        mean = float(score_sum / played)
+        results.append(
+            SimulationResult(
+                dice_ids=tuple(dice_ids),
+                games=int(played),
+                mean_score=mean,
+                score_std=sqrt(max(square_sum / played - mean * mean, 0.0)),
+                upper_bonus_rate=float(bonuses / played),
+                yahtzee_rate=float(yahtzees / played),
+            )
+        )
+    return sorted(results, key=lambda item: -item.mean_score)
+
+
+def _load_face_probabilities(db_path: Path) -> dict[str, tuple[float, ...]]:
+    count_matrix = DBManager(db_path=db_path).read_count_matrix(dice_group=YAHTZEE_GROUP, faces=FACES)
+    probabilities = count_matrix.counts / count_matrix.sample_counts[:, None]
+    return {dice_id: tuple(row.tolist()) for dice_id, row in zip(count_matrix.dice_ids, probabilities)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Simulate full Yahtzee games with measured dice and rank 5-die groups.')
+    parser.add_argument('--db-path', type=Path, default=DBPath, help='Database file to read results from.')
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help='Games to simulate per group.')
+    parser.add_argument('--strategy', choices=sorted(STRATEGIES), default=PAR_STRATEGY.name, help='Hold and scoring heuristic.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for reproducible streams.')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per CPU).')
+    parser.add_argument(
+        '--group',
+        action='append',
+        dest='groups',
+        help='Comma-separated die numbers to simulate, e.g. 1,2,3,4,5; repeatable. Default: every 5-die group.',
+    )
+    parser.add_argument('--top', type=int, default=10, help='Groups to print.')
+    args = parser.parse_args()
+
+    probabilities_by_die = _load_face_probabilities(args.db_path)
+    if args.groups:
+        groups = [tuple(f'{YAHTZEE_PREFIX}{name.strip()}' for name in group.split(',')) for group in args.groups]
+    else:
+        groups = list(combinations(sorted(probabilities_by_die), DICE_COUNT))
+
+    started = time.perf_counter()
+    results = simulate_groups(
+        probabilities_by_die,
+        groups,
+        games=args.games,
+        strategy=STRATEGIES[args.strategy],
+        seed=args.seed,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - started
+    print(f'Simulated {len(groups) * args.games:,} games in {elapsed:.1f} s ({args.strategy} strategy)')
+    for rank, result in enumerate(results[:args.top], start=1):
+        names = ', '.join(dice_id.removeprefix(YAHTZEE_PREFIX) for dice_id in result.dice_ids)
+        print(
+            f'{rank:>3}. {names}: {result.mean_score:.2f} +/- {result.standard_error:.2f}, '
+            f'upper bonus {result.upper_bonus_rate * 100:.1f}%, Yahtzee {result.yahtzee_rate * 100:.1f}%'
+        )
+
+
+if __name__ == '__main__':
+    main()
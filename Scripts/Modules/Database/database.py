@@ -3,83 +3,822 @@ I basically let the VSCode AI write this section - I'm curious if I could have s
 """
 
 # Database support imports
-from datetime import datetime
+from datetime import datetime, timedelta
 import sqlite3
+import builtins
+import json
 
 # Parallelism support imports
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import hashlib
+from multiprocessing.connection import AuthenticationError, Client, Connection
+import os
+import re
+import sys
+import tempfile
 import threading
 import queue
+import time
 
 # Datatype support imports
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+import numpy as np
 
 # Project module imports
 from Scripts.Modules.queue_data import QueueData, Command as QuCmd
 
 DBPath = Path("/Users/georgeburrows/Documents/Desktop/Projects/Die Tester/Dice_Tester/Scripts/Modules/Database/dice.db")
+CaptureRoot = DBPath.parent / "Captures"
+
+# PRAGMA user_version values. Version 2 is the normalized dice/rolls layout,
+# version 3 adds the materialized die_stats/die_face_counts aggregates,
+# version 4 the id_sequences allocator, version 5 the roll_tombstones change
+# feed, version 6 the rolls image index and version 7 die_stats.max_roll_id;
+# anything older still keeps every row in the legacy test_results table.
+SCHEMA_VERSION = 7
+DICE_ID_SEQUENCE = "dice_id"
+# id_sequences row holding the highest tombstone_id pruned so far.
+TOMBSTONES_PRUNED_SEQUENCE = "roll_tombstones_pruned_through"
+# The writer keeps at most this many of the newest tombstones; change-feed consumers
+# further behind than that are told to reload (see ChangeSet.missed_deletes).
+TOMBSTONE_RETENTION_ROWS = 100_000
+_LEGACY_MIGRATION_CHUNK = 5000
+
+_EPOCH = datetime(1970, 1, 1)
+_GROUP_SUFFIX = re.compile(r"^(?P<group>.+)_\d+$")
+
+# Group-commit limits for the writer thread. A batch is committed as soon as the
+# queue runs dry, it reaches the row limit, or it has been open for the latency limit.
+WRITE_BATCH_MAX_ROWS = 500
+WRITE_BATCH_MAX_LATENCY = 0.05
+
+# Connection tuning shared by the writer and the persistent read connections.
+# A negative cache_size is in KiB, so each connection keeps up to 32 MiB of pages.
+CONNECTION_CACHE_SIZE_KIB = 32768
+CONNECTION_MMAP_SIZE = 256 * 1024 * 1024
+CONNECTION_STATEMENT_CACHE = 256
+
+# Rows pulled per fetchmany() call by the streaming and columnar readers.
+RESULT_CHUNK_ROWS = 10000
+
+# Rolls inserted per executemany() call while the writer loads an import_results() file.
+IMPORT_CHUNK_ROWS = 50000
+
+# Delay before a writer thread looks for the writer service again after finding it
+# unreachable, doubled after each miss up to the maximum.
+WRITER_SERVICE_RETRY_INITIAL = 0.5
+WRITER_SERVICE_RETRY_MAX = 30.0
+
+# Suffix of the 0600 file holding the per-instance IPC key of the writer service.
+WRITER_SERVICE_KEY_SUFFIX = ".key"
+
+# Layout version written into every export_results() file. Version 2 stores image
+# paths as concatenated UTF-8 bytes sliced by an image_offsets array.
+EXPORT_FORMAT_VERSION = 2
+
+
+def timestamp_to_us(timestamp: str | datetime) -> int:
+    """Convert a naive wall-clock timestamp to integer microseconds since 1970-01-01.
+
+    Timestamps are recorded as local wall-clock time, so the conversion treats them
+    as if they were UTC. That keeps the round trip exact and free of DST jumps.
+    """
+    value = datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def us_to_timestamp(timestamp_us: int) -> str:
+    """Format integer microseconds from timestamp_to_us() as an ISO timestamp string."""
+    value = _EPOCH + timedelta(microseconds=int(timestamp_us))
+    return value.isoformat(timespec="milliseconds" if timestamp_us % 1000 == 0 else "microseconds")
+
+
+def _writer_service_digest(db_path: Path) -> str:
+    return hashlib.sha1(str(Path(db_path).expanduser().resolve()).encode("utf-8")).hexdigest()[:16]
+
+
+def writer_service_address(db_path: Path) -> tuple[str, str]:
+    """Return the (address, family) the writer service for db_path listens on.
+
+    The address is derived from the resolved database path, so every process
+    pointing at the same file finds the same service.
+    """
+    digest = _writer_service_digest(db_path)
+    if sys.platform == "win32":
+        return rf"\\.\pipe\dice-writer-{digest}", "AF_PIPE"
+    return str(Path(tempfile.gettempdir()) / f"dice-writer-{digest}.sock"), "AF_UNIX"
+
+
+def writer_service_key_path(db_path: Path) -> Path:
+    """Return the file the writer service for db_path keeps its IPC key in, beside its socket."""
+    return Path(tempfile.gettempdir()) / f"dice-writer-{_writer_service_digest(db_path)}{WRITER_SERVICE_KEY_SUFFIX}"
+
+
+def read_writer_service_key(db_path: Path) -> bytes | None:
+    """Return the running service's IPC key, or None if no readable key file exists."""
+    try:
+        return writer_service_key_path(db_path).read_bytes() or None
+    except OSError:
+        return None
+
+
+def connect_writer_service(db_path: Path) -> Connection | None:
+    """Connect to the writer service for db_path, or return None if it is not running."""
+    address, family = writer_service_address(db_path)
+    if family == "AF_UNIX" and not os.path.exists(address):
+        return None
+    authkey = read_writer_service_key(db_path)
+    if authkey is None:
+        return None
+    try:
+        return Client(address, family=family, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def send_writer_message(conn: Connection, message) -> None:
+    """Send one JSON message over a writer service connection."""
+    conn.send_bytes(json.dumps(message, separators=(",", ":")).encode("utf-8"))
+
+
+def recv_writer_message(conn: Connection):
+    """Receive one JSON message from a writer service connection."""
+    return json.loads(conn.recv_bytes())
+
+
+def writer_error_message(error: BaseException) -> dict:
+    """Describe a failed command for the writer service's acknowledgement."""
+    return {"error": type(error).__name__, "message": str(error)}
+
+
+def writer_error_from_message(message: dict) -> Exception:
+    """Rebuild the exception described by writer_error_message().
+
+    sqlite3 and builtin exception types are restored as themselves; anything else
+    becomes a RuntimeError carrying the original type name.
+    """
+    name, text = str(message.get("error")), str(message.get("message", ""))
+    for namespace in (sqlite3, builtins):
+        error_type = getattr(namespace, name, None)
+        if isinstance(error_type, type) and issubclass(error_type, Exception):
+            return error_type(text)
+    return RuntimeError(f"{name}: {text}")
+
+
+def _pack_images(images: list[str]) -> dict[str, np.ndarray]:
+    """Pack image paths into one UTF-8 byte array plus the int64 offsets that slice it.
+
+    Path i is images[image_offsets[i]:image_offsets[i + 1]], so any character,
+    newlines included, survives the round trip.
+    """
+    encoded = [image.encode("utf-8") for image in images]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(image) for image in encoded], out=offsets[1:])
+    return {
+        "images": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "image_offsets": offsets,
+    }
+
+
+def _unpack_images(columns: dict[str, np.ndarray], start: int = 0, stop: int | None = None) -> list[str]:
+    """Return the image paths packed by _pack_images(), or only paths start:stop."""
+    offsets = columns["image_offsets"][start:None if stop is None else stop + 1].tolist()
+    base = offsets[0]
+    data = columns["images"][base:offsets[-1]].tobytes()
+    return [data[begin - base:end - base].decode("utf-8") for begin, end in zip(offsets, offsets[1:])]
+
+
+def default_dice_group(dice_id: str) -> str | None:
+    """Return the set tag implied by a dice ID such as 'six_sided_yahtzee_3', if any."""
+    match = _GROUP_SUFFIX.match(str(dice_id))
+    return match.group("group") if match else None
+
+
+@dataclass(frozen=True)
+class DieStats:
+    """Aggregates for one die, read from the die_stats and die_face_counts tables."""
+    dice_id: str
+    dice_sides: int | None
+    roll_count: int
+    roll_sum: int
+    repeat_pairs: int
+    current_streak: int
+    longest_streak_value: int | None
+    longest_streak_length: int
+    last_result: int | None
+    first_timestamp: str | None
+    last_timestamp: str | None
+    face_counts: dict[int, int]
+
+    @property
+    def mean_roll(self) -> float | None:
+        return self.roll_sum / self.roll_count if self.roll_count else None
+
+
+@dataclass(frozen=True)
+class ChangeWatermark:
+    """Position in the change feed: the last roll_id and tombstone_id a consumer has applied."""
+    roll_id: int = 0
+    tombstone_id: int = 0
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Rolls added and removed since a watermark, plus the watermark to resume from.
+
+    rows are public row dicts with an extra roll_id key, in roll_id order. deleted
+    holds dice_id, timestamp, dice_result and roll_id for removed rolls that an
+    earlier ChangeSet had already delivered. missed_deletes is set when tombstones
+    after the given watermark were pruned before they could be read, so the consumer
+    has to reload the dice it follows from scratch.
+    """
+    rows: list[dict]
+    deleted: list[dict]
+    watermark: ChangeWatermark
+    missed_deletes: bool = False
+
+
+@dataclass(frozen=True, eq=False)
+class RollColumns:
+    """One die's rolls as parallel arrays in timestamp order.
+
+    faces holds the rolled values as uint8 and timestamps_us the matching
+    timestamp_to_us() values as int64.
+    """
+    dice_id: str
+    dice_sides: int | None
+    faces: np.ndarray
+    timestamps_us: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.faces)
+
+
+@dataclass(frozen=True, eq=False)
+class FaceCountMatrix:
+    """Per-face roll counts for several dice as one dense array.
+
+    counts has one row per entry of dice_ids and one column per face, with face f
+    in column f - 1; sample_counts holds each row's total.
+    """
+    dice_ids: tuple[str, ...]
+    dice_sides: tuple[int | None, ...]
+    counts: np.ndarray
+    sample_counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dice_ids)
+
+
+def _summarize_die_rolls(cursor, dice_ref: int) -> tuple[tuple, dict[int, int]] | None:
+    """Recompute one die's die_stats row and face counts from its rolls.
+
+    Mirrors the die_stats_after_insert trigger, so the result matches the row the
+    trigger would have produced by appending the same rolls one at a time. Returns
+    None when the die has no rolls.
+    """
+    cursor.execute(
+        "SELECT dice_result, timestamp_us, roll_id FROM rolls WHERE dice_ref = ? ORDER BY timestamp_us",
+        (dice_ref,),
+    )
+    blocks = []
+    while True:
+        chunk = cursor.fetchmany(RESULT_CHUNK_ROWS)
+        if not chunk:
+            break
+        blocks.append(np.array(chunk, dtype=np.int64))
+    if not blocks:
+        return None
+
+    rolls = np.concatenate(blocks)
+    faces = rolls[:, 0]
+    # Runs of one face, split where the face changes; ties keep the earliest run.
+    run_starts = np.flatnonzero(faces[1:] != faces[:-1]) + 1
+    boundaries = np.concatenate(([0], run_starts, [faces.size]))
+    run_lengths = np.diff(boundaries)
+    longest_run = int(np.argmax(run_lengths))
+    values, counts = np.unique(faces, return_counts=True)
+
+    stats_row = (
+        dice_ref,
+        int(faces.size),
+        int(faces.sum()),
+        int(faces.size - run_lengths.size),
+        int(run_lengths[-1]),
+        int(run_lengths[longest_run]),
+        int(faces[boundaries[longest_run]]),
+        int(faces[-1]),
+        int(rolls[0, 1]),
+        int(rolls[-1, 1]),
+        int(rolls[:, 2].max()),
+    )
+    return stats_row, dict(zip(values.tolist(), counts.tolist()))
+
+
+_DIE_STATS_COLUMNS = (
+    "dice_ref, roll_count, roll_sum, repeat_pairs, current_streak, longest_streak, "
+    "longest_streak_value, last_result, first_timestamp_us, last_timestamp_us, max_roll_id"
+)
+
+# Keeps die_stats/die_face_counts current as rolls are appended. Kept separate so
+# import_results() can drop it for the length of a bulk load and recreate it.
+_DIE_STATS_INSERT_TRIGGER_SQL = """
+    CREATE TRIGGER IF NOT EXISTS die_stats_after_insert AFTER INSERT ON rolls
+    BEGIN
+        UPDATE die_stats SET stale = 1
+        WHERE dice_ref = NEW.dice_ref AND last_timestamp_us > NEW.timestamp_us;
+
+        INSERT INTO die_stats (
+            dice_ref, roll_count, roll_sum, repeat_pairs, current_streak, longest_streak,
+            longest_streak_value, last_result, first_timestamp_us, last_timestamp_us, max_roll_id
+        )
+        VALUES (
+            NEW.dice_ref, 1, NEW.dice_result, 0, 1, 1,
+            NEW.dice_result, NEW.dice_result, NEW.timestamp_us, NEW.timestamp_us, NEW.roll_id
+        )
+        ON CONFLICT (dice_ref) DO UPDATE SET
+            roll_count = roll_count + 1,
+            roll_sum = roll_sum + excluded.roll_sum,
+            repeat_pairs = repeat_pairs + (last_result IS excluded.last_result),
+            current_streak = CASE WHEN last_result IS excluded.last_result THEN current_streak + 1 ELSE 1 END,
+            longest_streak = MAX(
+                longest_streak,
+                CASE WHEN last_result IS excluded.last_result THEN current_streak + 1 ELSE 1 END
+            ),
+            longest_streak_value = CASE
+                WHEN last_result IS excluded.last_result AND current_streak + 1 > longest_streak
+                    THEN excluded.last_result
+                ELSE longest_streak_value
+            END,
+            last_result = excluded.last_result,
+            last_timestamp_us = excluded.last_timestamp_us,
+            max_roll_id = excluded.max_roll_id
+        WHERE NOT stale;
+
+        INSERT INTO die_face_counts (dice_ref, face, count)
+        VALUES (NEW.dice_ref, NEW.dice_result, 1)
+        ON CONFLICT (dice_ref, face) DO UPDATE SET count = count + 1;
+    END;
+"""
+
+# Deletes tombstones up to an ID and raises the pruned-watermark sequence to match.
+_PRUNE_TOMBSTONES_SQL = (
+    "DELETE FROM roll_tombstones WHERE tombstone_id <= ?",
+    """
+    INSERT INTO id_sequences (name, next_value) VALUES (?, ?)
+    ON CONFLICT (name) DO UPDATE SET next_value = MAX(next_value, excluded.next_value)
+    """,
+)
+
+# Marks a die's aggregates for an exact rebuild. Inserting the placeholder row
+# covers dice whose rolls were written before they had a die_stats row at all.
+_MARK_STATS_STALE_SQL = """
+    INSERT INTO die_stats (dice_ref, stale)
+    SELECT dice_ref, 1 FROM dice WHERE (? IS NULL OR name = ?)
+    ON CONFLICT (dice_ref) DO UPDATE SET stale = 1
+"""
+
+
+# Commands the writer executes on their own because they return a result.
+_STANDALONE_COMMANDS = (QuCmd.DB_QUERY_STATEMENTS, QuCmd.DB_IMPORT_RESULTS)
+
+
+@dataclass
+class _PendingWrite:
+    """A queued database command plus the future resolved once it is committed."""
+    item: QueueData
+    future: Future = field(default_factory=Future)
+
+
+class ConnectionManager:
+    """Process-wide owner of one database file's schema setup and read connections.
+
+    Every DBManager pointing at the same file shares one instance, so the schema is
+    initialized once per process and each thread keeps a single tuned read connection
+    (with its prepared-statement cache) instead of reconnecting for every query.
+    """
+
+    _instances: dict[tuple[int, Path], "ConnectionManager"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._local = threading.local()
+        self._read_connections: list[sqlite3.Connection] = []
+        self._read_connections_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, db_path: Path) -> "ConnectionManager":
+        """Return the shared manager for db_path in the current process."""
+        # Keyed by pid so a forked worker never reuses its parent's open connections.
+        key = (os.getpid(), Path(db_path).expanduser().resolve())
+        with cls._instances_lock:
+            manager = cls._instances.get(key)
+            if manager is None:
+                manager = cls(Path(db_path))
+                cls._instances[key] = manager
+            return manager
+
+    def connect(self, read_only=False) -> sqlite3.Connection:
+        """Open a new tuned connection to the database file."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            cached_statements=CONNECTION_STATEMENT_CACHE,
+            check_same_thread=not read_only,
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{CONNECTION_CACHE_SIZE_KIB}")
+        conn.execute(f"PRAGMA mmap_size={CONNECTION_MMAP_SIZE}")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    def initialize(self, create_schema) -> bool:
+        """Run create_schema(conn) once per process. Returns True if it ran now."""
+        if self._initialized:
+            return False
+
+        with self._init_lock:
+            if self._initialized:
+                return False
+
+            conn = self.connect()
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                create_schema(conn)
+                conn.commit()
+            finally:
+                conn.close()
+            self._initialized = True
+            return True
+
+    def read_connection(self) -> sqlite3.Connection:
+        """Return this thread's persistent read-only connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self.connect(read_only=True)
+            self._local.conn = conn
+            with self._read_connections_lock:
+                self._read_connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close every read connection opened through this manager."""
+        with self._read_connections_lock:
+            connections, self._read_connections = self._read_connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
 
 class DBManager:
-    def __init__(self, dice_id: str = None, logging=False):
-        """Initialize database manager state."""
+    def __init__(
+        self,
+        dice_id: str = None,
+        logging=False,
+        db_path: Path | None = None,
+        capture_root: Path | None = None,
+        use_writer_service=True,
+    ):
+        """Initialize database manager state.
+
+        Image paths under capture_root are stored relative to it. It defaults to the
+        Captures folder next to the database file.
+
+        When use_writer_service is set and a writer service owns the database file,
+        queued writes are forwarded to it instead of being committed by this process.
+        """
         self.dice_id = dice_id
-        self.db_path = DBPath
+        self.db_path = Path(db_path) if db_path is not None else DBPath
+        self.capture_root = Path(capture_root) if capture_root is not None else self.db_path.parent / "Captures"
         self.logging = logging
+        self.use_writer_service = use_writer_service
         self._write_queue = queue.Queue()
         self._writer_thread = None
+        self._last_timestamp = None
+        self._timestamp_lock = threading.Lock()
+        self._connections = ConnectionManager.for_path(self.db_path)
         self.initialize_database()
 
     def initialize_database(self):
         '''Initialize the database and create necessary tables if they don't exist.
-        
-        dice_id: This should be applied to each tested die
-        timestamp: When the test was conducted
-        motor_position: In case we want to analyze results based on motor position
-        dice_result: The number on the top face of the die
-        image: path to the image captured when the dice came to a stop
-        
-        The primary key is a combination of dice_id and timestamp to ensure uniqueness.
+
+        The schema work only runs for the first DBManager created for this database
+        file in the current process; later instances reuse the shared ConnectionManager.
+        It writes on its own connection rather than through the writer: it has to run
+        before any writer thread or writer service can commit to the tables, the service
+        itself needs it to start, and once the schema is current it changes no rows.
         '''
         if self.logging:
             print("database.py initialize_database() called.")
 
-        conn, cursor = self.open_connection()
+        if self._connections.initialize(self._create_schema):
+            if self.logging:
+                print("  -> Database initialized and tables created if they didn't exist.")
+
+    def _create_schema(self, conn):
+        '''Create or migrate the schema on the given connection.
 
-        cursor.execute(
+        dice: one row per physical die.
+            dice_ref: integer key referenced by rolls
+            name: the dice ID shown to the user
+            sides: number of sides on the die, if known
+            dice_group: set tag for dice tested together (e.g. six_sided_yahtzee)
+        rolls: one row per recorded roll.
+            roll_id: monotonically increasing row id (AUTOINCREMENT, never reused)
+            dice_ref: the die that was rolled
+            timestamp_us: wall-clock microseconds since 1970-01-01, see timestamp_to_us()
+            dice_result: the number on the top face of the die
+            image: path to the captured image, relative to the capture root when inside it
+
+        die_stats: running aggregates per die, kept current by triggers on rolls.
+            roll_count, roll_sum, repeat_pairs: totals over the die's rolls
+            current_streak, longest_streak, longest_streak_value: runs of one face
+            last_result, first_timestamp_us, last_timestamp_us: the ends of the series
+            max_roll_id: the newest roll, so (roll_count, max_roll_id) fingerprints the die
+            stale: set when a delete, update or out-of-order insert needs a rebuild
+        die_face_counts: per-face roll counts for each die.
+        id_sequences: named counters handed out by allocate_dice_id(), plus the
+            highest pruned tombstone_id under TOMBSTONES_PRUNED_SEQUENCE.
+            next_value: the next value the sequence will allocate
+        roll_tombstones: one row per deleted roll, for read_changes() consumers.
+            tombstone_id: monotonically increasing (AUTOINCREMENT, never reused)
+            roll_id, dice_name, timestamp_us, dice_result: the deleted roll
+
+        A die's rolls are unique per timestamp, and that index doubles as the
+        per-die time-ordered range scan. idx_rolls_image finds the roll for one image.
+
+        Appending a roll updates die_stats in O(1) inside the same transaction.
+        Anything else only marks the die stale, and the writer rebuilds stale dice
+        from their rolls before it commits (see _rebuild_stale_stats()).
+        '''
+        cursor = conn.cursor()
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+
+        cursor.executescript(
             '''
-            CREATE TABLE IF NOT EXISTS test_results (
-                dice_id TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                dice_sides INTEGER,
+            CREATE TABLE IF NOT EXISTS dice (
+                dice_ref INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                sides INTEGER,
+                dice_group TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_dice_group ON dice (dice_group, name);
+
+            CREATE TABLE IF NOT EXISTS rolls (
+                roll_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                dice_ref INTEGER NOT NULL REFERENCES dice (dice_ref),
+                timestamp_us INTEGER NOT NULL,
                 dice_result INTEGER NOT NULL,
                 image TEXT NOT NULL,
-                PRIMARY KEY (dice_id, timestamp)
-            )
+                UNIQUE (dice_ref, timestamp_us)
+            );
+            CREATE INDEX IF NOT EXISTS idx_rolls_image ON rolls (image);
+
+            CREATE TABLE IF NOT EXISTS die_stats (
+                dice_ref INTEGER PRIMARY KEY REFERENCES dice (dice_ref),
+                roll_count INTEGER NOT NULL DEFAULT 0,
+                roll_sum INTEGER NOT NULL DEFAULT 0,
+                repeat_pairs INTEGER NOT NULL DEFAULT 0,
+                current_streak INTEGER NOT NULL DEFAULT 0,
+                longest_streak INTEGER NOT NULL DEFAULT 0,
+                longest_streak_value INTEGER,
+                last_result INTEGER,
+                first_timestamp_us INTEGER,
+                last_timestamp_us INTEGER,
+                stale INTEGER NOT NULL DEFAULT 0,
+                max_roll_id INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_die_stats_stale ON die_stats (dice_ref) WHERE stale;
+
+            CREATE TABLE IF NOT EXISTS die_face_counts (
+                dice_ref INTEGER NOT NULL REFERENCES dice (dice_ref),
+                face INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (dice_ref, face)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS id_sequences (
+                name TEXT PRIMARY KEY,
+                next_value INTEGER NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS roll_tombstones (
+                tombstone_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                roll_id INTEGER NOT NULL,
+                dice_name TEXT NOT NULL,
+                timestamp_us INTEGER NOT NULL,
+                dice_result INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_roll_tombstones_die ON roll_tombstones (dice_name, tombstone_id);
+
+            CREATE TRIGGER IF NOT EXISTS roll_tombstones_after_delete AFTER DELETE ON rolls
+            BEGIN
+                INSERT INTO roll_tombstones (roll_id, dice_name, timestamp_us, dice_result)
+                VALUES (
+                    OLD.roll_id,
+                    COALESCE((SELECT name FROM dice WHERE dice_ref = OLD.dice_ref), ''),
+                    OLD.timestamp_us,
+                    OLD.dice_result
+                );
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS die_stats_after_delete AFTER DELETE ON rolls
+            BEGIN
+                UPDATE die_stats SET stale = 1 WHERE dice_ref = OLD.dice_ref;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS die_stats_after_update
+            AFTER UPDATE OF dice_ref, timestamp_us, dice_result ON rolls
+            BEGIN
+                INSERT INTO die_stats (dice_ref, stale) VALUES (OLD.dice_ref, 1)
+                ON CONFLICT (dice_ref) DO UPDATE SET stale = 1;
+                INSERT INTO die_stats (dice_ref, stale) VALUES (NEW.dice_ref, 1)
+                ON CONFLICT (dice_ref) DO UPDATE SET stale = 1;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS die_stats_after_dice_delete AFTER DELETE ON dice
+            BEGIN
+                DELETE FROM die_face_counts WHERE dice_ref = OLD.dice_ref;
+                DELETE FROM die_stats WHERE dice_ref = OLD.dice_ref;
+            END;
             '''
         )
+        if version < 7:
+            cursor.execute("PRAGMA table_info(die_stats)")
+            if "max_roll_id" not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE die_stats ADD COLUMN max_roll_id INTEGER")
+                cursor.execute(
+                    """
+                    UPDATE die_stats
+                    SET max_roll_id = (SELECT MAX(roll_id) FROM rolls WHERE rolls.dice_ref = die_stats.dice_ref)
+                    """
+                )
+            # The insert trigger predates max_roll_id; recreate it below.
+            cursor.execute("DROP TRIGGER IF EXISTS die_stats_after_insert")
+        cursor.execute(_DIE_STATS_INSERT_TRIGGER_SQL)
 
-        cursor.execute("PRAGMA table_info(test_results)")
-        existing_columns = {row[1] for row in cursor.fetchall()}
-        if 'dice_sides' not in existing_columns:
-            cursor.execute('ALTER TABLE test_results ADD COLUMN dice_sides INTEGER')
+        legacy_table = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'test_results'"
+        ).fetchone()
+        if version < 2 and legacy_table:
+            self._migrate_legacy_results(cursor)
+
+        if version < 3:
+            # Backfill aggregates for rolls written before die_stats existed.
+            cursor.execute(_MARK_STATS_STALE_SQL, (None, None))
+            self._rebuild_stale_stats(cursor)
 
-        conn.commit()
-        self.close_connection(conn)
+        # Seed the dice ID sequence past every numeric ID already in use. This is the
+        # only full scan of dice names; allocations afterwards touch one row.
+        cursor.execute(
+            """
+            INSERT OR IGNORE INTO id_sequences (name, next_value)
+            SELECT ?, COALESCE(MAX(CAST(name AS INTEGER)), 0) + 1
+            FROM dice
+            WHERE name <> ''
+            AND name NOT GLOB '*[^0-9]*'
+            """,
+            (DICE_ID_SEQUENCE,),
+        )
+
+        cursor.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _migrate_legacy_results(self, cursor):
+        '''Copy rows from the legacy test_results table into dice/rolls, then drop it.'''
         if self.logging:
-            print("  -> Database initialized and tables created if they didn't exist.")
+            print("  -> Migrating legacy test_results rows to the normalized schema.")
+
+        cursor.execute("PRAGMA table_info(test_results)")
+        has_sides = 'dice_sides' in {row[1] for row in cursor.fetchall()}
+        sides_column = "dice_sides" if has_sides else "NULL"
+
+        # Each die keeps its most frequently recorded side count.
+        dice_rows = cursor.execute(
+            f'''
+            SELECT dice_id, {sides_column} AS sides, COUNT(*) AS uses
+            FROM test_results
+            GROUP BY dice_id, sides
+            ORDER BY dice_id, (sides IS NULL), uses DESC
+            '''
+        ).fetchall()
+        sides_by_die: dict[str, int | None] = {}
+        for dice_id, sides, _ in dice_rows:
+            sides_by_die.setdefault(str(dice_id), sides)
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO dice (name, sides, dice_group) VALUES (?, ?, ?)",
+            [(dice_id, sides, default_dice_group(dice_id)) for dice_id, sides in sides_by_die.items()],
+        )
+        dice_refs = dict(cursor.execute("SELECT name, dice_ref FROM dice").fetchall())
+
+        legacy = cursor.connection.execute(
+            "SELECT dice_id, timestamp, dice_result, image FROM test_results ORDER BY timestamp"
+        )
+        while True:
+            chunk = legacy.fetchmany(_LEGACY_MIGRATION_CHUNK)
+            if not chunk:
+                break
+            cursor.executemany(
+                '''
+                INSERT OR IGNORE INTO rolls (dice_ref, timestamp_us, dice_result, image)
+                VALUES (?, ?, ?, ?)
+                ''',
+                [
+                    (
+                        dice_refs[str(dice_id)],
+                        timestamp_to_us(timestamp),
+                        int(dice_result),
+                        self._stored_image_path(image),
+                    )
+                    for dice_id, timestamp, dice_result, image in chunk
+                ],
+            )
+
+        cursor.execute("DROP TABLE test_results")
+
+    def _rebuild_stale_stats(self, cursor):
+        '''Recompute die_stats and die_face_counts exactly for every die marked stale.'''
+        stale_refs = [row[0] for row in cursor.execute("SELECT dice_ref FROM die_stats WHERE stale").fetchall()]
+        for dice_ref in stale_refs:
+            summary = _summarize_die_rolls(cursor.connection.cursor(), dice_ref)
+
+            cursor.execute("DELETE FROM die_face_counts WHERE dice_ref = ?", (dice_ref,))
+            cursor.execute("DELETE FROM die_stats WHERE dice_ref = ?", (dice_ref,))
+            if summary is None:
+                continue
+
+            stats_row, face_counts = summary
+            cursor.execute(
+                f"INSERT INTO die_stats ({_DIE_STATS_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                stats_row,
+            )
+            cursor.executemany(
+                "INSERT INTO die_face_counts (dice_ref, face, count) VALUES (?, ?, ?)",
+                [(dice_ref, face, count) for face, count in sorted(face_counts.items())],
+            )
+
+        if self.logging and stale_refs:
+            print(f"  -> Rebuilt aggregates for {len(stale_refs)} die/dice.")
+
+    def _prune_old_tombstones(self, cursor):
+        '''Drop all but the newest TOMBSTONE_RETENTION_ROWS tombstones.'''
+        (newest,) = cursor.execute("SELECT COALESCE(MAX(tombstone_id), 0) FROM roll_tombstones").fetchone()
+        cutoff = newest - TOMBSTONE_RETENTION_ROWS
+        if cutoff <= 0:
+            return
+        delete_sql, mark_sql = _PRUNE_TOMBSTONES_SQL
+        pruned = cursor.execute(delete_sql, (cutoff,)).rowcount
+        if pruned > 0:
+            cursor.execute(mark_sql, (TOMBSTONES_PRUNED_SEQUENCE, cutoff))
+            if self.logging:
+                print(f"  -> Pruned {pruned} roll tombstone(s) past the retention limit.")
 
     def open_connection(self):
         """
-        Open a connection to the database.
+        Open a dedicated read/write connection to the database.
         Returns a (connection, cursor) tuple for executing SQL commands.
         """
         if self.logging:
             print("database.py open_connection() called.")
 
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
+        conn = self._connections.connect()
         return conn, conn.cursor()
 
+    def _read_cursor(self):
+        """Return a cursor on this thread's persistent read connection."""
+        return self._connections.read_connection().cursor()
+
+    def _stored_image_path(self, image_path) -> str:
+        """Return image_path relative to the capture root when it lives inside it."""
+        path = Path(image_path)
+        try:
+            return path.relative_to(self.capture_root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def _resolved_image_path(self, stored_path: str) -> str:
+        """Return the absolute image path for a value stored by _stored_image_path()."""
+        path = Path(stored_path)
+        return str(path if path.is_absolute() else self.capture_root / path)
+
+    def _row_dict(self, row) -> dict:
+        """Convert a (name, timestamp_us, sides, result, image) row to the public row dict."""
+        return {
+            "dice_id": row[0],
+            "timestamp": us_to_timestamp(row[1]),
+            "dice_sides": row[2],
+            "dice_result": row[3],
+            "image": self._resolved_image_path(row[4]),
+        }
+
     def close_connection(self, conn):
         """Close a provided sqlite connection."""
         if self.logging:
@@ -109,65 +848,273 @@ class DBManager:
         if not self._writer_thread or not self._writer_thread.is_alive():
             return
 
-        self._write_queue.put(QueueData(cmd=QuCmd.DB_STOP_WRITER, data=None))
+        self._write_queue.put(_PendingWrite(QueueData(cmd=QuCmd.DB_STOP_WRITER, data=None)))
         self._writer_thread.join()
         self._writer_thread = None
         if self.logging:
             print("  -> Database writer thread stopped.")
 
-    def _queue_db_command(self, cmd, data=None):
-        """Queue a database command for serialized execution."""
+    def _queue_db_command(self, cmd, data=None) -> Future:
+        """Queue a database command for serialized execution.
+
+        Returns a future that resolves once the command's batch has been committed,
+        or raises the error that prevented it from being written.
+        """
         self.start_writer()
-        self._write_queue.put(QueueData(cmd=cmd, data=data))
+        pending = _PendingWrite(QueueData(cmd=cmd, data=data))
+        self._write_queue.put(pending)
+        return pending.future
+
+    def _collect_write_batch(self) -> tuple[list[_PendingWrite], bool]:
+        """Block for the next command, then drain the queue into one batch.
+
+        Returns the batch plus a flag telling the writer loop to stop afterwards.
+        """
+        batch: list[_PendingWrite] = []
+        pending = self._write_queue.get()
+        if pending.item.cmd == QuCmd.DB_STOP_WRITER:
+            pending.future.set_result(None)
+            self._write_queue.task_done()
+            return batch, True
+
+        batch.append(pending)
+        deadline = time.monotonic() + WRITE_BATCH_MAX_LATENCY
+        while len(batch) < WRITE_BATCH_MAX_ROWS and time.monotonic() < deadline:
+            try:
+                pending = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if pending.item.cmd == QuCmd.DB_STOP_WRITER:
+                pending.future.set_result(None)
+                self._write_queue.task_done()
+                return batch, True
+            batch.append(pending)
+
+        return batch, False
+
+    def _statements_for(self, item: QueueData) -> list[tuple[str, tuple]]:
+        """Translate a queued command into the (sql, params) pairs that apply it."""
+        if item.cmd == QuCmd.DB_EXECUTE_SQL:
+            payload = item.data or {}
+            return [(payload["sql"], tuple(payload.get("params", ())))]
+
+        if item.cmd in (QuCmd.DB_EXECUTE_STATEMENTS, QuCmd.DB_QUERY_STATEMENTS):
+            return [(sql, tuple(params)) for sql, params in item.data]
+
+        if item.cmd == QuCmd.DB_IMPORT_RESULTS:
+            # Applied by _import_results_file(), which streams the rows from the file.
+            return []
+
+        if item.cmd == QuCmd.DB_CLEAR_ALL_DATA:
+            return [("DELETE FROM rolls", ()), ("DELETE FROM dice", ())]
+
+        if item.cmd == QuCmd.DB_WRITE_TEST_RESULT:
+            payload = item.data or {}
+            dice_id = str(payload["dice_id"])
+            dice_sides = payload.get("dice_sides")
+            dice_result = int(payload["dice_result"])
+            image_path = self._stored_image_path(payload["image_path"])
+            timestamp_us = payload.get("timestamp_us")
+            if timestamp_us is None:
+                timestamp_us = timestamp_to_us(payload.get("timestamp") or datetime.now())
+            return [
+                (
+                    """
+                    INSERT INTO dice (name, sides, dice_group) VALUES (?, ?, ?)
+                    ON CONFLICT (name) DO UPDATE SET sides = COALESCE(excluded.sides, dice.sides)
+                    """,
+                    (dice_id, dice_sides, default_dice_group(dice_id)),
+                ),
+                (
+                    """
+                    INSERT INTO rolls (dice_ref, timestamp_us, dice_result, image)
+                    VALUES ((SELECT dice_ref FROM dice WHERE name = ?), ?, ?, ?)
+                    """,
+                    (dice_id, int(timestamp_us), dice_result, image_path),
+                ),
+            ]
+
+        raise ValueError(f"Unsupported database command: {item.cmd}")
+
+    def _execute_write_batch(self, cursor, batch: list[_PendingWrite]) -> list[list | None]:
+        """Execute a batch inside the open transaction and return each command's result.
+
+        Consecutive commands that expand to the same statements are applied with one
+        executemany per statement. A DB_QUERY_STATEMENTS command runs on its own and
+        its result is the rows of its last statement. A DB_IMPORT_RESULTS command also
+        runs on its own and its result is the number of rolls it inserted. Every other
+        result is None. Any die aggregates the batch left stale are rebuilt, and tombstones
+        past the retention limit pruned, before returning, so they commit together
+        with the rows.
+        """
+        statements = [self._statements_for(pending.item) for pending in batch]
+        results: list[list | None] = [None] * len(batch)
+        index = 0
+        while index < len(statements):
+            if batch[index].item.cmd == QuCmd.DB_QUERY_STATEMENTS:
+                for sql, params in statements[index]:
+                    cursor.execute(sql, params)
+                results[index] = [list(row) for row in cursor.fetchall()]
+                index += 1
+                continue
+
+            if batch[index].item.cmd == QuCmd.DB_IMPORT_RESULTS:
+                results[index] = self._import_results_file(cursor, Path(batch[index].item.data["path"]))
+                index += 1
+                continue
+
+            shape = [sql for sql, _ in statements[index]]
+            run_end = index + 1
+            while (
+                run_end < len(statements)
+                and batch[run_end].item.cmd not in _STANDALONE_COMMANDS
+                and [sql for sql, _ in statements[run_end]] == shape
+            ):
+                run_end += 1
+
+            for position, sql in enumerate(shape):
+                if run_end - index == 1:
+                    cursor.execute(sql, statements[index][position][1])
+                else:
+                    cursor.executemany(sql, [item[position][1] for item in statements[index:run_end]])
+            index = run_end
+
+        self._rebuild_stale_stats(cursor)
+        self._prune_old_tombstones(cursor)
+        return results
+
+    def _commit_write_batch(self, conn, cursor, batch: list[_PendingWrite]):
+        """Commit a batch in one transaction and resolve each command's future.
+
+        If the batch fails, it is rolled back and replayed one command at a time so a
+        single bad statement only fails its own future.
+        """
+        try:
+            try:
+                results = self._execute_write_batch(cursor, batch)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+            else:
+                for pending, result in zip(batch, results):
+                    pending.future.set_result(result)
+                return
+
+            for pending in batch:
+                try:
+                    (result,) = self._execute_write_batch(cursor, [pending])
+                    conn.commit()
+                except Exception as error:
+                    conn.rollback()
+                    pending.future.set_exception(error)
+                    if self.logging:
+                        print(f"  -> Database write failed for {pending.item}: {error}")
+                else:
+                    pending.future.set_result(result)
+        finally:
+            for _ in batch:
+                self._write_queue.task_done()
+
+    def _forward_write_batch(self, service: Connection, batch: list[_PendingWrite]) -> bool:
+        """Send a batch to the writer service and resolve each future from its acknowledgement.
+
+        Returns False without touching the batch if the service could not be reached,
+        so the caller can commit it locally instead.
+        """
+        forwarded: list[_PendingWrite] = []
+        commands: list[str] = []
+        for pending in batch:
+            try:
+                if pending.item.cmd == QuCmd.DB_IMPORT_RESULTS:
+                    # The service reads the file itself rather than receiving every row.
+                    command = {"cmd": pending.item.cmd.name, "path": pending.item.data["path"]}
+                else:
+                    # Everything else reaches the service already translated into statements.
+                    cmd = pending.item.cmd if pending.item.cmd in _STANDALONE_COMMANDS else QuCmd.DB_EXECUTE_STATEMENTS
+                    command = {"cmd": cmd.name, "statements": self._statements_for(pending.item)}
+                commands.append(json.dumps(command, separators=(",", ":")))
+            except Exception as error:
+                pending.future.set_exception(error)
+                self._write_queue.task_done()
+            else:
+                forwarded.append(pending)
+
+        if not forwarded:
+            return True
+
+        try:
+            service.send_bytes(f'{{"op":"write","commands":[{",".join(commands)}]}}'.encode("utf-8"))
+        except (OSError, ValueError):
+            # Nothing reached the service; hand the remaining commands back for a local commit.
+            batch[:] = forwarded
+            return False
+
+        try:
+            try:
+                acknowledgements = recv_writer_message(service)
+            except (EOFError, OSError, ValueError) as error:
+                for pending in forwarded:
+                    pending.future.set_exception(
+                        ConnectionError(f"Writer service closed before acknowledging the batch: {error}")
+                    )
+                return True
+
+            for pending, acknowledgement in zip(forwarded, acknowledgements):
+                if acknowledgement is not None and "error" in acknowledgement:
+                    pending.future.set_exception(writer_error_from_message(acknowledgement))
+                else:
+                    pending.future.set_result(acknowledgement and acknowledgement["result"])
+        finally:
+            for _ in forwarded:
+                self._write_queue.task_done()
+        return True
 
     def _writer_loop(self):
-        """Continuously process database commands on a single connection."""
-        conn, cursor = self.open_connection()
+        """Continuously drain queued commands and group-commit them.
+
+        Batches go to the writer service while one is reachable; otherwise they are
+        committed on this thread's own connection. While no service is connected the
+        thread looks for one again before a batch, backing off exponentially between
+        attempts, so a service started later or restarted after a failure is picked up.
+        """
+        service = None
+        retry_at = 0.0
+        retry_delay = WRITER_SERVICE_RETRY_INITIAL
+        conn = cursor = None
         try:
             while True:
-                item = self._write_queue.get()
-                try:
-                    if item.cmd == QuCmd.DB_STOP_WRITER:
-                        return
-
-                    if item.cmd == QuCmd.DB_EXECUTE_SQL:
-                        payload = item.data or {}
-                        cursor.execute(payload["sql"], payload.get("params", ()))
-                        conn.commit()
-                        continue
-
-                    if item.cmd == QuCmd.DB_CLEAR_ALL_DATA:
-                        cursor.execute("DELETE FROM test_results")
-                        conn.commit()
-                        continue
-
-                    if item.cmd == QuCmd.DB_WRITE_TEST_RESULT:
-                        payload = item.data or {}
-                        dice_id = str(payload["dice_id"])
-                        dice_sides = payload.get("dice_sides")
-                        dice_result = int(payload["dice_result"])
-                        image_path = str(payload["image_path"])
-                        timestamp = payload.get("timestamp") or datetime.now().isoformat(timespec="milliseconds")
-
-                        cursor.execute(
-                            """
-                            INSERT INTO test_results (dice_id, timestamp, dice_sides, dice_result, image)
-                            VALUES (?, ?, ?, ?, ?)
-                            """,
-                            (str(dice_id), timestamp, dice_sides, dice_result, image_path),
-                        )
-                        conn.commit()
-                        continue
-
-                    raise ValueError(f"Unsupported database command: {item.cmd}")
-                finally:
-                    self._write_queue.task_done()
+                batch, stop_requested = self._collect_write_batch()
+                if batch:
+                    if service is None and self.use_writer_service and time.monotonic() >= retry_at:
+                        service = connect_writer_service(self.db_path)
+                        if service is None:
+                            retry_at = time.monotonic() + retry_delay
+                            retry_delay = min(retry_delay * 2, WRITER_SERVICE_RETRY_MAX)
+                        else:
+                            retry_delay = WRITER_SERVICE_RETRY_INITIAL
+                            if self.logging:
+                                print("  -> Forwarding database writes to the writer service.")
+                    if service is not None and not self._forward_write_batch(service, batch):
+                        service.close()
+                        service = None
+                        retry_at = time.monotonic() + retry_delay
+                    if service is None:
+                        if conn is None:
+                            conn, cursor = self.open_connection()
+                        self._commit_write_batch(conn, cursor, batch)
+                    if self.logging:
+                        print(f"  -> Committed {len(batch)} queued database write(s).")
+                if stop_requested:
+                    return
         finally:
+            if service is not None:
+                service.close()
             self.close_connection(conn)
 
-    def enqueue_write(self, sql, params=()):
+    def enqueue_write(self, sql, params=()) -> Future:
         """Queue a raw SQL write statement for serialized execution."""
-        self._queue_db_command(
+        return self._queue_db_command(
             QuCmd.DB_EXECUTE_SQL,
             {
                 "sql": sql,
@@ -180,51 +1127,83 @@ class DBManager:
         self._write_queue.join()
 
     def execute_read_one(self, sql, params=()):
-        """Execute a read query using a short-lived read connection."""
-        conn, cursor = self.open_connection()
-        try:
-            cursor.execute(sql, params)
-            return cursor.fetchone()
-        finally:
-            self.close_connection(conn)
+        """Execute a read query on this thread's persistent read connection."""
+        cursor = self._read_cursor()
+        cursor.execute(sql, params)
+        return cursor.fetchone()
+
+    def allocate_dice_id(self) -> str:
+        """Reserve and return the next numeric dice ID.
+
+        The sequence row is advanced and the die registered by one writer command, so
+        the allocation commits in a single transaction and sessions in other threads or
+        processes never receive the same ID. Numbers already taken by a manually
+        entered ID are skipped.
+        """
+        statements = [
+            (
+                """
+                UPDATE id_sequences
+                SET next_value = (
+                    WITH RECURSIVE candidate (value) AS (
+                        SELECT id_sequences.next_value
+                        UNION ALL
+                        SELECT value + 1 FROM candidate
+                        WHERE EXISTS (SELECT 1 FROM dice WHERE name = CAST(candidate.value AS TEXT))
+                    )
+                    SELECT MAX(value) + 1 FROM candidate
+                )
+                WHERE name = ?
+                """,
+                (DICE_ID_SEQUENCE,),
+            ),
+            (
+                "INSERT INTO dice (name) SELECT CAST(next_value - 1 AS TEXT) FROM id_sequences WHERE name = ?",
+                (DICE_ID_SEQUENCE,),
+            ),
+            ("SELECT next_value - 1 FROM id_sequences WHERE name = ?", (DICE_ID_SEQUENCE,)),
+        ]
+        ((value,),) = self._queue_db_command(QuCmd.DB_QUERY_STATEMENTS, statements).result()
+        return str(value)
 
-    def generate_id(self):
-        """Set self.dice_id to the next numeric ID as a string.
+    def generate_id(self) -> str:
+        """Set self.dice_id to a newly allocated numeric ID and return it.
 
-        The next ID is calculated as max(existing numeric IDs) + 1.
+        See allocate_dice_id(); the ID is reserved as soon as this returns.
         """
         if self.logging:
             print("database.py generate_id() called.")
-        conn, cursor = self.open_connection()
-        try:
-            cursor.execute(
-                """
-                SELECT CAST(COALESCE(MAX(CAST(dice_id AS INTEGER)), 0) + 1 AS TEXT) AS next_dice_id
-                    FROM test_results
-                    WHERE dice_id <> ''
-                    AND dice_id NOT GLOB '*[^0-9]*'
-                """
-            )
-            result = cursor.fetchone()
-        finally:
-            self.close_connection(conn)
 
-        if result[0] is not None:
-            self.dice_id = result[0]
-        else:
-            self.dice_id = "1"
+        self.dice_id = self.allocate_dice_id()
 
         if self.logging:
             print(f"  -> Generated new dice ID: {self.dice_id}")
+        return self.dice_id
+
+    def _next_timestamp_us(self) -> int:
+        """Return a strictly increasing microsecond timestamp for this manager's rows.
+
+        Batched writers can queue several rows within the same clock tick, so the
+        timestamp is nudged forward by a microsecond whenever it would repeat.
+        """
+        with self._timestamp_lock:
+            now = timestamp_to_us(datetime.now())
+            if self._last_timestamp is not None and now <= self._last_timestamp:
+                now = self._last_timestamp + 1
+            self._last_timestamp = now
+        return now
 
-    def write_test_result(self, dice_result: str, image_path: str, dice_sides: int | None = None, wait=False):
+    def write_test_result(self, dice_result: str, image_path: str, dice_sides: int | None = None, wait=False) -> Future:
         """Write a new test result row using string inputs.
 
         Args:
             dice_result: Numeric face value as a string.
             image_path: Path to the captured image as a string.
             dice_sides: Number of sides on the die, if known.
-            wait: Whether to block until the queued write is committed.
+            wait: Whether to block until this write is committed.
+
+        Returns:
+            A future that resolves once the row's batch has been committed.
         """
         if self.logging:
             print("database.py write_test_result() called.")
@@ -232,157 +1211,826 @@ class DBManager:
         if not self.dice_id:
             self.generate_id()
 
-        self._queue_db_command(
+        future = self._queue_db_command(
             QuCmd.DB_WRITE_TEST_RESULT,
             {
                 "dice_id": self.dice_id,
                 "dice_sides": dice_sides,
                 "dice_result": dice_result,
                 "image_path": image_path,
-                "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+                "timestamp_us": self._next_timestamp_us(),
             },
         )
         if wait:
-            self.wait_for_writes()
+            future.result()
 
         if self.logging:
             print(
                 f"  -> Queued result write: dice_id={self.dice_id}, "
                 f"dice_result={dice_result}, image={image_path}"
             )
+        return future
 
-    def list_dice_ids(self):
-        """Return all stored dice IDs in ascending numeric order where possible."""
-        conn, cursor = self.open_connection()
-        try:
-            cursor.execute(
-                """
-                SELECT DISTINCT dice_id
-                FROM test_results
-                ORDER BY
-                    CASE WHEN dice_id GLOB '[0-9]*' THEN CAST(dice_id AS INTEGER) END,
-                    dice_id
-                """
-            )
-            return [row[0] for row in cursor.fetchall()]
-        finally:
-            self.close_connection(conn)
+    def set_dice_group(self, dice_id: str, dice_group: str | None, wait=False) -> Future:
+        """Tag an existing die with a set/group name, or clear its tag with None."""
+        future = self._queue_db_command(
+            QuCmd.DB_EXECUTE_SQL,
+            {
+                "sql": """
+                    UPDATE dice
+                    SET dice_group = ?
+                    WHERE name = ?
+                """,
+                "params": (dice_group, str(dice_id)),
+            },
+        )
+        if wait:
+            future.result()
+        return future
+
+    def list_dice_ids(self, dice_group: str | None = None):
+        """Return stored dice IDs that have results, in ascending numeric order where possible.
+
+        When dice_group is given, only dice tagged with that group are returned.
+        """
+        cursor = self._read_cursor()
+        cursor.execute(
+            """
+            SELECT name
+            FROM dice
+            WHERE (? IS NULL OR dice_group = ?)
+            AND EXISTS (SELECT 1 FROM rolls WHERE rolls.dice_ref = dice.dice_ref)
+            ORDER BY
+                CASE WHEN name GLOB '[0-9]*' THEN CAST(name AS INTEGER) END,
+                name
+            """,
+            (dice_group, dice_group),
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def read_report_inputs(self) -> dict[str, tuple[int, int, int | None]]:
+        """Return {dice_id: (roll_count, max_roll_id, sides)} for every die with results.
+
+        Together these change whenever a die gains, loses or has its sides corrected, so
+        they identify the input a rendered report was built from. They are read from
+        die_stats, one row per die, so the cost does not grow with the number of rolls.
+        """
+        cursor = self._read_cursor()
+        rows = cursor.execute(
+            """
+            SELECT dice.name, die_stats.roll_count, die_stats.max_roll_id, dice.sides, die_stats.stale, dice.dice_ref
+            FROM dice
+            JOIN die_stats USING (dice_ref)
+            WHERE die_stats.roll_count > 0 OR die_stats.stale
+            """
+        ).fetchall()
+        inputs = {}
+        for name, roll_count, max_roll_id, sides, stale, dice_ref in rows:
+            if stale:
+                # Only left by rows written outside the writer; count this die's rolls directly.
+                roll_count, max_roll_id = cursor.execute(
+                    "SELECT COUNT(*), MAX(roll_id) FROM rolls WHERE dice_ref = ?", (dice_ref,)
+                ).fetchone()
+                if not roll_count:
+                    continue
+            inputs[name] = (roll_count, max_roll_id, sides)
+        return inputs
+
+    def _iter_rows(self, sql: str, params: tuple, chunk_size: int) -> Iterator[dict]:
+        """Yield public row dicts for sql, fetching chunk_size rows at a time."""
+        cursor = self._read_cursor()
+        cursor.execute(sql, params)
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                return
+            for row in chunk:
+                yield self._row_dict(row)
+
+    def iter_all_results(self, chunk_size: int = RESULT_CHUNK_ROWS) -> Iterator[dict]:
+        """Stream all test result rows ordered by die then time, without loading them all at once."""
+        return self._iter_rows(
+            """
+            SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image
+            FROM rolls
+            JOIN dice ON dice.dice_ref = rolls.dice_ref
+            ORDER BY dice.name, rolls.timestamp_us
+            """,
+            (),
+            chunk_size,
+        )
+
+    def iter_results_for_group(self, dice_group: str, chunk_size: int = RESULT_CHUNK_ROWS) -> Iterator[dict]:
+        """Stream test result rows for dice tagged with dice_group, ordered by die then time."""
+        return self._iter_rows(
+            """
+            SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image
+            FROM dice
+            JOIN rolls ON rolls.dice_ref = dice.dice_ref
+            WHERE dice.dice_group = ?
+            ORDER BY dice.name, rolls.timestamp_us
+            """,
+            (dice_group,),
+            chunk_size,
+        )
+
+    def iter_results_for_die(self, dice_id: str, chunk_size: int = RESULT_CHUNK_ROWS) -> Iterator[dict]:
+        """Stream test result rows for a given dice_id in timestamp order."""
+        return self._iter_rows(
+            """
+            SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image
+            FROM dice
+            JOIN rolls ON rolls.dice_ref = dice.dice_ref
+            WHERE dice.name = ?
+            ORDER BY rolls.timestamp_us
+            """,
+            (str(dice_id),),
+            chunk_size,
+        )
+
+    def read_result_for_image(self, image_path) -> dict | None:
+        """Return the latest row recorded for image_path, or None if no roll used it."""
+        path = Path(image_path).expanduser()
+        stored_paths = (self._stored_image_path(path), self._stored_image_path(path.resolve()))
+        row = self._read_cursor().execute(
+            """
+            SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image
+            FROM rolls
+            JOIN dice ON dice.dice_ref = rolls.dice_ref
+            WHERE rolls.image IN (?, ?)
+            ORDER BY rolls.timestamp_us DESC
+            LIMIT 1
+            """,
+            stored_paths,
+        ).fetchone()
+        return None if row is None else self._row_dict(row)
 
     def read_all_results(self):
         """Return all test result rows.
 
         Returns a list of dicts with keys: dice_id, timestamp, dice_sides, dice_result, image.
         """
-        rows = []
-        conn, cursor = self.open_connection()
-        try:
-            cursor.execute(
-                """
-                SELECT dice_id, timestamp, dice_sides, dice_result, image
-                FROM test_results
-                ORDER BY dice_id, timestamp
-                """
-            )
-            for row in cursor.fetchall():
-                rows.append({
-                    "dice_id": row[0],
-                    "timestamp": row[1],
-                    "dice_sides": row[2],
-                    "dice_result": row[3],
-                    "image": row[4],
-                })
-        finally:
-            self.close_connection(conn)
+        return list(self.iter_all_results())
 
-        return rows
+    def read_results_for_group(self, dice_group: str):
+        """Return all test result rows for dice tagged with dice_group, ordered by die then time.
+
+        Returns a list of dicts with keys: dice_id, timestamp, dice_sides, dice_result, image.
+        """
+        return list(self.iter_results_for_group(dice_group))
+
+    def read_latest_results_for_die(self, dice_id: str, count: int):
+        """Return the newest count result rows for a die, oldest first."""
+        cursor = self._read_cursor()
+        cursor.execute(
+            """
+            SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image
+            FROM dice
+            JOIN rolls ON rolls.dice_ref = dice.dice_ref
+            WHERE dice.name = ?
+            ORDER BY rolls.timestamp_us DESC
+            LIMIT ?
+            """,
+            (str(dice_id), int(count)),
+        )
+        return [self._row_dict(row) for row in reversed(cursor.fetchall())]
+
+    def read_columns_for_die(self, dice_id: str, chunk_size: int = RESULT_CHUNK_ROWS) -> RollColumns | None:
+        """Return a die's rolls as NumPy columns, or None if the die is not registered.
+
+        Rows are copied into int64 blocks one chunk at a time, so no per-row Python
+        objects outlive the chunk being converted.
+        """
+        cursor = self._read_cursor()
+        dice_row = cursor.execute("SELECT dice_ref, sides FROM dice WHERE name = ?", (str(dice_id),)).fetchone()
+        if dice_row is None:
+            return None
 
-    def update_image_path(self, dice_id: str, timestamp: str, image_path: str, wait=False):
+        cursor.execute(
+            "SELECT timestamp_us, dice_result FROM rolls WHERE dice_ref = ? ORDER BY timestamp_us",
+            (dice_row[0],),
+        )
+        blocks = []
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            blocks.append(np.array(chunk, dtype=np.int64))
+        columns = np.concatenate(blocks) if blocks else np.empty((0, 2), dtype=np.int64)
+
+        return RollColumns(
+            dice_id=str(dice_id),
+            dice_sides=dice_row[1],
+            faces=columns[:, 1].astype(np.uint8),
+            timestamps_us=np.ascontiguousarray(columns[:, 0]),
+        )
+
+    def read_columns_for_group(self, dice_group: str, chunk_size: int = RESULT_CHUNK_ROWS) -> dict[str, RollColumns]:
+        """Return NumPy columns for every die in dice_group that has rolls, keyed by dice ID."""
+        columns_by_die: dict[str, RollColumns] = {}
+        for dice_id in self.list_dice_ids(dice_group=dice_group):
+            columns = self.read_columns_for_die(dice_id, chunk_size=chunk_size)
+            if columns is not None and len(columns):
+                columns_by_die[dice_id] = columns
+        return columns_by_die
+
+    def update_image_path(self, dice_id: str, timestamp: str, image_path: str, wait=False) -> Future:
         """Update the stored image path for an existing test result row."""
-        self._queue_db_command(
+        future = self._queue_db_command(
             QuCmd.DB_EXECUTE_SQL,
             {
                 "sql": """
-                    UPDATE test_results
+                    UPDATE rolls
                     SET image = ?
-                    WHERE dice_id = ? AND timestamp = ?
+                    WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = ?)
+                    AND timestamp_us = ?
                 """,
-                "params": (str(image_path), str(dice_id), str(timestamp)),
+                "params": (self._stored_image_path(image_path), str(dice_id), timestamp_to_us(timestamp)),
             },
         )
         if wait:
-            self.wait_for_writes()
+            future.result()
+        return future
 
-    def delete_result(self, dice_id: str, timestamp: str, wait=False):
+    def delete_result(self, dice_id: str, timestamp: str, wait=False) -> Future:
         """Delete a test result row identified by dice_id and timestamp."""
-        self._queue_db_command(
+        future = self._queue_db_command(
             QuCmd.DB_EXECUTE_SQL,
             {
                 "sql": """
-                    DELETE FROM test_results
-                    WHERE dice_id = ? AND timestamp = ?
+                    DELETE FROM rolls
+                    WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = ?)
+                    AND timestamp_us = ?
                 """,
-                "params": (str(dice_id), str(timestamp)),
+                "params": (str(dice_id), timestamp_to_us(timestamp)),
             },
         )
         if wait:
-            self.wait_for_writes()
+            future.result()
+        return future
 
-    def delete_results_for_die(self, dice_id: str, wait=False):
+    def delete_results_for_die(self, dice_id: str, wait=False) -> Future:
         """Delete all test result rows for a specific dice_id."""
-        self._queue_db_command(
+        future = self._queue_db_command(
             QuCmd.DB_EXECUTE_SQL,
             {
                 "sql": """
-                    DELETE FROM test_results
-                    WHERE dice_id = ?
+                    DELETE FROM rolls
+                    WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = ?)
                 """,
                 "params": (str(dice_id),),
             },
         )
         if wait:
-            self.wait_for_writes()
+            future.result()
+        return future
+
+    def replace_results_for_die(
+        self,
+        dice_id: str,
+        results: Iterable[tuple[int | str, str]],
+        dice_sides: int | None = None,
+        wait=False,
+    ) -> Future:
+        """Swap a die's rows for (dice_result, image_path) results in one transaction.
+
+        Readers see either the old rows or all of the new ones, never a partial set.
+        Rows get increasing timestamps in the order given.
+        """
+        dice_id = str(dice_id)
+        statements = [
+            (
+                """
+                INSERT INTO dice (name, sides, dice_group) VALUES (?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET sides = COALESCE(excluded.sides, dice.sides)
+                """,
+                (dice_id, dice_sides, default_dice_group(dice_id)),
+            ),
+            ("DELETE FROM rolls WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = ?)", (dice_id,)),
+        ]
+        statements.extend(
+            (
+                """
+                INSERT INTO rolls (dice_ref, timestamp_us, dice_result, image)
+                VALUES ((SELECT dice_ref FROM dice WHERE name = ?), ?, ?, ?)
+                """,
+                (dice_id, self._next_timestamp_us(), int(dice_result), self._stored_image_path(image_path)),
+            )
+            for dice_result, image_path in results
+        )
+        future = self._queue_db_command(QuCmd.DB_EXECUTE_STATEMENTS, statements)
+        if wait:
+            future.result()
+        return future
 
     def read_results_for_die(self, dice_id: str):
         """Return all test result rows for a given dice_id.
 
         Returns a list of dicts with keys: dice_id, timestamp, dice_sides, dice_result, image.
         """
-        rows = []
-        conn, cursor = self.open_connection()
+        rows = list(self.iter_results_for_die(dice_id))
+
+        if self.logging:
+            print(f"  -> Read {len(rows)} result(s) for dice_id={dice_id}")
+        return rows
+
+    def _die_stats_from_rows(self, rows, face_rows) -> dict[str, DieStats]:
+        """Build DieStats from (name, sides, stats columns..., stale) and (name, face, count) rows.
+
+        Stale aggregates only survive when rows were written outside the writer thread;
+        those dice are recomputed from their rolls instead.
+        """
+        face_counts_by_die: dict[str, dict[int, int]] = {}
+        for name, face, count in face_rows:
+            face_counts_by_die.setdefault(name, {})[face] = count
+
+        stats_by_die: dict[str, DieStats] = {}
+        for name, sides, dice_ref, *columns, stale in rows:
+            face_counts = face_counts_by_die.get(name, {})
+            if stale:
+                summary = _summarize_die_rolls(self._read_cursor(), dice_ref)
+                if summary is None:
+                    continue
+                columns = list(summary[0][1:])
+                face_counts = summary[1]
+
+            (
+                roll_count,
+                roll_sum,
+                repeat_pairs,
+                current_streak,
+                longest_streak,
+                longest_streak_value,
+                last_result,
+                first_timestamp_us,
+                last_timestamp_us,
+                _max_roll_id,
+            ) = columns
+            stats_by_die[name] = DieStats(
+                dice_id=name,
+                dice_sides=sides,
+                roll_count=roll_count,
+                roll_sum=roll_sum,
+                repeat_pairs=repeat_pairs,
+                current_streak=current_streak,
+                longest_streak_value=longest_streak_value,
+                longest_streak_length=longest_streak,
+                last_result=last_result,
+                first_timestamp=us_to_timestamp(first_timestamp_us) if first_timestamp_us is not None else None,
+                last_timestamp=us_to_timestamp(last_timestamp_us) if last_timestamp_us is not None else None,
+                face_counts=dict(sorted(face_counts.items())),
+            )
+        return stats_by_die
+
+    def _query_die_stats(self, where_sql: str, params: tuple) -> dict[str, DieStats]:
+        """Read die_stats/die_face_counts rows for the dice matching where_sql."""
+        cursor = self._read_cursor()
+        rows = cursor.execute(
+            f"""
+            SELECT dice.name, dice.sides, {_DIE_STATS_COLUMNS}, die_stats.stale
+            FROM dice
+            JOIN die_stats USING (dice_ref)
+            WHERE {where_sql}
+            ORDER BY dice.name
+            """,
+            params,
+        ).fetchall()
+        face_rows = cursor.execute(
+            f"""
+            SELECT dice.name, die_face_counts.face, die_face_counts.count
+            FROM dice
+            JOIN die_face_counts USING (dice_ref)
+            WHERE {where_sql}
+            """,
+            params,
+        ).fetchall()
+        return self._die_stats_from_rows(rows, face_rows)
+
+    def read_die_stats_for_group(self, dice_group: str | None = None) -> dict[str, DieStats]:
+        """Return materialized aggregates keyed by dice ID, without reading any rolls.
+
+        When dice_group is given, only dice tagged with that group are returned.
+        """
+        return self._query_die_stats("(? IS NULL OR dice.dice_group = ?)", (dice_group, dice_group))
+
+    def read_count_matrix(
+        self,
+        dice_group: str | None = None,
+        prefix: str | None = None,
+        faces: int | None = None,
+    ) -> FaceCountMatrix:
+        """Return per-face roll counts for every die with rolls, ordered by dice ID.
+
+        dice_group and prefix narrow the dice to one set tag and/or to names starting
+        with prefix. Counts come from the die_face_counts aggregates, so the cost does
+        not grow with the number of rolls; dice with stale aggregates are counted with
+        a GROUP BY over their rolls instead. The matrix has faces columns, defaulting
+        to the most sides (or highest face) among the selected dice.
+        """
+        cursor = self._read_cursor()
+        filters = (dice_group, dice_group, prefix, prefix, prefix)
+        dice_rows = cursor.execute(
+            """
+            SELECT dice.dice_ref, dice.name, dice.sides, die_stats.stale
+            FROM dice
+            JOIN die_stats USING (dice_ref)
+            WHERE (die_stats.roll_count > 0 OR die_stats.stale)
+            AND (? IS NULL OR dice.dice_group = ?)
+            AND (? IS NULL OR substr(dice.name, 1, length(?)) = ?)
+            ORDER BY dice.name
+            """,
+            filters,
+        ).fetchall()
+        face_rows = cursor.execute(
+            """
+            SELECT die_face_counts.dice_ref, die_face_counts.face, die_face_counts.count
+            FROM dice
+            JOIN die_face_counts USING (dice_ref)
+            WHERE (? IS NULL OR dice.dice_group = ?)
+            AND (? IS NULL OR substr(dice.name, 1, length(?)) = ?)
+            """,
+            filters,
+        ).fetchall()
+
+        stale_refs = [dice_ref for dice_ref, _, _, stale in dice_rows if stale]
+        if stale_refs:
+            placeholders = ", ".join("?" * len(stale_refs))
+            stale = set(stale_refs)
+            face_rows = [row for row in face_rows if row[0] not in stale]
+            face_rows += cursor.execute(
+                f"""
+                SELECT dice_ref, dice_result, COUNT(*)
+                FROM rolls
+                WHERE dice_ref IN ({placeholders})
+                GROUP BY dice_ref, dice_result
+                """,
+                stale_refs,
+            ).fetchall()
+
+        row_by_ref = {dice_ref: index for index, (dice_ref, _, _, _) in enumerate(dice_rows)}
+        face_rows = [row for row in face_rows if row[0] in row_by_ref and row[2]]
+        if faces is None:
+            faces = max(
+                [sides or 0 for _, _, sides, _ in dice_rows] + [face for _, face, _ in face_rows],
+                default=0,
+            )
+
+        counts = np.zeros((len(dice_rows), faces), dtype=np.int64)
+        for dice_ref, face, count in face_rows:
+            if not 1 <= face <= faces:
+                name = dice_rows[row_by_ref[dice_ref]][1]
+                raise ValueError(f"Die '{name}' has rolls of {face}, outside 1..{faces}")
+            counts[row_by_ref[dice_ref], face - 1] = count
+
+        # A stale die may turn out to have had all of its rolls deleted.
+        sample_counts = counts.sum(axis=1)
+        keep = sample_counts > 0
+        return FaceCountMatrix(
+            dice_ids=tuple(name for (_, name, _, _), kept in zip(dice_rows, keep) if kept),
+            dice_sides=tuple(sides for (_, _, sides, _), kept in zip(dice_rows, keep) if kept),
+            counts=counts[keep],
+            sample_counts=sample_counts[keep],
+        )
+
+    def read_die_stats(self, dice_id: str) -> DieStats | None:
+        """Return the materialized aggregates for one die, or None if it has no rolls."""
+        return self._query_die_stats("dice.name = ?", (str(dice_id),)).get(str(dice_id))
+
+    def read_changes(
+        self,
+        since: ChangeWatermark | None = None,
+        dice_id: str | None = None,
+        limit: int | None = None,
+    ) -> ChangeSet:
+        """Return rolls added and deleted after since, for one die or all dice.
+
+        Pass the returned watermark back in to pick up only later changes. With a
+        limit, at most that many new rows are returned and the rest follow on the
+        next call. Rows and tombstones are read from one snapshot, so a roll that
+        was added and deleted between calls is never reported at all.
+
+        Rolls are append-only apart from their image path; to correct a result,
+        delete the roll and write a new one so consumers see both changes.
+        """
+        since = since or ChangeWatermark()
+        name = None if dice_id is None else str(dice_id)
+        conn = self._connections.read_connection()
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
         try:
             cursor.execute(
-                """
-                SELECT dice_id, timestamp, dice_sides, dice_result, image
-                FROM test_results
-                WHERE dice_id = ?
-                ORDER BY timestamp
+                f"""
+                SELECT dice.name, rolls.timestamp_us, dice.sides, rolls.dice_result, rolls.image, rolls.roll_id
+                FROM rolls
+                JOIN dice ON dice.dice_ref = rolls.dice_ref
+                WHERE rolls.roll_id > ?
+                AND (? IS NULL OR dice.name = ?)
+                ORDER BY rolls.roll_id
+                {"LIMIT ?" if limit is not None else ""}
                 """,
-                (str(dice_id),),
+                (since.roll_id, name, name) + ((int(limit),) if limit is not None else ()),
             )
+            rows = []
             for row in cursor.fetchall():
-                rows.append({
-                    "dice_id": row[0],
-                    "timestamp": row[1],
-                    "dice_sides": row[2],
-                    "dice_result": row[3],
-                    "image": row[4],
-                })
+                row_dict = self._row_dict(row)
+                row_dict["roll_id"] = row[5]
+                rows.append(row_dict)
+
+            cursor.execute(
+                """
+                SELECT dice_name, timestamp_us, dice_result, roll_id, tombstone_id
+                FROM roll_tombstones
+                WHERE tombstone_id > ?
+                AND roll_id <= ?
+                AND (? IS NULL OR dice_name = ?)
+                ORDER BY tombstone_id
+                """,
+                (since.tombstone_id, since.roll_id, name, name),
+            )
+            deleted = [
+                {
+                    "dice_id": dice_name,
+                    "timestamp": us_to_timestamp(timestamp_us),
+                    "dice_result": dice_result,
+                    "roll_id": roll_id,
+                }
+                for dice_name, timestamp_us, dice_result, roll_id, _ in cursor.fetchall()
+            ]
+
+            if limit is not None and len(rows) == int(limit):
+                last_roll_id = rows[-1]["roll_id"]
+            else:
+                last_roll_id = cursor.execute("SELECT COALESCE(MAX(roll_id), 0) FROM rolls").fetchone()[0]
+            last_tombstone_id = cursor.execute(
+                "SELECT COALESCE(MAX(tombstone_id), 0) FROM roll_tombstones"
+            ).fetchone()[0]
+            pruned_through = cursor.execute(
+                "SELECT COALESCE(MAX(next_value), 0) FROM id_sequences WHERE name = ?",
+                (TOMBSTONES_PRUNED_SEQUENCE,),
+            ).fetchone()[0]
         finally:
-            self.close_connection(conn)
+            cursor.execute("COMMIT")
+
+        return ChangeSet(
+            rows=rows,
+            deleted=deleted,
+            watermark=ChangeWatermark(
+                roll_id=max(since.roll_id, last_roll_id),
+                tombstone_id=max(since.tombstone_id, last_tombstone_id),
+            ),
+            # A consumer with no rolls yet has nothing that a pruned delete could affect.
+            missed_deletes=since.roll_id > 0 and since.tombstone_id < pruned_through,
+        )
+
+    def prune_tombstones(self, watermark: ChangeWatermark, wait=False) -> Future:
+        """Drop tombstones at or below watermark once every consumer has applied them.
+
+        The writer also prunes on its own past TOMBSTONE_RETENTION_ROWS.
+        """
+        delete_sql, mark_sql = _PRUNE_TOMBSTONES_SQL
+        future = self._queue_db_command(
+            QuCmd.DB_EXECUTE_STATEMENTS,
+            [
+                (delete_sql, (watermark.tombstone_id,)),
+                (mark_sql, (TOMBSTONES_PRUNED_SEQUENCE, watermark.tombstone_id)),
+            ],
+        )
+        if wait:
+            future.result()
+        return future
+
+    def _export_columns(self, dice_ids: list[str] | None) -> dict[str, np.ndarray]:
+        """Read dice and rolls (optionally limited to dice_ids) into export arrays."""
+        cursor = self._read_cursor()
+        if dice_ids is None:
+            dice_rows = cursor.execute(
+                "SELECT dice_ref, name, sides, dice_group FROM dice ORDER BY name"
+            ).fetchall()
+        else:
+            names = [str(dice_id) for dice_id in dice_ids]
+            dice_rows = cursor.execute(
+                f"""
+                SELECT dice_ref, name, sides, dice_group FROM dice
+                WHERE name IN ({", ".join("?" for _ in names)})
+                ORDER BY name
+                """,
+                names,
+            ).fetchall()
+
+        blocks = []
+        images: list[str] = []
+        for index, (dice_ref, _, _, _) in enumerate(dice_rows):
+            cursor.execute(
+                "SELECT timestamp_us, dice_result, image FROM rolls WHERE dice_ref = ? ORDER BY timestamp_us",
+                (dice_ref,),
+            )
+            while True:
+                chunk = cursor.fetchmany(RESULT_CHUNK_ROWS)
+                if not chunk:
+                    break
+                block = np.empty((len(chunk), 3), dtype=np.int64)
+                block[:, 0] = index
+                block[:, 1:] = [row[:2] for row in chunk]
+                blocks.append(block)
+                images.extend(row[2] for row in chunk)
+
+        rolls = np.concatenate(blocks) if blocks else np.empty((0, 3), dtype=np.int64)
+        faces = rolls[:, 2]
+        return {
+            "format_version": np.array(EXPORT_FORMAT_VERSION, dtype=np.int64),
+            "dice_names": np.array([row[1] for row in dice_rows], dtype=np.str_),
+            "dice_sides": np.array([-1 if row[2] is None else row[2] for row in dice_rows], dtype=np.int64),
+            "dice_groups": np.array([row[3] or "" for row in dice_rows], dtype=np.str_),
+            "dice_group_set": np.array([row[3] is not None for row in dice_rows], dtype=bool),
+            "roll_dice_index": rolls[:, 0].astype(np.int32),
+            "timestamps_us": np.ascontiguousarray(rolls[:, 1]),
+            "faces": faces.astype(np.uint8) if faces.size == 0 or (faces.min() >= 0 and faces.max() <= 255) else faces,
+            # Fixed-width string arrays would cost the longest path's width on every row.
+            **_pack_images(images),
+        }
+
+    def export_results(self, path: Path, dice_ids: list[str] | None = None) -> int:
+        """Write rolls for dice_ids (or every die) to a compressed columnar file.
+
+        A .parquet path is written with pyarrow, which must be installed; anything
+        else is written as a NumPy .npz archive. Image paths are exported as stored,
+        relative to the capture root. Returns the number of rolls written.
+        """
+        path = Path(path)
+        columns = self._export_columns(dice_ids)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if path.suffix == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as error:
+                raise ImportError("Parquet export needs pyarrow; use a .npz path instead.") from error
+
+            index = columns["roll_dice_index"]
+            sides = columns["dice_sides"][index]
+            group_set = columns["dice_group_set"][index]
+            images = _unpack_images(columns)
+            table = pa.table(
+                {
+                    "dice_id": pa.DictionaryArray.from_arrays(index, columns["dice_names"].tolist()),
+                    "dice_sides": pa.array(sides, mask=sides < 0),
+                    "dice_group": pa.DictionaryArray.from_arrays(
+                        pa.array(index, mask=~group_set), columns["dice_groups"].tolist()
+                    ),
+                    "timestamp_us": columns["timestamps_us"],
+                    "dice_result": columns["faces"],
+                    "image": images,
+                },
+                metadata={"format_version": str(EXPORT_FORMAT_VERSION)},
+            )
+            pq.write_table(table, path, compression="zstd")
+        else:
+            with open(path, "wb") as handle:
+                np.savez_compressed(handle, **columns)
 
         if self.logging:
-            print(f"  -> Read {len(rows)} result(s) for dice_id={dice_id}")
-        return rows
+            print(f"  -> Exported {len(columns['faces'])} roll(s) to {path}")
+        return int(len(columns["faces"]))
+
+    def _read_export(self, path: Path) -> dict[str, np.ndarray]:
+        """Load an export_results() file back into its export arrays."""
+        if path.suffix == ".parquet":
+            try:
+                import pyarrow.parquet as pq
+            except ImportError as error:
+                raise ImportError("Parquet import needs pyarrow.") from error
+
+            table = pq.read_table(path)
+            version = int((table.schema.metadata or {}).get(b"format_version", b"0"))
+            if version != EXPORT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported export format version {version} in {path}")
+
+            dice_id = table.column("dice_id").combine_chunks()
+            names = dice_id.dictionary.to_pylist()
+            index = dice_id.indices.to_numpy(zero_copy_only=False).astype(np.int32)
+            sides = np.full(len(names), -1, dtype=np.int64)
+            groups = np.array([""] * len(names), dtype=object)
+            group_set = np.zeros(len(names), dtype=bool)
+            # Every roll of a die carries the same sides/group, so read them from its first row.
+            dice_indices, first_rows = np.unique(index, return_index=True)
+            row_sides = table.column("dice_sides").take(first_rows).to_pylist()
+            row_groups = table.column("dice_group").take(first_rows).to_pylist()
+            for dice_index, side, group in zip(dice_indices.tolist(), row_sides, row_groups):
+                if side is not None:
+                    sides[dice_index] = side
+                if group is not None:
+                    groups[dice_index] = group
+                    group_set[dice_index] = True
+            return {
+                "dice_names": np.array(names, dtype=np.str_),
+                "dice_sides": sides,
+                "dice_groups": groups.astype(np.str_),
+                "dice_group_set": group_set,
+                "roll_dice_index": index,
+                "timestamps_us": table.column("timestamp_us").to_numpy(),
+                "faces": table.column("dice_result").to_numpy(),
+                **_pack_images(table.column("image").to_pylist()),
+            }
+
+        with np.load(path, allow_pickle=False) as archive:
+            version = int(archive["format_version"])
+            if version != EXPORT_FORMAT_VERSION:
+                raise ValueError(f"Unsupported export format version {version} in {path}")
+            return {name: archive[name] for name in archive.files}
+
+    def import_results(self, path: Path) -> int:
+        """Bulk-load an export_results() file through the writer in a single transaction.
+
+        Only the file path is queued: the writer (or the writer service, in its own
+        process) reads the file and streams the rolls in. Dice are registered (keeping
+        any sides/group already recorded here) and rolls already present for the same
+        die and timestamp are skipped, so importing a file twice is harmless. Returns
+        the number of rolls inserted.
+        """
+        path = Path(path).resolve()
+        inserted = self._queue_db_command(QuCmd.DB_IMPORT_RESULTS, {"path": str(path)}).result()
+
+        if self.logging:
+            print(f"  -> Imported {inserted} roll(s) from {path}")
+        return inserted
+
+    def _import_results_file(self, cursor, path: Path) -> int:
+        """Insert an export file's dice and rolls inside the writer's open transaction.
+
+        Each die's dice_ref is resolved once, and rolls go to executemany() in
+        IMPORT_CHUNK_ROWS slices built straight from the file's NumPy columns.
+        """
+        columns = self._read_export(path)
+        names = columns["dice_names"].tolist()
+        roll_count = len(columns["faces"])
+        if len(columns["image_offsets"]) != roll_count + 1:
+            raise ValueError(f"{path} has {roll_count} rolls but {len(columns['image_offsets']) - 1} image paths")
+
+        cursor.executemany(
+            """
+            INSERT INTO dice (name, sides, dice_group) VALUES (?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                sides = COALESCE(dice.sides, excluded.sides),
+                dice_group = COALESCE(dice.dice_group, excluded.dice_group)
+            """,
+            [
+                (name, None if sides < 0 else int(sides), group if group_set else None)
+                for name, sides, group, group_set in zip(
+                    names,
+                    columns["dice_sides"].tolist(),
+                    columns["dice_groups"].tolist(),
+                    columns["dice_group_set"].tolist(),
+                )
+            ],
+        )
+        cursor.executemany(_MARK_STATS_STALE_SQL, [(name, name) for name in names])
+        dice_refs = np.array(
+            [cursor.execute("SELECT dice_ref FROM dice WHERE name = ?", (name,)).fetchone()[0] for name in names],
+            dtype=np.int64,
+        )
+
+        # Per-roll trigger work dominates a bulk load, so the insert trigger is dropped
+        # for the load and recreated before the transaction commits; the touched dice
+        # were marked stale above and are rebuilt once when the batch finishes.
+        cursor.execute("DROP TRIGGER die_stats_after_insert")
+        inserted = 0
+        for start in range(0, roll_count, IMPORT_CHUNK_ROWS):
+            stop = min(start + IMPORT_CHUNK_ROWS, roll_count)
+            cursor.executemany(
+                "INSERT OR IGNORE INTO rolls (dice_ref, timestamp_us, dice_result, image) VALUES (?, ?, ?, ?)",
+                zip(
+                    dice_refs[columns["roll_dice_index"][start:stop]].tolist(),
+                    columns["timestamps_us"][start:stop].tolist(),
+                    columns["faces"][start:stop].tolist(),
+                    _unpack_images(columns, start, stop),
+                ),
+            )
+            inserted += max(cursor.rowcount, 0)
+        cursor.execute(_DIE_STATS_INSERT_TRIGGER_SQL)
+        return inserted
+
+    def rebuild_die_stats(self, dice_id: str | None = None, wait=True) -> Future:
+        """Recompute aggregates from the raw rolls for one die, or for every die when dice_id is None."""
+        future = self._queue_db_command(
+            QuCmd.DB_EXECUTE_SQL,
+            {
+                "sql": _MARK_STATS_STALE_SQL,
+                "params": (dice_id, None if dice_id is None else str(dice_id)),
+            },
+        )
+        if wait:
+            future.result()
+        return future
 
     def clear_all_data(self):
         """
-        Clear all data from the test_results table in the database.
+        Clear all rolls and registered dice from the database.
         """
         if self.logging:
             print("database.py clear_all_data() called.")
 
-        self._queue_db_command(QuCmd.DB_CLEAR_ALL_DATA, None)
-        self.wait_for_writes()
+        self._queue_db_command(QuCmd.DB_CLEAR_ALL_DATA, None).result()
 
         if self.logging:
-            print("  -> All data cleared from the database.")
\ No newline at end of file
+            print("  -> All data cleared from the database.")
@@ -0,0 +1,40 @@
+"""
+Command line wrapper around DBManager.export_results() and DBManager.import_results().
+
+    python -m Scripts.Modules.Database.transfer export rolls.npz [--dice-id 12 ...]
+    python -m Scripts.Modules.Database.transfer import rolls.npz
+"""
+
+import argparse
+from pathlib import Path
+import time
+
+from Scripts.Modules.Database.database import DBManager, DBPath
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Move dice results between databases as compressed columnar files.')
+    parser.add_argument('--db-path', type=Path, default=DBPath, help='Database file to read from or load into.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Write results to a .npz (or .parquet) file.')
+    export_parser.add_argument('path', type=Path)
+    export_parser.add_argument('--dice-id', action='append', dest='dice_ids', help='Limit the export to this die; repeatable.')
+
+    import_parser = subparsers.add_parser('import', help='Bulk-load a file written by export.')
+    import_parser.add_argument('path', type=Path)
+
+    args = parser.parse_args()
+    db = DBManager(db_path=args.db_path)
+    started = time.perf_counter()
+
+    if args.command == 'export':
+        count = db.export_results(args.path, dice_ids=args.dice_ids)
+        print(f'Exported {count} roll(s) to {args.path} in {time.perf_counter() - started:.2f} s')
+    else:
+        count = db.import_results(args.path)
+        print(f'Imported {count} new roll(s) from {args.path} in {time.perf_counter() - started:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
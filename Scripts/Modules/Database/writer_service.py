@@ -0,0 +1,227 @@
+"""
+Single writer process for dice.db.
+
+Every DBManager forwards its queued writes here when the service is running, so one
+process owns all commits to the file no matter how many tools or rigs are open.
+Readers keep using their own WAL snapshot connections.
+"""
+
+# Parallelism support imports
+import argparse
+from concurrent.futures import Future
+import multiprocessing as mp
+from multiprocessing.connection import AuthenticationError, Client, Connection, Listener
+import os
+import secrets
+import threading
+
+# Datatype support imports
+from pathlib import Path
+
+# Project module imports
+from Scripts.Modules.Database.database import (
+    DBManager,
+    DBPath,
+    connect_writer_service,
+    read_writer_service_key,
+    recv_writer_message,
+    send_writer_message,
+    writer_error_message,
+    writer_service_address,
+    writer_service_key_path,
+)
+from Scripts.Modules.queue_data import Command as QuCmd
+
+WRITER_SERVICE_KEY_BYTES = 32
+
+# Commands a client may submit; DBManager translates every other command into
+# DB_EXECUTE_STATEMENTS before forwarding it.
+WRITER_SERVICE_COMMANDS = {
+    cmd.name: cmd for cmd in (QuCmd.DB_EXECUTE_STATEMENTS, QuCmd.DB_QUERY_STATEMENTS, QuCmd.DB_IMPORT_RESULTS)
+}
+
+
+class WriterService:
+    """Accept write batches over local IPC and commit them through one DBManager writer.
+
+    Messages are JSON. A client sends {"op": "write", "commands": [...]}, where a
+    command is {"cmd": name, "statements": [...]} with the name of a
+    WRITER_SERVICE_COMMANDS member and the statements DBManager built for it, or
+    {"cmd": "DB_IMPORT_RESULTS", "path": ...} for an export file the service loads
+    itself. The reply is a list with null for each committed command that returns
+    nothing, {"result": ...} for one that does, or the writer_error_message() of
+    the error that failed it. {"op": "shutdown"} stops the service. Commands from
+    all clients share the writer thread's group commits.
+
+    Connections authenticate with a random key generated for each service instance
+    and stored in a file only the owning user can read.
+    """
+
+    def __init__(self, db_path: Path = DBPath, logging=False, ready=None):
+        """ready is set once clients can connect; any threading/multiprocessing Event works."""
+        self.db_path = Path(db_path)
+        self.logging = logging
+        self.db = DBManager(db_path=self.db_path, logging=logging, use_writer_service=False)
+        self.ready = ready if ready is not None else threading.Event()
+        self._stopping = threading.Event()
+
+    def serve_forever(self):
+        """Listen for clients until stop() is called or a client requests shutdown."""
+        address, family = writer_service_address(self.db_path)
+        running = connect_writer_service(self.db_path)
+        if running is not None:
+            running.close()
+            raise RuntimeError(f"A writer service is already running for {self.db_path}")
+        if family == "AF_UNIX" and os.path.exists(address):
+            # Left behind by a service that did not shut down cleanly.
+            os.unlink(address)
+
+        authkey = _write_service_key(self.db_path)
+        self.db.start_writer()
+        try:
+            with Listener(address, family=family, authkey=authkey) as listener:
+                self.ready.set()
+                if self.logging:
+                    print(f"writer_service.py listening on {address} for {self.db_path}")
+                while not self._stopping.is_set():
+                    try:
+                        conn = listener.accept()
+                    except (OSError, EOFError, AuthenticationError):
+                        continue
+                    if self._stopping.is_set():
+                        conn.close()
+                        break
+                    threading.Thread(
+                        target=self._serve_client,
+                        args=(conn,),
+                        name="writer-service-client",
+                        daemon=True,
+                    ).start()
+        finally:
+            writer_service_key_path(self.db_path).unlink(missing_ok=True)
+            self.db.wait_for_writes()
+            self.db.stop_writer()
+            if self.logging:
+                print("writer_service.py stopped.")
+
+    def stop(self):
+        """Stop accepting clients and let serve_forever() flush and return."""
+        self._stopping.set()
+        # Wake the blocking accept() so the serve loop sees the flag.
+        wake = connect_writer_service(self.db_path)
+        if wake is not None:
+            wake.close()
+
+    def _serve_client(self, conn: Connection):
+        """Apply one client's batches in the order they arrive and acknowledge each."""
+        with conn:
+            while True:
+                try:
+                    request = recv_writer_message(conn)
+                except (EOFError, OSError, ValueError):
+                    return
+
+                if not isinstance(request, dict):
+                    return
+                if request.get("op") == "shutdown":
+                    send_writer_message(conn, None)
+                    self.stop()
+                    return
+
+                futures = []
+                for command in request.get("commands", ()):
+                    cmd = WRITER_SERVICE_COMMANDS.get(command.get("cmd"))
+                    if cmd is None:
+                        future = Future()
+                        future.set_exception(ValueError(f"Unsupported writer service command: {command.get('cmd')}"))
+                    elif cmd == QuCmd.DB_IMPORT_RESULTS:
+                        future = self.db._queue_db_command(cmd, {"path": command["path"]})
+                    else:
+                        future = self.db._queue_db_command(cmd, command["statements"])
+                    futures.append(future)
+                acknowledgements = []
+                for future in futures:
+                    error = future.exception()
+                    if error is not None:
+                        acknowledgements.append(writer_error_message(error))
+                    else:
+                        result = future.result()
+                        acknowledgements.append(None if result is None else {"result": result})
+
+                try:
+                    send_writer_message(conn, acknowledgements)
+                except OSError:
+                    return
+
+
+def _write_service_key(db_path: Path) -> bytes:
+    """Generate this instance's IPC key and store it in a new file readable only by its owner."""
+    authkey = secrets.token_bytes(WRITER_SERVICE_KEY_BYTES)
+    key_path = writer_service_key_path(db_path)
+    # Never reuse a key file left behind by a service that did not shut down cleanly.
+    key_path.unlink(missing_ok=True)
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as handle:
+        handle.write(authkey)
+    return authkey
+
+
+def run_writer_service(db_path: Path = DBPath, logging=False, ready=None):
+    """Process entry point: serve writes for db_path until shutdown is requested."""
+    WriterService(db_path, logging=logging, ready=ready).serve_forever()
+
+
+def start_writer_service(db_path: Path = DBPath, logging=False, timeout=10.0) -> mp.Process | None:
+    """Start the writer service in a child process and wait until it accepts clients.
+
+    Returns None if another process already runs a service for db_path.
+    """
+    running = connect_writer_service(db_path)
+    if running is not None:
+        running.close()
+        return None
+
+    ready = mp.Event()
+    process = mp.Process(
+        target=run_writer_service,
+        args=(Path(db_path), logging, ready),
+        name="sqlite-writer-service",
+        daemon=True,
+    )
+    process.start()
+    if not ready.wait(timeout):
+        process.terminate()
+        raise RuntimeError(f"Writer service for {db_path} did not start within {timeout} s")
+    return process
+
+
+def stop_writer_service(db_path: Path = DBPath) -> bool:
+    """Ask the writer service for db_path to flush and exit. Returns False if none was running."""
+    address, family = writer_service_address(db_path)
+    authkey = read_writer_service_key(db_path)
+    if authkey is None:
+        return False
+    try:
+        conn = Client(address, family=family, authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return False
+
+    with conn:
+        send_writer_message(conn, {"op": "shutdown"})
+        try:
+            recv_writer_message(conn)
+        except (EOFError, OSError):
+            pass
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run the single writer process for the dice database.')
+    parser.add_argument('--db-path', type=Path, default=DBPath, help='Database file the service owns.')
+    parser.add_argument('--logging', action='store_true', help='Print service activity.')
+    args = parser.parse_args()
+    run_writer_service(args.db_path, logging=args.logging)
+
+
+if __name__ == '__main__':
+    main()
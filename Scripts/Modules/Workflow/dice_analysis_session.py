@@ -5,6 +5,8 @@ import time
 from enum import Enum, auto
 from threading import Lock
 from dataclasses import dataclass
+from functools import partial
+from typing import Callable
 
 import cv2
 from ultralytics import YOLO
@@ -12,6 +14,8 @@ from ultralytics import YOLO
 from Scripts.Modules.queue_data import QueueData, Command as QuCmd
 from Scripts.Modules.Dice.dice_factory import DiceFactory
 from Scripts.Modules.Dice.dice import DiceState
+from Scripts.Modules.Analysis.reporting import ReportAccumulator
+from Scripts.Modules.Analysis.sequential import SequentialDecision, SequentialTest
 from Scripts.Modules.Database.database import DBManager
 from Scripts.Modules.Storage.image_writer import write_frame_image
 from Scripts.Modules.Workflow.analysis_config import AnalysisConfig
@@ -63,7 +67,8 @@ def persist_analysis_roll(
         dice_value=dice_value,
         dice_sides=dice_sides,
     )
-    # Use wait=True so callback completion means the row has been written.
+    # Use wait=True so callback completion means the row has been written. The wait
+    # is on this row's own group-commit future, so concurrent rolls share one commit.
     db.write_test_result(dice_value, image_path, dice_sides=dice_sides, wait=True)
 
 
@@ -95,7 +100,11 @@ class DiceAnalysisSession:
         config: AnalysisConfig,
         target_samples: int,
         logging: bool = False,
+        sequential_test: SequentialTest | None = None,
     ) -> None:
+        if sequential_test is not None and dice.sides != sequential_test.dice_sides:
+            raise ValueError(f'Sequential test is for d{sequential_test.dice_sides} but the die has {dice.sides} sides')
+
         self.process_queue = process_queue
         self.process_data = process_data
         self.feed = feed
@@ -106,12 +115,13 @@ class DiceAnalysisSession:
         self.config = config
         self.target_samples = target_samples
         self.logging = logging
+        self.sequential_test = sequential_test
         self.state = AnalysisState.INITIALIZING
         self.sample_lock = Lock()
         self.submitted_samples = 0
         self.persisted_samples = 0
         self.awaiting_next_roll = False
-        self._face_counts: dict[int, int] = {}
+        self.roll_stats = ReportAccumulator(db.dice_id, dice.sides)
         self._persisted_timestamps: list[float] = []
         self._analysis_in_flight = False
         self._dropped_analysis_frames = 0
@@ -121,6 +131,11 @@ class DiceAnalysisSession:
         self._latest_crop_sharpness: float | None = None
 
     def begin_capture_loop(self) -> None:
+        # Reserve the dice ID before the first frame so concurrent rigs never share one.
+        if not self.db.dice_id:
+            self.db.generate_id()
+        self.roll_stats = ReportAccumulator(self.db.dice_id, self.dice.sides)
+
         if self.logging:
             print('main.py gather_dice_analysis_data() Moving to uncap position.')
         begin_camera_capture(self)
@@ -172,15 +187,10 @@ class DiceAnalysisSession:
                 db_linked=self.db.dice_id is not None,
                 dice_id=dice_id,
                 dice_sides=self.dice.sides,
-                total_rolls=sum(self._face_counts.values()) or None,
-                mean_roll=(
-                    sum(k * v for k, v in self._face_counts.items()) / sum(self._face_counts.values())
-                    if self._face_counts else None
-                ),
-                expected_mean=(
-                    (self.dice.sides + 1) / 2 if self.dice.sides else None
-                ),
-                face_counts=dict(self._face_counts),
+                total_rolls=self.roll_stats.sample_count or None,
+                mean_roll=self.roll_stats.mean_roll,
+                expected_mean=self.roll_stats.expected_mean_roll,
+                face_counts=self.roll_stats.face_counts,
                 detections=detections,
             )
             composited = composite_with_panel(rendered, ctx)
@@ -190,16 +200,22 @@ class DiceAnalysisSession:
             print(f'main.py on_analyze_frame_done() encountered an error: {e}.')
             self._analysis_in_flight = False
 
-    def on_persist_settled_roll_done(self, future) -> None:
+    def on_persist_settled_roll_done(self, future, face: int | None = None) -> None:
         try:
             future.result()
 
             should_exit = False
+            decision = None
             with self.sample_lock:
                 self.persisted_samples += 1
                 self._persisted_timestamps.append(time.time())
                 current = self.persisted_samples
                 should_exit = self.persisted_samples >= self.target_samples
+                # Only persisted rolls count toward the sequential test, so a stop is never
+                # decided on a roll that failed to reach the database.
+                if self.sequential_test is not None and face is not None and not self.sequential_test.decided:
+                    decision = self.sequential_test.update(face)
+                    should_exit = should_exit or decision.decided
 
             if self.logging:
                 print(
@@ -207,6 +223,12 @@ class DiceAnalysisSession:
                     f'{current}/{self.target_samples}.'
                 )
 
+            if decision is not None and decision.decided:
+                print(
+                    f'main.py gather_dice_analysis_data() sequential test decided {decision.verdict} '
+                    f'after {decision.samples_used} rolls; stopping the session.'
+                )
+
             if should_exit:
                 self.process_queue.put(QueueData(cmd=QuCmd.EXIT, data=None))
         except Exception as e:
@@ -283,13 +305,10 @@ class DiceAnalysisSession:
             db_linked=self.db.dice_id is not None,
             dice_id=str(self.db.dice_id) if self.db.dice_id else None,
             dice_sides=self.dice.sides,
-            total_rolls=sum(self._face_counts.values()) or None,
-            mean_roll=(
-                sum(k * v for k, v in self._face_counts.items()) / sum(self._face_counts.values())
-                if self._face_counts else None
-            ),
-            expected_mean=((self.dice.sides + 1) / 2) if self.dice.sides else None,
-            face_counts=dict(self._face_counts),
+            total_rolls=self.roll_stats.sample_count or None,
+            mean_roll=self.roll_stats.mean_roll,
+            expected_mean=self.roll_stats.expected_mean_roll,
+            face_counts=self.roll_stats.face_counts,
             detections=[],
         )
         self.stream.show_frame(composite_with_panel(item.data, ctx))
@@ -415,9 +434,6 @@ class DiceAnalysisSession:
                 if not self._settled_read_timed_out():
                     return
 
-                if not self.db.dice_id:
-                    self.db.generate_id()
-
                 image_executor.submit(
                     persist_unknown_roll,
                     self.config,
@@ -432,17 +448,16 @@ class DiceAnalysisSession:
                 self.process_queue.put(QueueData(cmd=QuCmd.GET_NEXT_SAMPLE, data=None))
                 return
 
-            self._face_counts[face] = self._face_counts.get(face, 0) + 1
-
-            if not self.db.dice_id:
-                self.db.generate_id()
-
             with self.sample_lock:
                 if self.submitted_samples >= self.target_samples:
                     return
+                if self.sequential_test is not None and self.sequential_test.decided:
+                    return
                 self.submitted_samples += 1
                 should_request_next = self.submitted_samples < self.target_samples
 
+            self.roll_stats.add(face)
+
             future_persist_roll = image_executor.submit(
                 persist_analysis_roll,
                 self.config,
@@ -452,7 +467,7 @@ class DiceAnalysisSession:
                 str(face),
                 self.dice.sides,
             )
-            future_persist_roll.add_done_callback(self.on_persist_settled_roll_done)
+            future_persist_roll.add_done_callback(partial(self.on_persist_settled_roll_done, face=face))
             self.awaiting_next_roll = True
             self._clear_stable_read_state()
 
@@ -499,7 +514,9 @@ def create_dice_analysis_session(
     target_samples: int,
     dice_id: str | None = None,
     logging: bool = False,
+    sequential_test_factory: Callable[[int], SequentialTest] | None = None,
 ) -> DiceAnalysisSession:
+    """Build a session for a new die; sequential_test_factory(dice_sides) builds its auto-stop test."""
     context = create_camera_workflow_context(
         main_queue,
         config,
@@ -507,6 +524,11 @@ def create_dice_analysis_session(
         motor_logging=False,
     )
     dice = DiceFactory.create_dice('six_sided_pips', logging=logging, data=context.process_data)
+    sequential_test = None
+    if sequential_test_factory is not None:
+        if dice.sides is None:
+            raise ValueError('A sequential test needs a die with a known number of sides')
+        sequential_test = sequential_test_factory(dice.sides)
     db = DBManager(dice_id=dice_id, logging=logging)
     return DiceAnalysisSession(
         process_queue=context.process_queue,
@@ -519,6 +541,7 @@ def create_dice_analysis_session(
         config=config,
         target_samples=target_samples,
         logging=logging,
+        sequential_test=sequential_test,
     )
 
 
@@ -528,8 +551,15 @@ def run_dice_analysis_session(
     target_samples: int,
     dice_id: str | None = None,
     logging: bool = False,
-) -> str | None:
-    """Run a dice analysis session and return the dice_id, or None if no samples were saved."""
+    sequential_test_factory: Callable[[int], SequentialTest] | None = None,
+) -> tuple[str | None, SequentialDecision | None]:
+    """Run a dice analysis session and return (dice_id, sequential decision).
+
+    dice_id is None if no samples were saved. With a sequential_test_factory the
+    session builds the test for the die's number of sides and stops as soon as it
+    reaches a verdict, treating target_samples as the upper limit; the decision is
+    None without one.
+    """
     session = None
     try:
         session = create_dice_analysis_session(
@@ -538,6 +568,7 @@ def run_dice_analysis_session(
             target_samples,
             dice_id=dice_id,
             logging=logging,
+            sequential_test_factory=sequential_test_factory,
         )
         session.begin_capture_loop()
 
@@ -561,4 +592,7 @@ def run_dice_analysis_session(
         if session is not None:
             session.cleanup()
 
-    return str(session.db.dice_id) if (session is not None and session.db.dice_id is not None) else None
+    if session is None or session.db.dice_id is None or session.submitted_samples == 0:
+        return None, None
+    decision = session.sequential_test.decision() if session.sequential_test is not None else None
+    return str(session.db.dice_id), decision
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -75,7 +76,7 @@ class DatabaseProtocol(Protocol):
         image: str | Path,
         dice_sides: int | None = None,
         wait: bool = False,
-    ) -> None:
+    ) -> Future | None:
         ...
 
     def wait_for_writes(self) -> None:
@@ -36,9 +36,13 @@ class Command(Enum):
     # Database control commands
     DB_EXECUTE_SQL = auto() # Command to execute a parameterized SQL write.
     DB_WRITE_TEST_RESULT = auto() # Command to write a test result row to the database.
-    DB_CLEAR_ALL_DATA = auto() # Command to delete all rows in test_results.
+    DB_EXECUTE_STATEMENTS = auto() # Command to execute (sql, params) statements forwarded to the writer service.
+    DB_QUERY_STATEMENTS = auto() # Command to execute (sql, params) statements and return the rows of the last one.
+    DB_IMPORT_RESULTS = auto() # Command to load an export file by path in the writer and return the number of rolls inserted.
+    DB_CLEAR_ALL_DATA = auto() # Command to delete all stored rolls and dice.
     DB_STOP_WRITER = auto() # Command to stop the database writer thread.
     VIEW_DICE_DATA = auto() # Command to view stored results for a given dice ID.
+    REGENERATE_ALL_REPORTS = auto() # Command to re-render every die's HTML report whose inputs changed.
 
 class QueueData:
     """
@@ -1,10 +1,21 @@
 # Parallel processing related imports
 import multiprocessing as mp
-from queue import Empty
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Full, Queue
+import threading
 
 # Project module imports
-from Scripts.Modules.Analysis.reporting import analyze_results, build_summary_lines, write_report
-from Scripts.Modules.Database.database import DBManager
+from Scripts.Modules.Analysis.bulk_reports import regenerate_reports
+from Scripts.Modules.Analysis.reporting import (
+    ReportAccumulator,
+    analyze_roll_columns,
+    build_summary_lines,
+    write_report,
+    write_text_atomic,
+)
+from Scripts.Modules.Analysis.sequential import SequentialTest
+from Scripts.Modules.Database.database import DBManager, DBPath, DieStats
+from Scripts.Modules.Database.writer_service import start_writer_service, stop_writer_service
 from Scripts.Modules.queue_data import QueueData, Command as QuCmd
 from Scripts.Modules.Stream.stream import Stream
 from Scripts.Modules.Motor.ad2 import Motor
@@ -18,10 +29,17 @@ from Scripts.Modules.Workflow.dice_analysis_session import run_dice_analysis_ses
 from Scripts.Modules.Workflow.sample_video_session import run_sample_video_session
 
 # Class support imports
+from dataclasses import replace
+from functools import partial
 from pathlib import Path
 from datetime import datetime
+import hashlib
+import json
+import os
 import re
 import shutil
+import sys
+import time
 
 # Image processing imports
 import cv2
@@ -40,30 +58,30 @@ ANALYSIS_CONFIG = AnalysisConfig(
     report_output_dir=ANALYSIS_IMAGE_OUTPUT_DIR,
 )
 MIGRATION_HAS_RUN = False
-
-
-def _compute_roll_stats(rows: list[dict], dice_sides: int | None = None) -> tuple[int | None, float | None, float | None, dict[int, int]]:
-    face_counts: dict[int, int] = {}
-    total = 0
-    weighted_sum = 0
-    for row in rows:
-        try:
-            face = int(row['dice_result'])
-        except (TypeError, ValueError):
-            continue
-        face_counts[face] = face_counts.get(face, 0) + 1
-        total += 1
-        weighted_sum += face
-
-    if total == 0:
+# Sequential auto-stop: smallest bias worth detecting (Cohen's w) and the two error rates.
+SEQUENTIAL_EFFECT_SIZE = 0.1
+SEQUENTIAL_ALPHA = 0.05
+SEQUENTIAL_BETA = 0.05
+# Capture-folder rebuild pipeline: reader threads decoding images, frames per model call,
+# and the most items waiting between stages (bounds the decoded frames held in memory).
+REBUILD_DECODE_WORKERS = min(8, os.cpu_count() or 1)
+REBUILD_INFERENCE_BATCH = 16
+REBUILD_QUEUE_SIZE = 64
+# Per-image predictions kept in each capture folder so reanalysis can resume, and how
+# many newly classified images are recorded between checkpoints of that file.
+REANALYSIS_STATE_FILENAME = 'reanalysis_state.json'
+REANALYSIS_CHECKPOINT_INTERVAL = 200
+
+
+def _compute_roll_stats(stats: DieStats | None, dice_sides: int | None = None) -> tuple[int | None, float | None, float | None, dict[int, int]]:
+    if stats is None or stats.roll_count == 0:
         return None, None, None, {}
 
-    mean_roll = weighted_sum / total
     # Infer sides from the highest face seen if not explicitly provided
-    if dice_sides is None and face_counts:
-        dice_sides = max(face_counts.keys())
-    expected_mean = ((dice_sides + 1) / 2) if dice_sides else None
-    return total, mean_roll, expected_mean, face_counts
+    if dice_sides is None and stats.dice_sides is None and stats.face_counts:
+        dice_sides = max(stats.face_counts.keys())
+    roll_stats = ReportAccumulator.from_die_stats(stats, dice_sides=dice_sides)
+    return roll_stats.sample_count, roll_stats.mean_roll, roll_stats.expected_mean_roll, roll_stats.face_counts
 
 
 def _parse_filename_token(stem: str, key: str) -> str | None:
@@ -169,49 +187,300 @@ def _write_empty_results_report(dice_id: str, output_dir: Path, total_images: in
     return report_path
 
 
+_PIPELINE_DONE = object()
+
+
+def _put_unless_stopped(queue: Queue, item, stop: threading.Event) -> bool:
+    """Block until item fits in the bounded queue, giving up once the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+class _RebuildProgress:
+    """Single-line progress bar with throughput, redrawn at most a few times a second."""
+
+    def __init__(self, total: int, width: int = 30):
+        self.total = total
+        self.width = width
+        self.done = 0
+        self.started = time.perf_counter()
+        self._last_drawn = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    def advance(self) -> None:
+        self.done += 1
+        now = time.perf_counter()
+        if self.done == self.total or now - self._last_drawn >= 0.25:
+            self._last_drawn = now
+            filled = self.width * self.done // max(self.total, 1)
+            bar = '#' * filled + '.' * (self.width - filled)
+            sys.stdout.write(f'\r  [{bar}] {self.done}/{self.total} images, {self.rate:.1f} images/s')
+            sys.stdout.flush()
+            if self.done == self.total:
+                sys.stdout.write('\n')
+
+
+def _classify_frames(frames: list, dice, model) -> list[int | None]:
+    """Run one batched model call and return each frame's validated die value, or None."""
+    values = []
+    for result in model(frames, verbose=False):
+        detected_dice = _count_matching_detections(result, dice._dice_key())
+        value = dice.get_dice_value(result) if detected_dice == 1 else None
+        is_valid = value is not None and 1 <= int(value) <= (dice.sides or int(value))
+        values.append(value if is_valid else None)
+    return values
+
+
+def _decode_capture_images(source_files: list[Path], decode_pool: ThreadPoolExecutor, decoded: Queue, stop: threading.Event) -> None:
+    """Decode stage: queue each image's pending read, in order, as the queue frees up."""
+    for image_path in source_files:
+        if not _put_unless_stopped(decoded, (image_path, decode_pool.submit(cv2.imread, str(image_path))), stop):
+            return
+    _put_unless_stopped(decoded, _PIPELINE_DONE, stop)
+
+
+def _file_classified_images(
+    classified: Queue,
+    images_dir: Path,
+    unknown_dir: Path,
+    on_filed,
+    progress: _RebuildProgress,
+    errors: list,
+    stop: threading.Event,
+) -> None:
+    """Mover stage: file each image under images/ or Unknown/ and report where it went."""
+    try:
+        while True:
+            try:
+                item = classified.get(timeout=0.1)
+            except Empty:
+                if stop.is_set():
+                    return
+                continue
+            if item is _PIPELINE_DONE:
+                return
+            image_path, value = item
+            destination = _move_file_unique(image_path, unknown_dir if value is None else images_dir)
+            on_filed(image_path, destination, value)
+            progress.advance()
+    except BaseException as error:
+        errors.append(error)
+        stop.set()
+
+
+def _classify_capture_images(source_files: list[Path], dice, model, images_dir: Path, unknown_dir: Path, on_filed) -> None:
+    """Classify and file source_files, calling on_filed(source, destination, value) in source order.
+
+    Runs as a pipeline: a thread pool decodes images ahead of the model, the model
+    classifies them REBUILD_INFERENCE_BATCH frames per call, and a mover thread files
+    each image. Bounded queues between the stages cap memory.
+    """
+    progress = _RebuildProgress(len(source_files))
+    decoded = Queue(maxsize=REBUILD_QUEUE_SIZE)
+    classified = Queue(maxsize=REBUILD_QUEUE_SIZE)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+    inference_seconds = 0.0
+
+    mover = threading.Thread(
+        target=_file_classified_images,
+        args=(classified, images_dir, unknown_dir, on_filed, progress, errors, stop),
+        name='rebuild-mover',
+        daemon=True,
+    )
+    mover.start()
+    with ThreadPoolExecutor(max_workers=REBUILD_DECODE_WORKERS, thread_name_prefix='rebuild-decode') as decode_pool:
+        decoder = threading.Thread(
+            target=_decode_capture_images,
+            args=(source_files, decode_pool, decoded, stop),
+            name='rebuild-decoder',
+            daemon=True,
+        )
+        decoder.start()
+        batch: list[tuple[Path, object]] = []
+
+        def classify_batch() -> None:
+            nonlocal inference_seconds
+            if not batch:
+                return
+            started = time.perf_counter()
+            values = _classify_frames([frame for _, frame in batch], dice, model)
+            inference_seconds += time.perf_counter() - started
+            for (image_path, _), value in zip(batch, values):
+                _put_unless_stopped(classified, (image_path, value), stop)
+            batch.clear()
+
+        try:
+            while not stop.is_set():
+                try:
+                    item = decoded.get(timeout=0.1)
+                except Empty:
+                    continue
+                if item is _PIPELINE_DONE:
+                    break
+                image_path, pending_frame = item
+                frame = pending_frame.result()
+                if frame is None:
+                    # Unreadable: classify what is already batched first so order is kept.
+                    classify_batch()
+                    _put_unless_stopped(classified, (image_path, None), stop)
+                    continue
+                batch.append((image_path, frame))
+                if len(batch) >= REBUILD_INFERENCE_BATCH:
+                    classify_batch()
+            classify_batch()
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            _put_unless_stopped(classified, _PIPELINE_DONE, stop)
+            mover.join()
+            stop.set()
+            decoder.join()
+
+    if errors:
+        raise errors[0]
+    print(
+        f'Classified {len(source_files)} image(s) in {progress.elapsed:.1f} s '
+        f'({progress.rate:.1f} images/s, {inference_seconds:.1f} s in the model).'
+    )
+
+
+def _model_file_hash(model_path: Path) -> str:
+    """Short SHA-256 of the model weights, identifying which model made a prediction."""
+    digest = hashlib.sha256()
+    with open(model_path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+class _ReanalysisState:
+    """Per-image predictions for one capture folder, checkpointed to a JSON file.
+
+    Images are keyed by their path inside the folder, after filing. Each entry keeps
+    the file's size and modification time, so a replaced image is classified again,
+    plus the hash of the model that classified it and its value (None for unknown).
+    """
+
+    def __init__(self, capture_dir: Path, model_hash: str):
+        self.capture_dir = capture_dir
+        self.path = capture_dir / REANALYSIS_STATE_FILENAME
+        self.model_hash = model_hash
+        self._unsaved = 0
+        try:
+            self.images = json.loads(self.path.read_text(encoding='utf-8'))['images']
+        except (OSError, ValueError, KeyError, TypeError):
+            self.images = {}
+
+    def _key(self, image_path: Path) -> str:
+        return image_path.relative_to(self.capture_dir).as_posix()
+
+    def current_value(self, image_path: Path) -> tuple[bool, int | None]:
+        """Return (True, value) when this model already classified this exact file, else (False, None)."""
+        entry = self.images.get(self._key(image_path))
+        if not isinstance(entry, dict) or entry.get('model') != self.model_hash:
+            return False, None
+        stat = image_path.stat()
+        if entry.get('size') != stat.st_size or entry.get('mtime_ns') != stat.st_mtime_ns:
+            return False, None
+        return True, entry.get('value')
+
+    def record(self, image_path: Path, value: int | None) -> None:
+        stat = image_path.stat()
+        self.images[self._key(image_path)] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'model': self.model_hash,
+            'value': None if value is None else int(value),
+        }
+        self._unsaved += 1
+        if self._unsaved >= REANALYSIS_CHECKPOINT_INTERVAL:
+            self.save()
+
+    def save(self, keep: list[Path] | None = None) -> None:
+        """Write the state file, first dropping images outside keep when it is given."""
+        if keep is not None:
+            kept = {self._key(image_path) for image_path in keep}
+            self.images = {key: entry for key, entry in self.images.items() if key in kept}
+        write_text_atomic(self.path, json.dumps({'images': self.images}, separators=(',', ':')))
+        self._unsaved = 0
+
+
 def _rebuild_capture_folder_results(
     dice_id: str,
     capture_dir: Path,
     db: DBManager,
     dice,
     model,
+    model_hash: str | None = None,
 ) -> tuple[Path, int, int, int]:
+    """Re-detect the images in a capture folder and rebuild the die's results from them.
+
+    The die's rows are only replaced once every image is classified, in one
+    transaction, so an interrupted rebuild leaves the previous results in place. Given
+    model_hash, each image's prediction is checkpointed in the folder's state file and
+    images this model already classified are not run through it again, so a rerun
+    after a crash or after adding images only classifies what is new.
+    """
     source_files = _iter_capture_image_files(capture_dir)
     if not source_files:
         raise ValueError('No image files found to process.')
 
-    db.delete_results_for_die(dice_id, wait=True)
-
     images_dir = capture_dir / 'images'
     unknown_dir = capture_dir / 'Unknown'
-    valid_count = 0
-    unknown_count = 0
-
+    state = _ReanalysisState(capture_dir, model_hash) if model_hash else None
+    outcomes: dict[Path, tuple[Path, int | None]] = {}
+    pending = []
     for image_path in source_files:
-        frame = cv2.imread(str(image_path))
-        if frame is None:
-            _move_file_unique(image_path, unknown_dir)
-            unknown_count += 1
-            continue
-
-        result = model(frame, verbose=False)[0]
-        detected_dice = _count_matching_detections(result, dice._dice_key())
-        value = dice.get_dice_value(result) if detected_dice == 1 else None
-        is_valid = value is not None and 1 <= int(value) <= (dice.sides or int(value))
-
-        if is_valid:
-            moved_to = _move_file_unique(image_path, images_dir)
-            db.write_test_result(str(value), str(moved_to), dice_sides=dice.sides, wait=False)
-            valid_count += 1
+        known, value = state.current_value(image_path) if state else (False, None)
+        if known:
+            outcomes[image_path] = (image_path, value)
         else:
-            _move_file_unique(image_path, unknown_dir)
-            unknown_count += 1
+            pending.append(image_path)
+    if len(pending) < len(source_files):
+        print(f'Reusing {len(source_files) - len(pending)} current prediction(s); classifying {len(pending)} image(s).')
 
-    db.wait_for_writes()
-    rows = db.read_results_for_die(dice_id)
+    def on_filed(source: Path, destination: Path, value: int | None) -> None:
+        outcomes[source] = (destination, value)
+        if state is not None:
+            state.record(destination, value)
 
-    if rows:
-        report = analyze_results(dice_id=dice_id, rows=rows, dice_sides=dice.sides or 6)
+    if pending:
+        try:
+            _classify_capture_images(pending, dice, model, images_dir, unknown_dir, on_filed)
+        finally:
+            if state is not None:
+                state.save()
+
+    filed = [outcomes[image_path] for image_path in source_files]
+    if state is not None:
+        state.save(keep=[destination for destination, _ in filed])
+    valid_results = [(value, str(destination)) for destination, value in filed if value is not None]
+    valid_count = len(valid_results)
+    unknown_count = len(source_files) - valid_count
+    db.replace_results_for_die(dice_id, valid_results, dice_sides=dice.sides, wait=True)
+    columns = db.read_columns_for_die(dice_id)
+
+    if columns is not None and len(columns):
+        report = analyze_roll_columns(
+            dice_id=dice_id,
+            faces=columns.faces,
+            timestamps_us=columns.timestamps_us,
+            dice_sides=dice.sides or 6,
+        )
         report_path = write_report(report, capture_dir)
     else:
         report_path = _write_empty_results_report(dice_id, capture_dir, len(source_files), unknown_count)
@@ -237,6 +506,13 @@ def main() -> None:
     print('Starting the Tester Application...')
     print('==================================')
 
+    # One process owns every database write; DBManager instances forward to it.
+    writer_process = None
+    try:
+        writer_process = start_writer_service(DBPath, logging=ENABLE_LOGGING)
+    except Exception as e:
+        print(f'main.py main() could not start the database writer service: {e}. Writing directly instead.')
+
     main_queue = mp.Queue()
     main_queue.put(QueueData(cmd=QuCmd.MAIN_MENU, data=None))
 
@@ -266,6 +542,8 @@ def main() -> None:
                     rerun_analysis_on_capture_folder(main_queue)
                 case QuCmd.VIEW_DICE_DATA:
                     view_dice_data(main_queue)
+                case QuCmd.REGENERATE_ALL_REPORTS:
+                    regenerate_all_reports(main_queue)
                 case QuCmd.EXIT:
                     break
         except Empty:
@@ -275,6 +553,9 @@ def main() -> None:
             break
 
     close_queue(main_queue)
+    if writer_process is not None:
+        stop_writer_service(DBPath)
+        writer_process.join(timeout=10)
 
 
 def top_level(queue: mp.Queue) -> None:
@@ -292,9 +573,10 @@ def top_level(queue: mp.Queue) -> None:
     print('8) Clear collected analysis data')
     print('9) Clear one dice ID data')
     print('10) Rerun analysis on captured photos')
+    print('11) Regenerate all dice reports')
     print('=' * 50)
 
-    choice = input('Enter your choice (0-10): ').strip()
+    choice = input('Enter your choice (0-11): ').strip()
 
     match choice:
         case '0':
@@ -341,6 +623,10 @@ def top_level(queue: mp.Queue) -> None:
             if ENABLE_LOGGING:
                 print("'Rerun analysis on captured photos' selected.")
             queue.put(QueueData(cmd=QuCmd.RERUN_ANALYSIS_ON_CAPTURE_FOLDER, data=None))
+        case '11':
+            if ENABLE_LOGGING:
+                print("'Regenerate all dice reports' selected.")
+            queue.put(QueueData(cmd=QuCmd.REGENERATE_ALL_REPORTS, data=None))
         case _:
             if ENABLE_LOGGING:
                 print(f'You selected: {choice}. This option is not implemented yet.')
@@ -447,14 +733,7 @@ def view_image_folder(queue: mp.Queue) -> None:
     image_queue = mp.Queue()
     stream = None
     db = DBManager(logging=False)
-    image_row_lookup: dict[Path, dict] = {}
-    rows_by_dice_id: dict[str, list[dict]] = {}
-
-    for row in db.read_all_results():
-        image_path = Path(row['image']).expanduser().resolve()
-        image_row_lookup[image_path] = row
-        dice_id_key = str(row['dice_id'])
-        rows_by_dice_id.setdefault(dice_id_key, []).append(row)
+    stats_by_dice_id = db.read_die_stats_for_group()
 
     try:
         project_data = DataFactory.create_project_data(
@@ -489,14 +768,12 @@ def view_image_folder(queue: mp.Queue) -> None:
                     name = result.names.get(cls_id, str(cls_id))
                     detections.append({'name': name, 'conf': conf})
 
-            current_image_path = multi_feed.current_image_path().expanduser().resolve()
-            matched_row = image_row_lookup.get(current_image_path)
+            matched_row = db.read_result_for_image(multi_feed.current_image_path())
             if matched_row is not None:
                 dice_id = str(matched_row['dice_id'])
                 dice_sides = matched_row.get('dice_sides')
-                all_rows_for_die = rows_by_dice_id.get(dice_id, [])
                 total_rolls, mean_roll, expected_mean, face_counts = _compute_roll_stats(
-                    all_rows_for_die,
+                    stats_by_dice_id.get(dice_id),
                     dice_sides=dice_sides,
                 )
             else:
@@ -577,14 +854,12 @@ def view_single_video(queue: mp.Queue) -> None:
     video_face_counts: dict[int, int] = {}
     if video_dice_id is not None:
         db = DBManager(logging=False)
-        rows = db.read_results_for_die(video_dice_id)
-        if rows:
+        stats = db.read_die_stats(video_dice_id)
+        if stats is not None:
             if video_dice_sides is None:
-                recorded_sides = {row['dice_sides'] for row in rows if row['dice_sides'] is not None}
-                if len(recorded_sides) == 1:
-                    video_dice_sides = recorded_sides.pop()
+                video_dice_sides = stats.dice_sides
             video_total_rolls, video_mean_roll, video_expected_mean, video_face_counts = _compute_roll_stats(
-                rows,
+                stats,
                 dice_sides=video_dice_sides,
             )
 
@@ -721,28 +996,46 @@ def gather_dice_analysis_data(queue: mp.Queue) -> None:
         queue.put(QueueData(cmd=QuCmd.MAIN_MENU, data=None))
         return
 
+    auto_stop_entry = input('Stop early once the die is confidently fair or biased? [y/N]: ').strip().lower()
+    sequential_test_factory = None
+    if auto_stop_entry in ('y', 'yes'):
+        # Built by the session once it knows how many sides the selected die has.
+        sequential_test_factory = partial(
+            SequentialTest,
+            effect_size=SEQUENTIAL_EFFECT_SIZE,
+            alpha=SEQUENTIAL_ALPHA,
+            beta=SEQUENTIAL_BETA,
+        )
+
     print('\n' + '=' * 50)
     print(
         'main.py gather_dice_analysis_data() Starting data gathering process '
-        f'for {target_samples} samples.'
+        f'for {"up to " if sequential_test_factory is not None else ""}{target_samples} samples.'
     )
     print('=' * 50 + '\n')
-    dice_id = run_dice_analysis_session(
+    dice_id, sequential_decision = run_dice_analysis_session(
         queue,
         ANALYSIS_CONFIG,
         target_samples=target_samples,
         dice_id=requested_dice_id,
         logging=ENABLE_LOGGING,
+        sequential_test_factory=sequential_test_factory,
     )
 
     if dice_id is not None:
         try:
             db = DBManager(logging=ENABLE_LOGGING)
-            rows = db.read_results_for_die(dice_id)
-            if rows:
-                recorded_sides = {row['dice_sides'] for row in rows if row['dice_sides'] is not None}
-                dice_sides = recorded_sides.pop() if len(recorded_sides) == 1 else 6
-                report = analyze_results(dice_id=dice_id, rows=rows, dice_sides=dice_sides)
+            columns = db.read_columns_for_die(dice_id)
+            if columns is not None and len(columns):
+                # Read the ordered columns rather than die_stats so the report can chart drift.
+                report = analyze_roll_columns(
+                    dice_id=dice_id,
+                    faces=columns.faces,
+                    timestamps_us=columns.timestamps_us,
+                    dice_sides=columns.dice_sides or 6,
+                )
+                if sequential_decision is not None:
+                    report = replace(report, sequential_decision=sequential_decision)
                 report_path = write_report(report, ANALYSIS_CONFIG.report_output_dir / dice_id)
                 print('\n' + '=' * 50)
                 for line in build_summary_lines(report):
@@ -883,6 +1176,7 @@ def rerun_analysis_on_capture_folder(queue: mp.Queue) -> None:
             db=db,
             dice=dice,
             model=model,
+            model_hash=_model_file_hash(ANALYSIS_CONFIG.model_path),
         )
     except ValueError as error:
         print(str(error))
@@ -929,33 +1223,58 @@ def view_dice_data(queue: mp.Queue) -> None:
     print('\nDice IDs in database: ' + ', '.join(all_ids))
 
     dice_id = input('Enter the dice ID to view: ').strip()
-    results = db.read_results_for_die(dice_id)
+    columns = db.read_columns_for_die(dice_id)
 
-    if not results:
+    if columns is None or not len(columns):
         print(f"No results found for dice ID '{dice_id}'.")
     else:
-        recorded_sides = {row['dice_sides'] for row in results if row['dice_sides'] is not None}
-        if len(recorded_sides) > 1:
-            print(f"Dice ID '{dice_id}' has inconsistent side counts in the database: {sorted(recorded_sides)}")
+        default_sides = columns.dice_sides or 6
+        sides_entry = input(f'Enter the number of sides for analysis [{default_sides}]: ').strip()
+
+        try:
+            dice_sides = default_sides if not sides_entry else int(sides_entry)
+            report = analyze_roll_columns(
+                dice_id=dice_id,
+                faces=columns.faces,
+                timestamps_us=columns.timestamps_us,
+                dice_sides=dice_sides,
+            )
+        except ValueError as error:
+            print(f'Unable to analyze dice data: {error}')
         else:
-            default_sides = recorded_sides.pop() if recorded_sides else 6
-            sides_entry = input(f'Enter the number of sides for analysis [{default_sides}]: ').strip()
+            report_path = write_report(report, ANALYSIS_CONFIG.report_output_dir / dice_id)
 
-            try:
-                dice_sides = default_sides if not sides_entry else int(sides_entry)
-                report = analyze_results(dice_id=dice_id, rows=results, dice_sides=dice_sides)
-            except ValueError as error:
-                print(f'Unable to analyze dice data: {error}')
-            else:
-                report_path = write_report(report, ANALYSIS_CONFIG.report_output_dir / dice_id)
+            for line in build_summary_lines(report):
+                print(line)
 
-                for line in build_summary_lines(report):
-                    print(line)
+            print(f'Report written to: {report_path}')
+            print('Most recent captured images:')
+            for row in db.read_latest_results_for_die(dice_id, 5):
+                print(f"  {row['timestamp']} -> {Path(row['image']).name}")
 
-                print(f'Report written to: {report_path}')
-                print('Most recent captured images:')
-                for row in results[-5:]:
-                    print(f"  {row['timestamp']} -> {Path(row['image']).name}")
+    input('\nPress Enter to return to the main menu...')
+    queue.put(QueueData(cmd=QuCmd.MAIN_MENU, data=None))
+
+
+def regenerate_all_reports(queue: mp.Queue) -> None:
+    """Re-render every die's HTML report in parallel, skipping dice whose inputs are unchanged."""
+    force_entry = input('Re-render reports even if their data is unchanged? [y/N]: ').strip().lower()
+    started = time.perf_counter()
+    result = regenerate_reports(
+        ANALYSIS_CONFIG.report_output_dir,
+        db_path=DBPath,
+        force=force_entry in ('y', 'yes'),
+    )
+
+    print('\n' + '=' * 50)
+    print(
+        f'Rendered {len(result.rendered)} report(s) and skipped {len(result.skipped)} unchanged '
+        f'in {time.perf_counter() - started:.2f} s.'
+    )
+    for dice_id, error in sorted(result.failed.items()):
+        print(f'  Failed {dice_id}: {error}')
+    print(f'Reports are in: {ANALYSIS_CONFIG.report_output_dir}')
+    print('=' * 50)
 
     input('\nPress Enter to return to the main menu...')
     queue.put(QueueData(cmd=QuCmd.MAIN_MENU, data=None))
@@ -1,6 +1,9 @@
 from pathlib import Path
 
+import numpy as np
+
 import Scripts.main as main_module
+from Scripts.Modules.Database.database import RollColumns
 
 
 class FakeDB:
@@ -8,6 +11,7 @@ class FakeDB:
         self.dice_id = dice_id
         self.rows = list(rows or [])
         self.deleted_ids: list[str] = []
+        self.replaced_ids: list[str] = []
         self.waited = False
 
     def delete_results_for_die(self, dice_id: str, wait: bool = True) -> None:
@@ -25,12 +29,28 @@ class FakeDB:
             }
         )
 
+    def replace_results_for_die(self, dice_id: str, results, dice_sides: int | None = None, wait: bool = False) -> None:
+        self.replaced_ids.append(dice_id)
+        self.rows = [row for row in self.rows if str(row['dice_id']) != str(dice_id)]
+        for dice_result, image_path in results:
+            self.write_test_result(str(dice_result), image_path, dice_sides=dice_sides)
+        self.waited = wait
+
     def wait_for_writes(self) -> None:
         self.waited = True
 
     def read_results_for_die(self, dice_id: str) -> list[dict]:
         return [dict(row) for row in self.rows if str(row['dice_id']) == str(dice_id)]
 
+    def read_columns_for_die(self, dice_id: str) -> RollColumns:
+        rows = self.read_results_for_die(dice_id)
+        return RollColumns(
+            dice_id=dice_id,
+            dice_sides=rows[0]['dice_sides'] if rows else None,
+            faces=np.array([row['dice_result'] for row in rows], dtype=np.uint8),
+            timestamps_us=np.arange(len(rows), dtype=np.int64),
+        )
+
 
 class FakeBoxes:
     def __init__(self, classes) -> None:
@@ -44,13 +64,22 @@ class FakeResult:
 
 
 class FakeModel:
-    def __call__(self, frame, verbose: bool = False):
-        name = Path(frame).name
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def __call__(self, frames, verbose: bool = False):
+        self.batch_sizes.append(len(frames))
+        return [self._result(Path(frame).name) for frame in frames]
+
+    @staticmethod
+    def _result(name: str) -> FakeResult:
         if name == 'valid.jpg':
-            return [FakeResult([7], 4)]
+            return FakeResult([7], 4)
+        if name.startswith('roll-'):
+            return FakeResult([7], int(name.split('-')[2].removesuffix('.jpg')))
         if name == 'invalid.jpg':
-            return [FakeResult([1], None)]
-        return [FakeResult([], None)]
+            return FakeResult([1], None)
+        return FakeResult([], None)
 
 
 class FakeDice:
@@ -84,9 +113,10 @@ def test_rebuild_capture_folder_results_moves_valid_and_unknown_images(tmp_path:
     )
 
     monkeypatch.setattr(main_module.cv2, 'imread', lambda path: path)
-    monkeypatch.setattr(main_module, 'analyze_results', lambda dice_id, rows, dice_sides: {'rows': rows, 'dice_id': dice_id, 'dice_sides': dice_sides})
+    monkeypatch.setattr(main_module, 'analyze_roll_columns', lambda dice_id, faces, timestamps_us, dice_sides: {'faces': faces.tolist(), 'dice_id': dice_id, 'dice_sides': dice_sides})
 
     def fake_write_report(report, output_dir: Path) -> Path:
+        assert report == {'faces': [4], 'dice_id': '77', 'dice_sides': 6}
         report_path = output_dir / 'results.html'
         report_path.write_text('fresh report', encoding='utf-8')
         return report_path
@@ -106,7 +136,7 @@ def test_rebuild_capture_folder_results_moves_valid_and_unknown_images(tmp_path:
     assert total_count == 2
     assert valid_count == 1
     assert unknown_count == 1
-    assert db.deleted_ids == ['77']
+    assert db.replaced_ids == ['77']
     assert db.waited is True
     assert db.read_results_for_die('77') == [
         {
@@ -144,4 +174,83 @@ def test_rebuild_capture_folder_results_writes_empty_report_when_no_images_valid
     assert unknown_count == 1
     assert (capture_dir / 'Unknown' / 'invalid.jpg').exists()
     assert 'has no validated samples' in report_path.read_text(encoding='utf-8')
-    assert db.read_results_for_die('88') == []
\ No newline at end of file
+    assert db.read_results_for_die('88') == []
+
+
+def test_rebuild_capture_folder_results_keeps_source_order_across_batches(tmp_path: Path, monkeypatch) -> None:
+    capture_dir = tmp_path / '99'
+    capture_dir.mkdir()
+    names = [f'roll-{index:03d}-{index % 6 + 1}.jpg' for index in range(40)]
+    for name in names:
+        (capture_dir / name).write_bytes(b'frame')
+    (capture_dir / 'unreadable.jpg').write_bytes(b'')
+    db = FakeDB(dice_id='99')
+    model = FakeModel()
+
+    monkeypatch.setattr(main_module, 'REBUILD_INFERENCE_BATCH', 8)
+    monkeypatch.setattr(main_module, 'REBUILD_QUEUE_SIZE', 4)
+    monkeypatch.setattr(main_module.cv2, 'imread', lambda path: None if path.endswith('unreadable.jpg') else path)
+    monkeypatch.setattr(main_module, 'analyze_roll_columns', lambda dice_id, faces, timestamps_us, dice_sides: faces)
+    monkeypatch.setattr(main_module, 'write_report', lambda report, output_dir: output_dir / 'results.html')
+
+    _, total_count, valid_count, unknown_count = main_module._rebuild_capture_folder_results(
+        dice_id='99',
+        capture_dir=capture_dir,
+        db=db,
+        dice=FakeDice(),
+        model=model,
+    )
+
+    assert (total_count, valid_count, unknown_count) == (41, 40, 1)
+    assert max(model.batch_sizes) == 8
+    assert [Path(row['image']).name for row in db.read_results_for_die('99')] == names
+    assert [row['dice_result'] for row in db.read_results_for_die('99')] == [index % 6 + 1 for index in range(40)]
+    assert (capture_dir / 'Unknown' / 'unreadable.jpg').exists()
+
+
+def test_rebuild_capture_folder_results_resumes_from_checkpointed_predictions(tmp_path: Path, monkeypatch) -> None:
+    capture_dir = tmp_path / '55'
+    capture_dir.mkdir()
+    names = [f'roll-{index:03d}-{index % 6 + 1}.jpg' for index in range(30)]
+    for name in names:
+        (capture_dir / name).write_bytes(b'frame')
+    old_row = {'dice_id': '55', 'timestamp': 'old-ts', 'dice_sides': 6, 'dice_result': 2, 'image': 'old.jpg'}
+    db = FakeDB(dice_id='55', rows=[old_row])
+
+    monkeypatch.setattr(main_module, 'REBUILD_INFERENCE_BATCH', 5)
+    monkeypatch.setattr(main_module, 'REANALYSIS_CHECKPOINT_INTERVAL', 5)
+    monkeypatch.setattr(main_module.cv2, 'imread', lambda path: path)
+    monkeypatch.setattr(main_module, 'analyze_roll_columns', lambda dice_id, faces, timestamps_us, dice_sides: faces)
+    monkeypatch.setattr(main_module, 'write_report', lambda report, output_dir: output_dir / 'results.html')
+
+    class CrashingModel(FakeModel):
+        def __call__(self, frames, verbose: bool = False):
+            if len(self.batch_sizes) == 3:
+                raise RuntimeError('interrupted')
+            return super().__call__(frames, verbose)
+
+    def rebuild(model, model_hash='model-a'):
+        return main_module._rebuild_capture_folder_results(
+            dice_id='55', capture_dir=capture_dir, db=db, dice=FakeDice(), model=model, model_hash=model_hash
+        )
+
+    try:
+        rebuild(CrashingModel())
+    except RuntimeError:
+        pass
+    # The interrupted run left the previous rows alone.
+    assert db.read_results_for_die('55') == [old_row]
+
+    resumed = FakeModel()
+    assert rebuild(resumed)[1:] == (30, 30, 0)
+    assert sum(resumed.batch_sizes) == 15
+    assert [Path(row['image']).name for row in db.read_results_for_die('55')] == names
+
+    (capture_dir / 'roll-100-3.jpg').write_bytes(b'frame')
+    added = FakeModel()
+    assert rebuild(added)[1:] == (31, 31, 0)
+    assert added.batch_sizes == [1]
+
+    retrained = FakeModel()
+    rebuild(retrained, model_hash='model-b')
+    assert sum(retrained.batch_sizes) == 31
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from Scripts.Modules.Analysis.bulk_reports import FINGERPRINT_FILENAME, regenerate_reports
+from Scripts.Modules.Analysis.reporting import analyze_results, write_report
+from Scripts.Modules.Database.database import DBManager
+
+
+def _seed(db_path: Path, dice_id: str, faces: list[int]) -> DBManager:
+    db = DBManager(dice_id=dice_id, db_path=db_path)
+    for index, face in enumerate(faces):
+        db.write_test_result(str(face), db_path.parent / f'{dice_id}-{index}.png', dice_sides=6, wait=True)
+    return db
+
+
+def test_regenerate_reports_matches_single_die_report_and_skips_unchanged(tmp_path: Path) -> None:
+    db_path = tmp_path / 'dice.db'
+    _seed(db_path, '1', [1, 2, 2, 6, 6, 6, 3])
+    second = _seed(db_path, '2', [4, 5, 4])
+    output_dir = tmp_path / 'reports'
+
+    first_run = regenerate_reports(output_dir, db_path=db_path, workers=2)
+
+    assert first_run.rendered == ('1', '2')
+    assert first_run.failed == {}
+    expected = write_report(
+        analyze_results('1', second.read_results_for_die('1'), dice_sides=6),
+        tmp_path / 'expected',
+    ).read_text(encoding='utf-8')
+    assert (output_dir / '1' / 'results.html').read_text(encoding='utf-8') == expected
+    assert (output_dir / '1' / FINGERPRINT_FILENAME).exists()
+
+    second.write_test_result('1', tmp_path / '2-extra.png', dice_sides=6, wait=True)
+    second_run = regenerate_reports(output_dir, db_path=db_path, workers=1)
+
+    assert second_run.rendered == ('2',)
+    assert second_run.skipped == ('1',)
+    assert regenerate_reports(output_dir, db_path=db_path, workers=1, force=True).rendered == ('1', '2')
+    assert not list(output_dir.rglob('*.tmp'))
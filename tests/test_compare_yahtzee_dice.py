@@ -0,0 +1,101 @@
+from math import comb
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis.compare_yahtzee_dice import (
+    YAHTZEE_GROUP,
+    _build_summary,
+    _load_counts,
+    _metrics_from_counts,
+    _rank_dice,
+    _rank_groups,
+    _render_html_dashboard,
+    _render_markdown_report,
+    _search_groups,
+)
+from Scripts.Modules.Analysis.reporting import analyze_roll_columns
+from Scripts.Modules.Database.database import DBManager
+
+
+def _seed(db_path: Path, die_count: int, rolls_per_die: int = 60) -> DBManager:
+    rng = np.random.default_rng(7)
+    for index in range(die_count):
+        # Give each die its own tilt so the group ranking is not a tie.
+        weights = np.ones(6) + rng.random(6) * 0.8
+        faces = rng.choice(np.arange(1, 7), size=rolls_per_die, p=weights / weights.sum())
+        db = DBManager(dice_id=f'six_sided_yahtzee_{index + 1}', db_path=db_path)
+        for face in faces:
+            db.write_test_result(str(face), 'a.jpg', dice_sides=6)
+        db.wait_for_writes()
+    db.stop_writer()
+    return db
+
+
+@pytest.mark.parametrize(('die_count', 'group_size'), [(4, 2), (6, 3), (7, 5)])
+def test_rank_groups_matches_pooled_roll_analysis(tmp_path: Path, die_count: int, group_size: int) -> None:
+    db = _seed(tmp_path / 'dice.db', die_count)
+    count_matrix, stats_by_die = _load_counts(tmp_path / 'dice.db', YAHTZEE_GROUP)
+    ranked_groups, worst_group, _ = _rank_groups(count_matrix, _rank_dice(count_matrix, stats_by_die), group_size, top_k=comb(die_count, group_size))
+    columns_by_die = {dice_id: db.read_columns_for_die(dice_id) for dice_id in count_matrix.dice_ids}
+
+    assert len(ranked_groups) == comb(die_count, group_size)
+    assert worst_group == ranked_groups[-1]
+    for group in ranked_groups:
+        pooled = analyze_roll_columns(
+            '+'.join(group.dice_ids),
+            np.concatenate([columns_by_die[dice_id].faces for dice_id in group.dice_ids]),
+            np.concatenate([columns_by_die[dice_id].timestamps_us for dice_id in group.dice_ids]),
+            dice_sides=6,
+        )
+        assert group.pooled_metrics.counts == tuple(frequency.count for frequency in pooled.frequencies)
+        assert group.pooled_metrics.chi_square == pytest.approx(pooled.chi_square_statistic)
+        assert group.pooled_metrics.p_value == pytest.approx(pooled.p_value, rel=1e-9)
+        assert group.pooled_metrics.mean_roll == pytest.approx(pooled.mean_roll)
+        reference = _metrics_from_counts(group.pooled_metrics.dice_id, group.pooled_metrics.counts)
+        assert group.pooled_metrics.tvd == pytest.approx(reference.tvd)
+        assert group.pooled_metrics.deviations == pytest.approx(reference.deviations)
+        assert group.pooled_metrics.most_overrepresented_face == reference.most_overrepresented_face
+        assert group.pooled_metrics.most_underrepresented_face == reference.most_underrepresented_face
+    chi_squares = [group.pooled_metrics.chi_square for group in ranked_groups]
+    assert chi_squares == sorted(chi_squares)
+
+
+def test_rank_groups_rejects_group_larger_than_dice(tmp_path: Path) -> None:
+    _seed(tmp_path / 'dice.db', 3, rolls_per_die=12)
+    count_matrix, stats_by_die = _load_counts(tmp_path / 'dice.db', YAHTZEE_GROUP)
+
+    with pytest.raises(ValueError):
+        _rank_groups(count_matrix, _rank_dice(count_matrix, stats_by_die), 4)
+
+
+def test_reports_render_for_any_dice_and_group_size(tmp_path: Path) -> None:
+    _seed(tmp_path / 'dice.db', 7)
+    summary = _build_summary(tmp_path / 'dice.db', group_size=3)
+
+    markdown = _render_markdown_report(summary)
+    html = _render_html_dashboard(summary)
+
+    assert summary.ranked_dice[0].repeat_rate is not None
+    assert 'compares the seven `six_sided_yahtzee_*` dice' in markdown
+    assert '## Best Three-Die Groups' in markdown
+    assert 'across 420 total rolls' in html
+    assert 'the naive top-3 pick, all 7 pooled' in html
+
+
+def test_search_groups_matches_full_ranking(tmp_path: Path) -> None:
+    _seed(tmp_path / 'dice.db', 9, rolls_per_die=30)
+    count_matrix, stats_by_die = _load_counts(tmp_path / 'dice.db', YAHTZEE_GROUP)
+    ranked_dice = _rank_dice(count_matrix, stats_by_die)
+    ranked_groups, ranked_worst_group, ranked_individual_group = _rank_groups(count_matrix, ranked_dice, 4, top_k=5)
+
+    best_groups, worst_group, best_individual_group = _search_groups(count_matrix, ranked_dice, 4, top_k=5)
+
+    # Equal chi-square ties may be ordered differently, so compare scores rather than dice.
+    assert [group.pooled_metrics.chi_square for group in best_groups] == pytest.approx(
+        [group.pooled_metrics.chi_square for group in ranked_groups]
+    )
+    assert worst_group.pooled_metrics.chi_square == pytest.approx(ranked_worst_group.pooled_metrics.chi_square)
+    assert best_individual_group == ranked_individual_group
+    assert best_individual_group.dice_ids == tuple(sorted(item.dice_id for item in ranked_dice[:4]))
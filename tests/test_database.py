@@ -0,0 +1,584 @@
+from pathlib import Path
+import sqlite3
+
+import numpy as np
+import pytest
+
+from Scripts.Modules.Database.database import (
+    ConnectionManager,
+    DBManager,
+    timestamp_to_us,
+    us_to_timestamp,
+    writer_service_address,
+    writer_service_key_path,
+)
+
+
+class TracingDBManager(DBManager):
+    """DBManager that records every SQL statement run on its connections."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.statements: list[str] = []
+        super().__init__(*args, **kwargs)
+
+    def open_connection(self):
+        conn, cursor = super().open_connection()
+        conn.set_trace_callback(self.statements.append)
+        return conn, cursor
+
+
+def test_writer_group_commits_queued_rows(tmp_path: Path) -> None:
+    db = TracingDBManager(dice_id='5', db_path=tmp_path / 'dice.db')
+    db.start_writer()
+    futures = [db.write_test_result(str((index % 6) + 1), f'{index}.jpg', dice_sides=6) for index in range(200)]
+
+    futures[-1].result(timeout=5)
+    db.wait_for_writes()
+    db.stop_writer()
+
+    assert all(future.done() and future.exception() is None for future in futures)
+    assert len(db.read_results_for_die('5')) == 200
+    commits = [statement for statement in db.statements if statement.strip().upper() == 'COMMIT']
+    assert len(commits) < 200
+
+
+def test_failed_statement_only_fails_its_own_future(tmp_path: Path) -> None:
+    db = DBManager(dice_id='6', db_path=tmp_path / 'dice.db')
+
+    good_before = db.write_test_result('1', 'a.jpg', dice_sides=6)
+    bad = db.enqueue_write('INSERT INTO missing_table VALUES (?)', (1,))
+    good_after = db.write_test_result('2', 'b.jpg', dice_sides=6)
+
+    good_before.result(timeout=5)
+    good_after.result(timeout=5)
+    with pytest.raises(Exception):
+        bad.result(timeout=5)
+    db.stop_writer()
+
+    assert [row['dice_result'] for row in db.read_results_for_die('6')] == [1, 2]
+
+
+def test_wait_blocks_until_row_is_committed(tmp_path: Path) -> None:
+    db = DBManager(dice_id='7', db_path=tmp_path / 'dice.db')
+
+    db.write_test_result('4', 'c.jpg', dice_sides=6, wait=True)
+
+    assert [row['dice_result'] for row in db.read_results_for_die('7')] == [4]
+    db.stop_writer()
+
+
+def test_schema_is_initialized_once_per_process(tmp_path: Path) -> None:
+    db_path = tmp_path / 'dice.db'
+    first = TracingDBManager(db_path=db_path)
+    second = TracingDBManager(db_path=db_path)
+
+    assert first._connections is second._connections
+    assert second.statements == []
+
+
+def test_reads_reuse_one_connection_per_thread(tmp_path: Path, monkeypatch) -> None:
+    db = DBManager(dice_id='8', db_path=tmp_path / 'dice.db')
+    db.write_test_result('3', 'd.jpg', dice_sides=6, wait=True)
+    db.stop_writer()
+
+    import Scripts.Modules.Database.database as database_module
+    connect_calls = []
+    real_connect = database_module.sqlite3.connect
+
+    def counting_connect(*args, **kwargs):
+        connect_calls.append(args)
+        return real_connect(*args, **kwargs)
+
+    monkeypatch.setattr(database_module.sqlite3, 'connect', counting_connect)
+
+    for _ in range(3):
+        assert db.list_dice_ids() == ['8']
+        assert len(db.read_results_for_die('8')) == 1
+        assert db.execute_read_one('SELECT COUNT(*) FROM rolls') == (1,)
+
+    assert len(connect_calls) <= 1
+
+
+def test_legacy_test_results_are_migrated_to_normalized_schema(tmp_path: Path) -> None:
+    db_path = tmp_path / 'dice.db'
+    capture_root = tmp_path / 'Captures'
+    legacy = sqlite3.connect(db_path)
+    legacy.execute(
+        """
+        CREATE TABLE test_results (
+            dice_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            dice_sides INTEGER,
+            dice_result INTEGER NOT NULL,
+            image TEXT NOT NULL,
+            PRIMARY KEY (dice_id, timestamp)
+        )
+        """
+    )
+    legacy.executemany(
+        'INSERT INTO test_results VALUES (?, ?, ?, ?, ?)',
+        [
+            ('six_sided_yahtzee_1', '2026-04-16T10:00:01.000', 6, 3, str(capture_root / 'six_sided_yahtzee_1' / 'images' / 'b.jpg')),
+            ('six_sided_yahtzee_1', '2026-04-16T10:00:00.000', 6, 5, str(capture_root / 'six_sided_yahtzee_1' / 'images' / 'a.jpg')),
+            ('12', '2026-04-16T11:00:00.000', None, 2, '/elsewhere/c.jpg'),
+        ],
+    )
+    legacy.commit()
+    legacy.close()
+
+    db = DBManager(db_path=db_path, capture_root=capture_root)
+
+    assert db.list_dice_ids() == ['six_sided_yahtzee_1', '12']
+    assert db.list_dice_ids(dice_group='six_sided_yahtzee') == ['six_sided_yahtzee_1']
+    rows = db.read_results_for_group('six_sided_yahtzee')
+    assert [row['timestamp'] for row in rows] == ['2026-04-16T10:00:00.000', '2026-04-16T10:00:01.000']
+    assert [row['dice_result'] for row in rows] == [5, 3]
+    assert rows[0]['image'] == str(capture_root / 'six_sided_yahtzee_1' / 'images' / 'a.jpg')
+    assert db.read_results_for_die('12')[0]['image'] == '/elsewhere/c.jpg'
+    assert db.execute_read_one("SELECT image FROM rolls WHERE dice_result = 5") == ('six_sided_yahtzee_1/images/a.jpg',)
+    assert db.execute_read_one("SELECT name FROM sqlite_master WHERE name = 'test_results'") is None
+
+
+def test_update_and_delete_by_timestamp_round_trip(tmp_path: Path) -> None:
+    db = DBManager(dice_id='9', db_path=tmp_path / 'dice.db')
+    db.write_test_result('1', str(tmp_path / 'x.jpg'), dice_sides=6, wait=True)
+    db.write_test_result('2', str(tmp_path / 'y.jpg'), dice_sides=6, wait=True)
+    first, second = db.read_results_for_die('9')
+
+    db.update_image_path('9', first['timestamp'], str(tmp_path / 'moved.jpg'), wait=True)
+    db.delete_result('9', second['timestamp'], wait=True)
+    db.stop_writer()
+
+    rows = db.read_results_for_die('9')
+    assert len(rows) == 1
+    assert rows[0]['image'] == str(tmp_path / 'moved.jpg')
+
+
+def test_timestamp_conversion_round_trips() -> None:
+    for timestamp in ('2026-04-16T10:47:21.360', '2026-04-16T10:47:21.360123'):
+        assert us_to_timestamp(timestamp_to_us(timestamp)) == timestamp
+
+
+def test_die_stats_follow_appended_and_deleted_rolls(tmp_path: Path) -> None:
+    db = DBManager(dice_id='10', db_path=tmp_path / 'dice.db')
+    faces = [3, 3, 1, 6, 6, 6, 2, 2, 5, 6]
+    futures = [db.write_test_result(str(face), f'{index}.jpg', dice_sides=6) for index, face in enumerate(faces)]
+    futures[-1].result(timeout=5)
+    db.wait_for_writes()
+
+    stats = db.read_die_stats('10')
+    assert stats.roll_count == 10
+    assert stats.roll_sum == sum(faces)
+    assert stats.mean_roll == sum(faces) / 10
+    assert stats.repeat_pairs == 4
+    assert (stats.longest_streak_value, stats.longest_streak_length) == (6, 3)
+    assert stats.current_streak == 1
+    assert stats.face_counts == {1: 1, 2: 2, 3: 2, 5: 1, 6: 4}
+    assert stats.dice_sides == 6
+
+    rows = db.read_results_for_die('10')
+    db.delete_result('10', rows[4]['timestamp'], wait=True)
+    stats = db.read_die_stats('10')
+    assert stats.roll_count == 9
+    assert stats.repeat_pairs == 3
+    assert (stats.longest_streak_value, stats.longest_streak_length) == (3, 2)
+    assert stats.face_counts[6] == 3
+    assert db.execute_read_one('SELECT COUNT(*) FROM die_stats WHERE stale') == (0,)
+
+    db.delete_results_for_die('10', wait=True)
+    db.stop_writer()
+    assert db.read_die_stats('10') is None
+
+
+def test_replace_results_for_die_swaps_rows_atomically(tmp_path: Path, monkeypatch) -> None:
+    db = DBManager(dice_id='12', db_path=tmp_path / 'dice.db')
+    for face in (1, 2, 3):
+        db.write_test_result(str(face), f'old-{face}.jpg', dice_sides=6)
+    db.wait_for_writes()
+
+    db.replace_results_for_die('12', [(6, 'a.jpg'), (5, 'b.jpg')], dice_sides=6, wait=True)
+    assert [(row['dice_result'], Path(row['image']).name) for row in db.read_results_for_die('12')] == [(6, 'a.jpg'), (5, 'b.jpg')]
+    assert db.read_die_stats('12').face_counts == {5: 1, 6: 1}
+
+    # A failing row (a repeated timestamp) rolls back the whole swap.
+    monkeypatch.setattr(db, '_next_timestamp_us', lambda: 1)
+    with pytest.raises(sqlite3.IntegrityError):
+        db.replace_results_for_die('12', [(1, 'c.jpg'), (2, 'd.jpg')], wait=True)
+    db.stop_writer()
+    assert [Path(row['image']).name for row in db.read_results_for_die('12')] == ['a.jpg', 'b.jpg']
+
+
+def test_out_of_order_insert_matches_exact_rebuild(tmp_path: Path) -> None:
+    db = DBManager(dice_id='11', db_path=tmp_path / 'dice.db')
+    for face in (4, 4, 2):
+        db.write_test_result(str(face), 'a.jpg', dice_sides=6, wait=True)
+    first = db.read_results_for_die('11')[0]['timestamp']
+    db.enqueue_write(
+        'INSERT INTO rolls (dice_ref, timestamp_us, dice_result, image) '
+        'VALUES ((SELECT dice_ref FROM dice WHERE name = ?), ?, ?, ?)',
+        ('11', timestamp_to_us(first) - 1, 4, 'b.jpg'),
+    ).result(timeout=5)
+
+    incremental = db.read_die_stats('11')
+    db.rebuild_die_stats('11')
+    db.stop_writer()
+
+    assert incremental == db.read_die_stats('11')
+    assert (incremental.longest_streak_value, incremental.longest_streak_length) == (4, 3)
+    assert incremental.first_timestamp == us_to_timestamp(timestamp_to_us(first) - 1)
+
+
+def test_die_stats_are_backfilled_and_grouped(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / 'dice.db'
+    db = DBManager(dice_id='six_sided_yahtzee_2', db_path=db_path)
+    db.write_test_result('5', 'a.jpg', dice_sides=6, wait=True)
+    db.stop_writer()
+
+    raw = sqlite3.connect(db_path)
+    raw.execute('DELETE FROM die_face_counts')
+    raw.execute('DELETE FROM die_stats')
+    raw.execute('PRAGMA user_version=2')
+    raw.commit()
+    raw.close()
+    monkeypatch.setattr(ConnectionManager, '_instances', {})
+
+    db = DBManager(db_path=db_path)
+    stats = db.read_die_stats_for_group('six_sided_yahtzee')
+    assert list(stats) == ['six_sided_yahtzee_2']
+    assert stats['six_sided_yahtzee_2'].face_counts == {5: 1}
+
+
+def test_streaming_and_columnar_reads_match_row_reads(tmp_path: Path) -> None:
+    db = DBManager(dice_id='six_sided_yahtzee_3', db_path=tmp_path / 'dice.db')
+    faces = [(index * 5) % 6 + 1 for index in range(25)]
+    for face in faces:
+        db.write_test_result(str(face), 'a.jpg', dice_sides=6)
+    db.wait_for_writes()
+    db.stop_writer()
+
+    rows = db.read_results_for_die('six_sided_yahtzee_3')
+    assert list(db.iter_results_for_die('six_sided_yahtzee_3', chunk_size=4)) == rows
+    assert list(db.iter_results_for_group('six_sided_yahtzee', chunk_size=7)) == rows
+    assert db.read_latest_results_for_die('six_sided_yahtzee_3', 3) == rows[-3:]
+
+    columns = db.read_columns_for_die('six_sided_yahtzee_3', chunk_size=4)
+    assert columns.faces.dtype == np.uint8
+    assert columns.timestamps_us.dtype == np.int64
+    assert columns.faces.tolist() == faces
+    assert [us_to_timestamp(value) for value in columns.timestamps_us.tolist()] == [row['timestamp'] for row in rows]
+    assert columns.dice_sides == 6
+    assert list(db.read_columns_for_group('six_sided_yahtzee')) == ['six_sided_yahtzee_3']
+    assert db.read_columns_for_die('missing') is None
+
+
+def test_count_matrix_filters_dice_and_recounts_stale_aggregates(tmp_path: Path) -> None:
+    db_path = tmp_path / 'dice.db'
+    rolls = {
+        'six_sided_yahtzee_1': [1, 1, 6],
+        'six_sided_yahtzee_2': [2, 3, 3, 3],
+        'six_sided_casino_1': [4],
+    }
+    for dice_id, faces in rolls.items():
+        db = DBManager(dice_id=dice_id, db_path=db_path)
+        for face in faces:
+            db.write_test_result(str(face), 'a.jpg', dice_sides=6, wait=True)
+    db.stop_writer()
+
+    raw = sqlite3.connect(db_path)
+    raw.execute("UPDATE die_stats SET stale = 1 WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = 'six_sided_yahtzee_2')")
+    raw.execute("DELETE FROM die_face_counts WHERE dice_ref = (SELECT dice_ref FROM dice WHERE name = 'six_sided_yahtzee_2')")
+    raw.commit()
+    raw.close()
+
+    matrix = db.read_count_matrix(dice_group='six_sided_yahtzee')
+    assert matrix.dice_ids == ('six_sided_yahtzee_1', 'six_sided_yahtzee_2')
+    assert matrix.dice_sides == (6, 6)
+    assert matrix.counts.tolist() == [[2, 0, 0, 0, 0, 1], [0, 1, 3, 0, 0, 0]]
+    assert matrix.sample_counts.tolist() == [3, 4]
+
+    assert db.read_count_matrix(prefix='six_sided_c').dice_ids == ('six_sided_casino_1',)
+    assert len(db.read_count_matrix()) == 3
+    assert db.read_count_matrix(dice_group='missing').counts.shape == (0, 0)
+    with pytest.raises(ValueError):
+        db.read_count_matrix(dice_group='six_sided_yahtzee', faces=4)
+
+
+def test_dice_ids_are_allocated_from_a_sequence(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / 'dice.db'
+    manual = DBManager(dice_id='1', db_path=db_path)
+    manual.write_test_result('2', 'a.jpg', dice_sides=6, wait=True)
+    manual.stop_writer()
+
+    first = DBManager(db_path=db_path)
+    second = DBManager(db_path=db_path)
+    assert first.generate_id() == '2'
+    assert second.generate_id() == '3'
+    assert first.dice_id == '2'
+
+    raw = sqlite3.connect(db_path)
+    raw.execute("INSERT INTO dice (name) VALUES ('41')")
+    raw.execute('DELETE FROM id_sequences')
+    raw.execute('PRAGMA user_version=3')
+    raw.commit()
+    raw.close()
+    monkeypatch.setattr(ConnectionManager, '_instances', {})
+
+    assert DBManager(db_path=db_path).generate_id() == '42'
+
+
+def test_report_inputs_are_read_from_die_stats_and_migrated(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / 'dice.db'
+    db = DBManager(dice_id='70', db_path=db_path)
+    for face in (1, 2, 3):
+        db.write_test_result(str(face), 'a.jpg', dice_sides=6)
+    db.dice_id = '71'
+    db.write_test_result('4', 'b.jpg', wait=True)
+    db.delete_result('70', db.read_results_for_die('70')[-1]['timestamp'], wait=True)
+    db.stop_writer()
+
+    def counted():
+        raw = sqlite3.connect(db_path)
+        rows = raw.execute(
+            'SELECT dice.name, COUNT(*), MAX(roll_id), dice.sides FROM dice JOIN rolls USING (dice_ref) GROUP BY dice_ref'
+        ).fetchall()
+        raw.close()
+        return {name: (count, max_roll_id, sides) for name, count, max_roll_id, sides in rows}
+
+    assert db.read_report_inputs() == counted() == {'70': (2, 2, 6), '71': (1, 4, None)}
+
+    raw = sqlite3.connect(db_path)
+    raw.execute('DROP TRIGGER die_stats_after_insert')
+    raw.execute('ALTER TABLE die_stats DROP COLUMN max_roll_id')
+    raw.execute('PRAGMA user_version=6')
+    raw.commit()
+    raw.close()
+    monkeypatch.setattr(ConnectionManager, '_instances', {})
+
+    migrated = DBManager(dice_id='71', db_path=db_path)
+    assert migrated.read_report_inputs() == counted()
+    migrated.write_test_result('5', 'c.jpg', wait=True)
+    migrated.stop_writer()
+    assert migrated.read_report_inputs() == counted()
+    assert migrated.read_report_inputs()['71'][:2] == (2, 5)
+
+
+def test_parallel_allocations_never_repeat(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    db = DBManager(db_path=tmp_path / 'dice.db')
+    db.execute_read_one('SELECT 1')
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        allocated = list(pool.map(lambda _: db.allocate_dice_id(), range(40)))
+
+    assert sorted(allocated, key=int) == [str(value) for value in range(1, 41)]
+
+
+def test_change_feed_reports_new_and_deleted_rolls_since_watermark(tmp_path: Path) -> None:
+    db = DBManager(dice_id='20', db_path=tmp_path / 'dice.db')
+    other = DBManager(dice_id='21', db_path=tmp_path / 'dice.db')
+    for face in (1, 2, 3):
+        db.write_test_result(str(face), 'a.jpg', dice_sides=6, wait=True)
+    other.write_test_result('6', 'b.jpg', dice_sides=6, wait=True)
+
+    initial = db.read_changes()
+    assert [row['dice_result'] for row in initial.rows] == [1, 2, 3, 6]
+    assert initial.deleted == []
+    per_die = db.read_changes(dice_id='20')
+    assert [row['dice_result'] for row in per_die.rows] == [1, 2, 3]
+
+    paged = db.read_changes(limit=2)
+    assert [row['dice_result'] for row in paged.rows] == [1, 2]
+    assert [row['dice_result'] for row in db.read_changes(since=paged.watermark).rows] == [3, 6]
+
+    db.delete_result('20', initial.rows[0]['timestamp'], wait=True)
+    db.write_test_result('4', 'c.jpg', dice_sides=6, wait=True)
+    db.write_test_result('5', 'd.jpg', dice_sides=6, wait=True)
+    latest = db.read_results_for_die('20')[-1]
+    db.delete_result('20', latest['timestamp'], wait=True)
+    db.stop_writer()
+    other.stop_writer()
+
+    changes = db.read_changes(since=per_die.watermark, dice_id='20')
+    assert [row['dice_result'] for row in changes.rows] == [4]
+    assert [row['dice_result'] for row in changes.deleted] == [1]
+    assert changes.deleted[0]['timestamp'] == initial.rows[0]['timestamp']
+
+    idle = db.read_changes(since=changes.watermark, dice_id='20')
+    assert (idle.rows, idle.deleted, idle.watermark) == ([], [], changes.watermark)
+
+    db.prune_tombstones(changes.watermark, wait=True)
+    db.stop_writer()
+    assert db.execute_read_one('SELECT COUNT(*) FROM roll_tombstones') == (0,)
+
+
+def test_writer_caps_tombstone_retention_and_flags_lagging_consumers(tmp_path: Path, monkeypatch) -> None:
+    from Scripts.Modules.Database import database
+
+    monkeypatch.setattr(database, 'TOMBSTONE_RETENTION_ROWS', 2)
+    db = DBManager(dice_id='22', db_path=tmp_path / 'dice.db')
+    for face in (1, 2, 3, 4, 5):
+        db.write_test_result(str(face), 'a.jpg', dice_sides=6, wait=True)
+    behind = db.read_changes()
+
+    db.replace_results_for_die('22', [(6, 'b.jpg')], wait=True)
+    db.stop_writer()
+
+    assert db.execute_read_one('SELECT COUNT(*) FROM roll_tombstones') == (2,)
+    lagging = db.read_changes(since=behind.watermark)
+    assert lagging.missed_deletes
+    assert [row['dice_result'] for row in lagging.rows] == [6]
+    assert not db.read_changes(since=lagging.watermark).missed_deletes
+    assert not db.read_changes().missed_deletes
+
+
+def test_writes_are_forwarded_to_the_writer_service(tmp_path: Path) -> None:
+    from multiprocessing.connection import AuthenticationError, Client
+    import threading
+
+    from Scripts.Modules.Database.writer_service import WriterService, stop_writer_service
+
+    db_path = tmp_path / 'dice.db'
+    service = WriterService(db_path)
+    service.db = TracingDBManager(db_path=db_path, use_writer_service=False)
+    server = threading.Thread(target=service.serve_forever, daemon=True)
+    server.start()
+    assert service.ready.wait(5)
+    key_path = writer_service_key_path(db_path)
+    assert key_path.stat().st_mode & 0o777 == 0o600
+    address, family = writer_service_address(db_path)
+    with pytest.raises(AuthenticationError):
+        Client(address, family=family, authkey=b'dice-tester-writer')
+
+    clients = [TracingDBManager(dice_id=str(30 + index), db_path=db_path) for index in range(3)]
+    futures = [client.write_test_result(str(face), 'a.jpg', dice_sides=6) for face in (1, 2, 3) for client in clients]
+    bad = clients[0].enqueue_write('INSERT INTO missing_table VALUES (?)', (1,))
+    for future in futures:
+        future.result(timeout=5)
+    with pytest.raises(sqlite3.OperationalError):
+        bad.result(timeout=5)
+    assert [clients[1].allocate_dice_id() for _ in range(2)] == ['1', '2']
+    _seed_export_source(tmp_path / 'source' / 'dice.db').export_results(tmp_path / 'rolls.npz')
+    assert clients[2].import_results(tmp_path / 'rolls.npz') == 4
+    for client in clients:
+        client.stop_writer()
+
+    assert [len(client.read_results_for_die(client.dice_id)) for client in clients] == [3, 3, 3]
+    assert all(client.statements == [] for client in clients)
+    assert any('INSERT INTO rolls' in statement for statement in service.db.statements)
+
+    assert stop_writer_service(db_path)
+    server.join(timeout=5)
+    assert not server.is_alive()
+    assert not key_path.exists()
+
+    fallback = DBManager(dice_id='40', db_path=db_path)
+    fallback.write_test_result('5', 'b.jpg', dice_sides=6, wait=True)
+    fallback.stop_writer()
+    assert len(fallback.read_results_for_die('40')) == 1
+
+
+def test_writer_thread_reconnects_to_a_service_started_later(tmp_path: Path, monkeypatch) -> None:
+    from Scripts.Modules.Database import database
+    from Scripts.Modules.Database.writer_service import start_writer_service, stop_writer_service
+
+    monkeypatch.setattr(database, 'WRITER_SERVICE_RETRY_INITIAL', 0.0)
+    db_path = tmp_path / 'dice.db'
+    db = TracingDBManager(dice_id='60', db_path=db_path)
+    db.write_test_result('1', 'a.jpg', dice_sides=6, wait=True)
+    assert any('INSERT INTO rolls' in statement for statement in db.statements)
+
+    process = start_writer_service(db_path)
+    try:
+        db.statements.clear()
+        db.write_test_result('2', 'b.jpg', dice_sides=6, wait=True)
+        db.stop_writer()
+        assert db.statements == []
+        assert [row['dice_result'] for row in db.read_results_for_die('60')] == [1, 2]
+    finally:
+        stop_writer_service(db_path)
+        process.join(timeout=10)
+
+
+def test_writer_service_runs_in_its_own_process(tmp_path: Path) -> None:
+    from Scripts.Modules.Database.writer_service import start_writer_service, stop_writer_service
+
+    db_path = tmp_path / 'dice.db'
+    process = start_writer_service(db_path)
+    try:
+        assert start_writer_service(db_path) is None
+        db = TracingDBManager(dice_id='50', db_path=db_path)
+        db.write_test_result('2', 'a.jpg', dice_sides=6, wait=True)
+        db.stop_writer()
+        assert db.statements == []
+        assert [row['dice_result'] for row in db.read_results_for_die('50')] == [2]
+    finally:
+        stop_writer_service(db_path)
+        process.join(timeout=10)
+    assert process.exitcode == 0
+
+
+def _seed_export_source(db_path: Path) -> DBManager:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    source = DBManager(dice_id='six_sided_yahtzee_4', db_path=db_path, capture_root=db_path.parent / 'Captures')
+    for face in (6, 6, 1):
+        source.write_test_result(str(face), str(db_path.parent / 'Captures' / 'six_sided_yahtzee_4' / f'{face}.jpg'), dice_sides=6)
+    source.wait_for_writes()
+    source.dice_id = '60'
+    source.write_test_result('3', '/elsewhere/line\nbreak é.jpg', wait=True)
+    source.stop_writer()
+    return source
+
+
+@pytest.mark.parametrize('suffix', ['.npz', '.parquet'])
+def test_export_and_import_round_trip(tmp_path: Path, suffix: str, monkeypatch) -> None:
+    if suffix == '.parquet':
+        pytest.importorskip('pyarrow')
+    import Scripts.Modules.Database.database as database_module
+
+    # Split the four rolls across chunks so the streamed insert crosses a boundary.
+    monkeypatch.setattr(database_module, 'IMPORT_CHUNK_ROWS', 3)
+    source = _seed_export_source(tmp_path / 'source' / 'dice.db')
+    (tmp_path / 'target').mkdir()
+    target = TracingDBManager(db_path=tmp_path / 'target' / 'dice.db', capture_root=tmp_path / 'target' / 'Captures')
+    export_path = tmp_path / f'rolls{suffix}'
+
+    assert source.export_results(export_path) == 4
+    assert target.import_results(export_path) == 4
+    assert target.import_results(export_path) == 0
+    target.stop_writer()
+    assert any('INSERT OR IGNORE INTO rolls' in statement for statement in target.statements)
+
+    def portable(rows, capture_root):
+        return [{**row, 'image': row['image'].replace(str(capture_root), '<captures>')} for row in rows]
+
+    assert portable(target.read_all_results(), tmp_path / 'target' / 'Captures') == portable(
+        source.read_all_results(), tmp_path / 'source' / 'Captures'
+    )
+    assert target.list_dice_ids(dice_group='six_sided_yahtzee') == ['six_sided_yahtzee_4']
+    stats = target.read_die_stats('six_sided_yahtzee_4')
+    assert (stats.roll_count, stats.repeat_pairs, stats.face_counts) == (3, 1, {1: 1, 6: 2})
+
+
+def test_result_for_image_uses_the_image_index(tmp_path: Path) -> None:
+    source = _seed_export_source(tmp_path / 'dice.db')
+    captured = tmp_path / 'Captures' / 'six_sided_yahtzee_4' / '1.jpg'
+
+    row = source.read_result_for_image(captured)
+    assert (row['dice_id'], row['dice_result'], row['image']) == ('six_sided_yahtzee_4', 1, str(captured))
+    assert source.read_result_for_image(tmp_path / 'missing.jpg') is None
+    plan = source._read_cursor().execute(
+        'EXPLAIN QUERY PLAN SELECT roll_id FROM rolls WHERE image IN (?, ?)', ('a', 'b')
+    ).fetchall()
+    assert any('idx_rolls_image' in step[-1] for step in plan)
+
+
+def test_export_can_be_limited_to_one_die(tmp_path: Path) -> None:
+    source = _seed_export_source(tmp_path / 'dice.db')
+    export_path = tmp_path / 'one.npz'
+
+    assert source.export_results(export_path, dice_ids=['60']) == 1
+    with np.load(export_path) as archive:
+        assert int(archive['format_version']) == 2
+        assert archive['dice_names'].tolist() == ['60']
+        assert archive['faces'].dtype == np.uint8
+        assert archive['image_offsets'].tolist() == [0, archive['images'].size]
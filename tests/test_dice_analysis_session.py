@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 import numpy as np
 
+from Scripts.Modules.Analysis.sequential import SequentialTest
 from Scripts.Modules.Dice.dice import DiceState
 from Scripts.Modules.queue_data import Command as QuCmd
 from Scripts.Modules.Workflow.dice_analysis_session import DiceAnalysisSession, persist_unknown_roll
@@ -118,7 +119,7 @@ class RecordingExecutor:
         return ImmediateFuture()
 
 
-def create_session(dice: SequencedDice, **config_overrides) -> DiceAnalysisSession:
+def create_session(dice: SequencedDice, sequential_test: SequentialTest | None = None, **config_overrides) -> DiceAnalysisSession:
     config = {
         'max_time_before_flip': 4,
         'analysis_image_output_dir': 'unused',
@@ -139,6 +140,7 @@ def create_session(dice: SequencedDice, **config_overrides) -> DiceAnalysisSessi
         config=SimpleNamespace(**config),
         target_samples=10,
         logging=False,
+        sequential_test=sequential_test,
     )
 
 
@@ -278,4 +280,23 @@ def test_unreadable_settled_frames_timeout_to_unknown_capture() -> None:
     assert len(image_executor.submissions) == 1
     assert image_executor.submissions[0][0] is persist_unknown_roll
     assert session.submitted_samples == 0
-    assert session.awaiting_next_roll is True
\ No newline at end of file
+    assert session.awaiting_next_roll is True
+
+
+def test_sequential_test_stops_session_once_verdict_is_reached() -> None:
+    sequential_test = SequentialTest(dice_sides=6, effect_size=0.5)
+    session = create_session(
+        SequencedDice([DiceState.SETTLED, DiceState.UNKNOWN] * 10, value=6),
+        sequential_test=sequential_test,
+    )
+    image_executor = RecordingExecutor()
+
+    for _ in range(20):
+        session.handle_evaluate_dice_state(image_executor)
+
+    decision = sequential_test.decision()
+    assert decision.verdict == 'biased'
+    assert decision.samples_used == session.persisted_samples < session.target_samples
+    assert len(image_executor.submissions) == session.submitted_samples == decision.samples_used
+    assert session.roll_stats.sample_count == decision.samples_used
+    assert any(item.cmd == QuCmd.EXIT for item in session.process_queue.items)
@@ -0,0 +1,67 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis import (
+    face_count_distributions,
+    probability_at_least,
+    success_count_distribution,
+    sum_distribution,
+)
+from Scripts.Modules.Analysis.dice_pool import METHOD_DIRECT, METHOD_FFT
+
+MIXED_POOL = (
+    (0.20, 0.30, 0.25, 0.25),
+    (0.10, 0.20, 0.15, 0.15, 0.20, 0.20),
+    (0.05, 0.05, 0.30, 0.30, 0.15, 0.15),
+    (0.10, 0.10, 0.10, 0.10, 0.15, 0.15, 0.15, 0.15),
+)
+
+
+def _enumerate(dice):
+    sums = np.zeros(sum(len(die) for die in dice) + 1)
+    face_counts = np.zeros((max(len(die) for die in dice), len(dice) + 1))
+    for faces in product(*(range(1, len(die) + 1) for die in dice)):
+        probability = np.prod([die[face - 1] for die, face in zip(dice, faces)])
+        sums[sum(faces)] += probability
+        for face in range(1, len(face_counts) + 1):
+            face_counts[face - 1, faces.count(face)] += probability
+    return sums, face_counts
+
+
+@pytest.mark.parametrize('method', [METHOD_DIRECT, METHOD_FFT])
+def test_distributions_match_outcome_enumeration(method) -> None:
+    sums, face_counts = _enumerate(MIXED_POOL)
+
+    assert sum_distribution(MIXED_POOL, method=method) == pytest.approx(sums, abs=1e-12)
+    assert face_count_distributions(MIXED_POOL, method=method) == pytest.approx(face_counts, abs=1e-12)
+
+
+def test_fft_and_direct_agree_for_a_large_pool() -> None:
+    rng = np.random.default_rng(3)
+    dice = rng.dirichlet(np.full(20, 30.0), size=20)
+
+    direct = sum_distribution(dice, method=METHOD_DIRECT)
+
+    assert sum_distribution(dice, method=METHOD_FFT) == pytest.approx(direct, abs=1e-14)
+    assert direct.sum() == pytest.approx(1.0)
+    assert direct[:20].sum() == 0.0
+
+
+def test_probability_at_least_counts_faces_at_or_above() -> None:
+    fair = ((1 / 6,) * 6,) * 5
+
+    assert probability_at_least(fair, 5, 6) == pytest.approx(6 ** -5)
+    assert probability_at_least(fair, 1, 5) == pytest.approx(1 - (4 / 6) ** 5)
+    assert probability_at_least(fair, 0, 6) == 1.0
+    assert probability_at_least(fair, 6, 1) == 0.0
+    assert probability_at_least(MIXED_POOL, 2, 7) == 0.0
+    assert success_count_distribution(MIXED_POOL, [7, 8])[1] == pytest.approx(0.30)
+
+
+def test_invalid_dice_are_rejected() -> None:
+    with pytest.raises(ValueError, match='sum to 1'):
+        sum_distribution([(0.5, 0.4)])
+    with pytest.raises(ValueError, match='method'):
+        sum_distribution([(0.5, 0.5)], method='enumerate')
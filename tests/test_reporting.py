@@ -1,12 +1,36 @@
+from dataclasses import replace
 from pathlib import Path
 
-from Scripts.Modules.Analysis.reporting import analyze_results, build_summary_lines, chi_square_p_value, write_report
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis.reporting import (
+    RECENT_ROLL_COUNT,
+    ReportAccumulator,
+    analyze_results,
+    analyze_roll_columns,
+    build_summary_lines,
+    chi_square_p_value,
+    chi_square_p_values,
+    write_report,
+)
+from Scripts.Modules.Analysis.sequential import SequentialTest
+from Scripts.Modules.Database.database import DBManager, timestamp_to_us
 
 
 def test_chi_square_p_value_is_one_for_zero_statistic() -> None:
     assert chi_square_p_value(0.0, 5) == 1.0
 
 
+@pytest.mark.parametrize('degrees_of_freedom', [1, 2, 5, 9])
+def test_chi_square_p_values_matches_scalar_p_value(degrees_of_freedom: int) -> None:
+    statistics = np.array([0.0, 0.4, 3.1, 11.07, 42.0])
+
+    expected = [chi_square_p_value(statistic, degrees_of_freedom) for statistic in statistics]
+
+    assert chi_square_p_values(statistics, degrees_of_freedom) == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
 def test_analyze_results_builds_expected_distribution() -> None:
     rows = [
         {'timestamp': '2026-04-16T10:00:00.000', 'dice_result': 1, 'dice_sides': 6, 'image': 'a.png'},
@@ -69,7 +93,7 @@ def test_build_summary_lines_includes_sample_adequacy_and_interpretation() -> No
     assert any('chi-square approximation may be unreliable' in line for line in summary)
 
 
-def test_large_sample_hides_recent_roll_chips_in_html(tmp_path: Path) -> None:
+def test_large_sample_still_shows_recent_roll_chips_in_html(tmp_path: Path) -> None:
     rows = [
         {
             'timestamp': f'2026-04-16T10:00:{index // 1000:02d}.{index % 1000:03d}',
@@ -83,6 +107,148 @@ def test_large_sample_hides_recent_roll_chips_in_html(tmp_path: Path) -> None:
     report_path = write_report(report, tmp_path)
     html = report_path.read_text(encoding='utf-8')
 
-    assert 'Recent rolls (scaled view)' in html
-    assert 'Recent rolls are hidden for large sample sizes.' in html
-    assert '<span class="roll-chip">' not in html
\ No newline at end of file
+    assert 'scaled view' not in html
+    assert html.count('<span class="roll-chip">') == RECENT_ROLL_COUNT
+
+def test_analyze_roll_columns_matches_analyze_results() -> None:
+    rows = [
+        {'timestamp': '2026-04-16T10:00:02.000', 'dice_result': 2, 'dice_sides': 6, 'image': 'c.png'},
+        {'timestamp': '2026-04-16T10:00:00.000', 'dice_result': 1, 'dice_sides': 6, 'image': 'a.png'},
+        {'timestamp': '2026-04-16T10:00:01.000', 'dice_result': 2, 'dice_sides': 6, 'image': 'b.png'},
+        {'timestamp': '2026-04-16T10:00:03.000', 'dice_result': 6, 'dice_sides': 6, 'image': 'd.png'},
+    ]
+
+    expected = analyze_results(dice_id='12', rows=rows, dice_sides=6)
+    report = analyze_roll_columns(
+        dice_id='12',
+        faces=np.array([row['dice_result'] for row in rows], dtype=np.uint8),
+        timestamps_us=np.array([timestamp_to_us(row['timestamp']) for row in rows], dtype=np.int64),
+        dice_sides=6,
+    )
+
+    assert report == expected
+
+def test_report_keeps_roll_summary_instead_of_full_sequence(tmp_path: Path) -> None:
+    rows = [
+        {'timestamp': f'2026-04-16T10:00:{index:02d}.000', 'dice_result': face, 'dice_sides': 6, 'image': f'{index}.png'}
+        for index, face in enumerate([3, 3, 1, 4, 4, 4, 2, 5, 6, 1, 1, 2, 3, 6])
+    ]
+
+    report = analyze_results(dice_id='12', rows=rows, dice_sides=6)
+    kept = analyze_results(dice_id='12', rows=rows, dice_sides=6, keep_rolls=True)
+
+    assert report.repeat_pair_count == 4
+    assert report.recent_rolls == (1, 4, 4, 4, 2, 5, 6, 1, 1, 2, 3, 6)
+    assert report.ordered_rolls is None
+    assert kept == report
+    assert kept.ordered_rolls.tolist() == [row['dice_result'] for row in rows]
+    assert not kept.ordered_rolls.flags.writeable
+
+    html = write_report(report, tmp_path).read_text(encoding='utf-8')
+    assert html.count('<span class="roll-chip">') == 12
+
+
+def test_report_accumulator_snapshot_matches_analyze_results() -> None:
+    faces = [3, 3, 1, 4, 4, 4, 2, 5, 6, 1, 1, 2, 3, 6, 6, 5]
+    rows = [
+        {'timestamp': f'2026-04-16T10:00:{index:02d}.000', 'dice_result': face, 'dice_sides': 6, 'image': f'{index}.png'}
+        for index, face in enumerate(faces)
+    ]
+
+    accumulator = ReportAccumulator(dice_id='12', dice_sides=6)
+    for row in rows:
+        accumulator.add(row['dice_result'], timestamp_to_us(row['timestamp']))
+
+    expected = analyze_results(dice_id='12', rows=rows, dice_sides=6)
+    snapshot = accumulator.snapshot()
+    assert snapshot == replace(expected, chi_square_statistic=snapshot.chi_square_statistic, p_value=snapshot.p_value)
+    assert snapshot.chi_square_statistic == pytest.approx(expected.chi_square_statistic)
+    assert snapshot.p_value == pytest.approx(expected.p_value)
+    assert accumulator.chi_square_statistic == pytest.approx(expected.chi_square_statistic)
+    assert accumulator.variance == pytest.approx(float(np.var(faces, ddof=1)))
+    assert accumulator.repeat_pair_rate == pytest.approx(expected.repeat_pair_count / (len(faces) - 1))
+    assert (accumulator.current_streak_value, accumulator.current_streak_length) == (5, 1)
+
+    with pytest.raises(ValueError):
+        accumulator.add(7)
+
+
+def test_report_accumulator_resumes_from_stored_die_stats(tmp_path: Path) -> None:
+    db = DBManager(dice_id='12', db_path=tmp_path / 'dice.db')
+    faces = [2, 2, 5, 1, 3, 6, 6, 6]
+    for index, face in enumerate(faces):
+        db.write_test_result(str(face), tmp_path / f'{index}.png', dice_sides=6, wait=True)
+
+    stats = db.read_die_stats('12')
+    recent = [row['dice_result'] for row in db.read_latest_results_for_die('12', RECENT_ROLL_COUNT)]
+    accumulator = ReportAccumulator.from_die_stats(stats, recent_rolls=recent)
+    accumulator.add(6, timestamp_to_us(stats.last_timestamp) + 1_000)
+
+    rows = db.read_results_for_die('12')
+    rows.append({'timestamp': accumulator.snapshot().last_timestamp, 'dice_result': 6})
+    expected = analyze_results(dice_id='12', rows=rows, dice_sides=6)
+    snapshot = accumulator.snapshot()
+
+    assert (snapshot.longest_streak_value, snapshot.longest_streak_length) == (6, 4)
+    assert snapshot.recent_rolls == expected.recent_rolls
+    assert snapshot.frequencies == expected.frequencies
+    assert snapshot.mean_roll == expected.mean_roll
+    assert accumulator.variance == pytest.approx(float(np.var(faces + [6], ddof=1)))
+
+
+def test_report_records_sequential_decision_rule(tmp_path: Path) -> None:
+    rows = [
+        {'timestamp': f'2026-04-16T10:00:{index:02d}.000', 'dice_result': 6, 'dice_sides': 6, 'image': f'{index}.png'}
+        for index in range(12)
+    ]
+    sequential_test = SequentialTest(dice_sides=6, effect_size=0.5)
+    decision = sequential_test.update_many(row['dice_result'] for row in rows)
+    report = replace(analyze_results(dice_id='12', rows=rows, dice_sides=6), sequential_decision=decision)
+
+    summary = build_summary_lines(report)
+    html = write_report(report, tmp_path).read_text(encoding='utf-8')
+
+    assert f'Sequential verdict: biased after {decision.samples_used} rolls' in '\n'.join(summary)
+    assert any(line == f'Decision rule: {decision.rule}' for line in summary)
+    assert 'Dirichlet-multinomial SPRT' in html
+
+
+def test_drift_series_is_bounded_and_tracks_window_chi_square(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    fair = rng.integers(1, 7, size=30_000)
+    loaded = rng.choice(np.arange(1, 7), size=30_000, p=[0.3, 0.14, 0.14, 0.14, 0.14, 0.14])
+    faces = np.concatenate([fair, loaded])
+
+    report = analyze_roll_columns('12', faces, np.arange(faces.size, dtype=np.int64), dice_sides=6)
+    drift = report.drift
+
+    assert drift is not None
+    assert drift.window_rolls == 300
+    assert len(drift.roll_index) == len(drift.chi_square) == len(drift.face_shares) == 200
+    assert drift.roll_index[0] == 300 and drift.roll_index[-1] == faces.size
+    assert list(drift.roll_index) == sorted(drift.roll_index)
+    window = faces[faces.size - 300:]
+    counts = np.bincount(window, minlength=7)[1:]
+    assert drift.chi_square[-1] == pytest.approx(float(((counts - 50) ** 2 / 50).sum()))
+    assert drift.face_shares[-1][0] == pytest.approx(float(np.mean(faces == 1)))
+    assert max(drift.chi_square[100:]) > max(drift.chi_square[:80])
+
+    html = write_report(report, tmp_path).read_text(encoding='utf-8')
+    assert html.count('<polyline') == 7
+
+
+def test_short_samples_have_no_drift_series() -> None:
+    report = analyze_roll_columns('12', np.ones(599, dtype=np.int64), np.arange(599, dtype=np.int64), dice_sides=6)
+
+    assert report.drift is None
+
+
+def test_drift_window_matches_the_rolls_it_spans_for_uneven_sides() -> None:
+    faces = np.random.default_rng(5).integers(1, 8, size=2_000)
+
+    drift = analyze_roll_columns('13', faces, np.arange(faces.size, dtype=np.int64), dice_sides=7).drift
+
+    assert drift.window_rolls == 348
+    end = drift.roll_index[-1]
+    counts = np.bincount(faces[end - 348:end], minlength=8)[1:]
+    assert drift.chi_square[-1] == pytest.approx(float(((counts - 348 / 7) ** 2 / (348 / 7)).sum()))
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import numpy as np
+
+from Scripts.Modules.Analysis import yahtzee_scorecard_odds_dashboard as dashboard
+from Scripts.Modules.Analysis.result_cache import ResultCache, read_die_fingerprints, result_key
+from Scripts.Modules.Database.database import DBManager
+
+
+def _seed(db_path: Path, die_count: int, rolls_per_die: int = 30) -> None:
+    rng = np.random.default_rng(11)
+    for index in range(die_count):
+        db = DBManager(dice_id=f'six_sided_yahtzee_{index + 1}', db_path=db_path)
+        for face in rng.integers(1, 7, size=rolls_per_die):
+            db.write_test_result(str(face), 'a.jpg', dice_sides=6)
+        db.wait_for_writes()
+        db.stop_writer()
+
+
+def test_cache_round_trips_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    with ResultCache(tmp_path / 'cache.db', max_entries=2) as cache:
+        cache.put_many({'a': {'value': 1}, 'b': (2, 3)})
+        assert cache.get_many(['a', 'missing']) == {'a': {'value': 1}}
+
+        cache.put_many({'c': 4.5})
+
+        assert cache.get_many(['a', 'b', 'c']) == {'a': {'value': 1}, 'c': 4.5}
+        assert len(cache) == 2
+
+    with ResultCache(tmp_path / 'cache.db') as reopened:
+        assert reopened.get_many(['c']) == {'c': 4.5}
+
+
+def test_result_key_tracks_fingerprints_version_and_parameters() -> None:
+    fingerprints = {'1': 'rolls=3', '2': 'rolls=4'}
+    key = result_key('odds', 1, fingerprints, ('1', '2'), 'exact')
+
+    assert key == result_key('odds', 1, dict(fingerprints), ('1', '2'), 'exact')
+    assert key != result_key('odds', 2, fingerprints, ('1', '2'), 'exact')
+    assert key != result_key('odds', 1, fingerprints, ('1', '2'), 'iid')
+    assert key != result_key('odds', 1, {**fingerprints, '2': 'rolls=5'}, ('1', '2'), 'exact')
+
+
+def test_dashboard_recomputes_only_groups_with_a_changed_die(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / 'dice.db'
+    _seed(db_path, 6)
+    evaluated = []
+    evaluate_group = dashboard._evaluate_group
+
+    def counting_evaluate_group(dice_ids, *args):
+        evaluated.append(dice_ids)
+        return evaluate_group(dice_ids, *args)
+
+    monkeypatch.setattr(dashboard, '_evaluate_group', counting_evaluate_group)
+
+    def analyze(cache: ResultCache):
+        probabilities = dashboard._load_face_probabilities(db_path)
+        fingerprints = read_die_fingerprints(db_path, probabilities)
+        return dashboard._analyze_groups(
+            probabilities, workers=1, turn_model=dashboard.TURN_MODEL_IID, cache=cache, fingerprints=fingerprints
+        )
+
+    with ResultCache(tmp_path / 'cache.db') as cache:
+        first = analyze(cache)
+        assert len(evaluated) == 6
+
+        evaluated.clear()
+        assert analyze(cache)[2] == first[2]
+        assert evaluated == []
+
+        db = DBManager(dice_id='six_sided_yahtzee_3', db_path=db_path)
+        db.write_test_result('6', 'a.jpg', dice_sides=6, wait=True)
+        db.stop_writer()
+        analyze(cache)
+
+    # Five of the six groups of five contain die 3.
+    assert sorted(evaluated) == sorted(odds.dice_ids for odds in first[2] if 'six_sided_yahtzee_3' in odds.dice_ids)
+    assert len(evaluated) == 5
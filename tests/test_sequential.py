@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis.sequential import SequentialTest
+
+
+def test_fair_rolls_reach_a_fair_verdict() -> None:
+    rng = np.random.default_rng(7)
+    sequential_test = SequentialTest(dice_sides=6, effect_size=0.2)
+
+    decision = sequential_test.update_many(rng.integers(1, 7, size=20_000))
+
+    assert decision.verdict == 'fair'
+    assert decision.log_likelihood_ratio <= decision.lower_bound
+    assert decision.samples_used < 20_000
+
+
+def test_biased_rolls_reach_a_biased_verdict_and_later_rolls_are_ignored() -> None:
+    rng = np.random.default_rng(7)
+    probabilities = np.array([0.25, 0.15, 0.15, 0.15, 0.15, 0.15])
+    sequential_test = SequentialTest(dice_sides=6, effect_size=0.2)
+
+    decision = sequential_test.update_many(rng.choice(np.arange(1, 7), size=20_000, p=probabilities))
+
+    assert decision.verdict == 'biased'
+    assert decision.log_likelihood_ratio >= decision.upper_bound
+    assert sequential_test.update(1) == decision
+    assert 'alpha=0.05' in decision.rule
+
+
+def test_likelihood_ratio_matches_dirichlet_multinomial_closed_form() -> None:
+    faces = [1, 1, 2, 6, 6, 6, 3]
+    sequential_test = SequentialTest(dice_sides=6, effect_size=1.0, alpha=1e-6, beta=1e-6)
+    for face in faces:
+        sequential_test.update(face)
+
+    concentration = (5 / 1.0 - 1) / 6
+    counts = [faces.count(face) for face in range(1, 7)]
+    log_marginal = (
+        math.lgamma(6 * concentration)
+        - math.lgamma(6 * concentration + len(faces))
+        + sum(math.lgamma(concentration + count) - math.lgamma(concentration) for count in counts)
+    )
+    assert sequential_test.log_likelihood_ratio == pytest.approx(log_marginal + len(faces) * math.log(6))
+
+
+def test_rejects_invalid_settings_and_faces() -> None:
+    with pytest.raises(ValueError):
+        SequentialTest(dice_sides=6, alpha=0.6, beta=0.5)
+    with pytest.raises(ValueError):
+        SequentialTest(dice_sides=6, effect_size=3.0)
+    with pytest.raises(ValueError):
+        SequentialTest(dice_sides=6).update(7)
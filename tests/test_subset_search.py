@@ -0,0 +1,64 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis import subset_search
+from Scripts.Modules.Analysis.subset_search import (
+    OBJECTIVE_CHI_SQUARE,
+    OBJECTIVE_TVD,
+    search_subsets,
+    subset_scores,
+)
+
+
+def _random_counts(rng: np.random.Generator, dice_count: int) -> np.ndarray:
+    weights = np.ones((dice_count, 6)) + rng.random((dice_count, 6)) * 0.5
+    return np.array([rng.multinomial(int(rng.integers(40, 200)), row / row.sum()) for row in weights])
+
+
+def _enumerated_top(counts: np.ndarray, group_size: int, top_k: int, objective: str, largest: bool) -> list[tuple[int, ...]]:
+    combos = np.array(list(combinations(range(len(counts)), group_size)))
+    scores = subset_scores(counts, combos, objective)
+    order = np.lexsort((*combos.T[::-1], -scores if largest else scores))
+    return [tuple(int(index) for index in combos[position]) for position in order[:top_k]]
+
+
+@pytest.mark.parametrize('leaf_block_size', [1, subset_search.LEAF_BLOCK_SIZE])
+@pytest.mark.parametrize('objective', [OBJECTIVE_CHI_SQUARE, OBJECTIVE_TVD])
+@pytest.mark.parametrize('largest', [False, True])
+def test_search_subsets_matches_full_enumeration(monkeypatch, leaf_block_size: int, objective: str, largest: bool) -> None:
+    # leaf_block_size=1 forces the branch-and-bound recursion all the way down.
+    monkeypatch.setattr(subset_search, 'LEAF_BLOCK_SIZE', leaf_block_size)
+    rng = np.random.default_rng(11)
+    for _ in range(12):
+        dice_count = int(rng.integers(5, 11))
+        group_size = int(rng.integers(1, min(dice_count, 5) + 1))
+        top_k = int(rng.integers(1, 6))
+        counts = _random_counts(rng, dice_count)
+
+        found = search_subsets(counts, group_size, top_k=top_k, objective=objective, largest=largest)
+
+        assert [item.indices for item in found] == _enumerated_top(counts, group_size, top_k, objective, largest)
+        expected_scores = subset_scores(counts, np.array([item.indices for item in found]), objective)
+        assert [item.score for item in found] == pytest.approx(expected_scores.tolist())
+
+
+def test_search_subsets_breaks_ties_by_indices() -> None:
+    counts = np.array([[10, 10, 10, 10, 10, 10]] * 4 + [[20, 0, 10, 10, 10, 10]])
+
+    found = search_subsets(counts, 2, top_k=3)
+
+    assert [item.indices for item in found] == [(0, 1), (0, 2), (0, 3)]
+    assert [item.score for item in found] == [0.0, 0.0, 0.0]
+
+
+def test_search_subsets_rejects_invalid_arguments() -> None:
+    counts = np.ones((3, 6))
+
+    with pytest.raises(ValueError):
+        search_subsets(counts, 4)
+    with pytest.raises(ValueError):
+        search_subsets(counts, 2, objective='entropy')
+    with pytest.raises(ValueError):
+        search_subsets(np.zeros((3, 6)), 2)
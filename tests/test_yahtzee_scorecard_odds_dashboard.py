@@ -0,0 +1,115 @@
+from itertools import product
+
+import pytest
+
+from Scripts.Modules.Analysis.yahtzee_scorecard_odds_dashboard import (
+    FACES,
+    REPORTED_GROUP_COUNT,
+    TURN_MODEL_IID,
+    _analyze_groups,
+    _metrics_from_counts,
+    _one_roll_metrics_exact,
+    _turn_metrics_3roll_optimal_exact,
+    _turn_metrics_3roll_optimal_iid,
+)
+
+BIASED_GROUP = (
+    (0.10, 0.20, 0.15, 0.15, 0.20, 0.20),
+    (1 / 6,) * 6,
+    (0.25, 0.15, 0.15, 0.15, 0.15, 0.15),
+    (0.05, 0.05, 0.30, 0.30, 0.15, 0.15),
+    (0.20, 0.20, 0.20, 0.20, 0.10, 0.10),
+)
+
+
+def test_one_roll_metrics_match_outcome_enumeration() -> None:
+    expected = dict.fromkeys(_metrics_from_counts((5, 0, 0, 0, 0, 0)), 0.0)
+    for faces in product(FACES, repeat=5):
+        probability = 1.0
+        counts = [0] * 6
+        for die, face in enumerate(faces):
+            probability *= BIASED_GROUP[die][face - 1]
+            counts[face - 1] += 1
+        for key, value in _metrics_from_counts(tuple(counts)).items():
+            expected[key] += probability * value
+
+    assert _one_roll_metrics_exact(BIASED_GROUP) == pytest.approx(expected, abs=1e-15)
+
+
+def test_one_roll_metrics_for_fair_dice() -> None:
+    metrics = _one_roll_metrics_exact(((1 / 6,) * 6,) * 5)
+
+    assert metrics['yahtzee_any'] == pytest.approx(6 / 6 ** 5)
+    assert metrics['large_straight'] == pytest.approx(240 / 6 ** 5)
+    assert metrics['full_house'] == pytest.approx(300 / 6 ** 5)
+
+
+def test_turn_metrics_for_fair_dice_match_known_yahtzee_odds() -> None:
+    metrics = _turn_metrics_3roll_optimal_iid(((1 / 6,) * 6,) * 5)
+
+    # Chasing a Yahtzee over three rolls succeeds about 4.6% of the time.
+    assert metrics['yahtzee_any'] == pytest.approx(0.04603, abs=1e-5)
+    assert metrics['exact_5_face_6'] < metrics['at_least_4_face_6'] < metrics['at_least_3_face_6']
+
+
+def test_analyze_groups_ranks_pooled_and_in_process_results_identically() -> None:
+    probabilities_by_die = {
+        f'six_sided_yahtzee_{index}': tuple(
+            value / sum(row) for value in row
+        )
+        for index, row in enumerate(
+            [(1, 1, 1, 1, 1, 1 + index * 0.05) for index in range(9)],
+            start=1,
+        )
+    }
+
+    in_process = _analyze_groups(probabilities_by_die, workers=1, turn_model=TURN_MODEL_IID)
+    pooled = _analyze_groups(probabilities_by_die, workers=2, turn_model=TURN_MODEL_IID)
+
+    assert len(in_process[2]) == 126
+    assert in_process[0].dice_ids == tuple(f'six_sided_yahtzee_{index}' for index in range(1, 6))
+    assert [group.dice_ids for group in pooled[2]] == [group.dice_ids for group in in_process[2]]
+    assert pooled[2][-1].turn_distance == pytest.approx(in_process[2][-1].turn_distance)
+
+
+def test_exact_model_resolves_only_the_reported_groups() -> None:
+    probabilities_by_die = {
+        f'six_sided_yahtzee_{index}': tuple(value / sum(row) for value in row)
+        for index, row in enumerate(
+            [(1, 1 + index * 0.03, 1, 1, 1, 1 + index * 0.05) for index in range(9)],
+            start=1,
+        )
+    }
+
+    iid = _analyze_groups(probabilities_by_die, workers=1, turn_model=TURN_MODEL_IID)[2]
+    best, worst, ranked, _, _ = _analyze_groups(probabilities_by_die, workers=1)
+
+    head, tail = ranked[:REPORTED_GROUP_COUNT], ranked[-REPORTED_GROUP_COUNT:]
+    assert {group.dice_ids for group in head} == {group.dice_ids for group in iid[:REPORTED_GROUP_COUNT]}
+    assert {group.dice_ids for group in tail} == {group.dice_ids for group in iid[-REPORTED_GROUP_COUNT:]}
+    assert ranked[REPORTED_GROUP_COUNT:-REPORTED_GROUP_COUNT] == iid[REPORTED_GROUP_COUNT:-REPORTED_GROUP_COUNT]
+    for group in head + tail:
+        group_probs = tuple(probabilities_by_die[dice_id] for dice_id in group.dice_ids)
+        assert group.turn_3roll == pytest.approx(_turn_metrics_3roll_optimal_exact(group_probs))
+    assert [group.turn_distance for group in head] == sorted(group.turn_distance for group in head)
+    assert (best, worst) == (head[0], tail[-1])
+
+
+def test_exact_turn_metrics_match_iid_model_for_identical_dice() -> None:
+    die = (0.10, 0.12, 0.18, 0.20, 0.15, 0.25)
+
+    exact = _turn_metrics_3roll_optimal_exact((die,) * 5)
+
+    assert exact == pytest.approx(_turn_metrics_3roll_optimal_iid((die,) * 5), abs=1e-12)
+
+
+def test_exact_turn_metrics_track_which_die_is_rerolled() -> None:
+    always_six = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    fair = (1 / 6,) * 6
+
+    metrics = _turn_metrics_3roll_optimal_exact((always_six,) * 4 + (fair,))
+
+    # Only the fair die is ever rerolled, with three chances to show a six.
+    assert metrics['yahtzee_any'] == pytest.approx(1 - (5 / 6) ** 3)
+    assert metrics['at_least_4_face_6'] == pytest.approx(1.0)
+    assert metrics['yahtzee_any'] < _turn_metrics_3roll_optimal_iid((always_six,) * 4 + (fair,))['yahtzee_any']
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from Scripts.Modules.Analysis.yahtzee_simulator import (
+    CATEGORIES,
+    GREEDY_STRATEGY,
+    PAR_STRATEGY,
+    score_table,
+    simulate_groups,
+)
+
+FAIR = (1 / 6,) * 6
+ALWAYS_SIX = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+
+
+def _fair_dice(count: int = 5) -> dict[str, tuple[float, ...]]:
+    return {f'six_sided_yahtzee_{index}': FAIR for index in range(1, count + 1)}
+
+
+@pytest.mark.parametrize(
+    ('counts', 'expected'),
+    [
+        ((0, 0, 3, 0, 2, 0), {'threes': 9, 'fives': 10, 'three_of_a_kind': 19, 'full_house': 25, 'chance': 19}),
+        ((0, 1, 1, 1, 1, 1), {'twos': 2, 'threes': 3, 'fours': 4, 'fives': 5, 'sixes': 6, 'small_straight': 30, 'large_straight': 40, 'chance': 20}),
+        ((1, 0, 0, 4, 0, 0), {'ones': 1, 'fours': 16, 'three_of_a_kind': 17, 'four_of_a_kind': 17, 'chance': 17}),
+        ((0, 0, 0, 0, 0, 5), {'sixes': 30, 'three_of_a_kind': 30, 'four_of_a_kind': 30, 'yahtzee': 50, 'chance': 30}),
+    ],
+)
+def test_score_table_scores_every_box(counts, expected) -> None:
+    scores = score_table(np.array([counts]))[0]
+
+    assert dict(zip(CATEGORIES, scores.tolist())) == {category: expected.get(category, 0) for category in CATEGORIES}
+
+
+def test_always_six_dice_score_every_yahtzee_bonus() -> None:
+    dice = {f'six_sided_yahtzee_{index}': ALWAYS_SIX for index in range(1, 6)}
+
+    [result] = simulate_groups(dice, [tuple(dice)], games=50, workers=1)
+
+    # Yahtzee 50, then sixes, both of-a-kinds and chance at 30 each, with twelve 100-point bonuses.
+    assert result.mean_score == 1370.0
+    assert result.score_std == 0.0
+    assert result.upper_bonus_rate == 0.0
+    assert result.yahtzee_rate == 1.0
+
+
+def test_fair_dice_scores_are_plausible_and_par_beats_greedy() -> None:
+    dice = _fair_dice()
+
+    [par] = simulate_groups(dice, [tuple(dice)], games=4000, strategy=PAR_STRATEGY, workers=1)
+    [greedy] = simulate_groups(dice, [tuple(dice)], games=4000, strategy=GREEDY_STRATEGY, workers=1)
+
+    assert 190.0 < par.mean_score < 240.0
+    assert par.mean_score > greedy.mean_score + 10 * par.standard_error
+    assert 0.0 < par.upper_bonus_rate < 1.0
+
+
+def test_simulation_is_reproducible_across_batch_layout_and_workers() -> None:
+    dice = _fair_dice(6)
+    groups = [tuple(sorted(dice))[:5], tuple(sorted(dice))[1:]]
+
+    in_process = simulate_groups(dice, groups, games=3000, seed=7, batch_size=1000, workers=1)
+    pooled = simulate_groups(dice, groups, games=3000, seed=7, batch_size=1000, workers=2)
+    reseeded = simulate_groups(dice, groups, games=3000, seed=8, batch_size=1000, workers=1)
+
+    assert pooled == in_process
+    assert [result.mean_score for result in reseeded] != [result.mean_score for result in in_process]
+
+
+def test_simulate_groups_rejects_groups_of_the_wrong_size() -> None:
+    dice = _fair_dice(4)
+
+    with pytest.raises(ValueError, match='5 dice'):
+        simulate_groups(dice, [tuple(dice)], games=10, workers=1)